@@ -0,0 +1,483 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# widget_benchmark.py
+# 2026-10-18 v1.0
+
+"""Construction time, update latency, updates per second and bytes
+allocated per update for each cedargrove_widgets widget across sizes and
+unit counts. Results are printed as one JSON object per line.
+
+On a CircuitPython board with an integral display, copy this file to
+CIRCUITPY alongside the cedargrove_widgets folder (including bargraph.py and
+neopixel.py), the fonts folder and the lib folder, then run it from the REPL
+with `import widget_benchmark`. Allocations are measured as the drop in
+gc.mem_free() with the garbage collector disabled.
+
+Under CPython, the headless displayio stand-in is used and allocations are
+measured with tracemalloc as the peak traced memory growth per update:
+
+    python benchmarks/widget_benchmark.py [--refresh] [--output results.jsonl]
+    python benchmarks/widget_benchmark.py --compare old.jsonl new.jsonl
+    python benchmarks/widget_benchmark.py --geometry-cache /tmp/geometry
+    python benchmarks/widget_benchmark.py --trig
+
+--refresh includes a full headless display refresh in every update.
+--geometry-cache measures cold (empty cache) and warm construction times
+with the geometry cache in the specified directory.
+--trig compares the shared trig_table dial_to_pixel lookup with exact
+math.sin and math.cos; on a board, call run_trig() from the REPL after
+importing this file."""
+
+import gc
+import sys
+import time
+from array import array
+
+if sys.implementation.name == "cpython":
+    # Use the headless displayio stand-in and the in-development widgets
+    import os
+    import tracemalloc
+
+    _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path[:0] = [
+        os.path.join(_root, "headless"),
+        _root,
+        os.path.join(_root, "in_development"),
+    ]
+    os.environ.setdefault("HEADLESS_ROOT", os.path.join(_root, "7.x_scale_bundle"))
+
+import board
+
+UPDATES = 100  # Updates measured per case
+
+
+def _sweep(n, low=0.0, high=1.0):
+    """Return n values stepping from low to high and back."""
+    half = max(1, n // 2)
+    up = [low + (high - low) * i / half for i in range(half)]
+    return up + list(reversed(up))
+
+
+def _scale_cases():
+    from cedargrove_widgets.scale import Scale
+
+    for size in (0.3, 0.5, 0.8):
+        for hands in (1, 2):
+            for static in (False, True):
+                params = {"size": size, "num_hands": hands, "static_layers": static}
+
+                def build(size=size, hands=hands, static=static):
+                    return Scale(
+                        num_hands=hands,
+                        size=size,
+                        display_size=_display_size(),
+                        static_layers=static,
+                    )
+
+                def update(widget, value, hands=hands):
+                    widget.hand1 = value
+                    if hands == 2:
+                        widget.hand2 = 1 - value
+
+                yield "Scale", params, build, update, _sweep(UPDATES)
+
+
+def _magic_eye_cases():
+    from cedargrove_widgets.magic_eye import MagicEye
+
+    for size in (0.2, 0.5, 0.8):
+        for step in (None, 0.01):
+            params = {"size": size, "signal_step": step}
+
+            def build(size=size, step=step):
+                return MagicEye(
+                    size=size, display_size=_display_size(), signal_step=step
+                )
+
+            def update(widget, value):
+                widget.value = value
+
+            yield "MagicEye", params, build, update, _sweep(UPDATES, 0, 2.0)
+
+
+def _bubble_display_cases():
+    from cedargrove_widgets.bubble_display import BubbleDisplay
+
+    for units in (1, 3):
+        for digits in (4, 5):
+            for backend in ("Shapes", "Palette"):
+                params = {"units": units, "digits": digits, "backend": backend}
+
+                def build(units=units, digits=digits, backend=backend):
+                    return BubbleDisplay(
+                        units=units,
+                        digits=digits,
+                        size=1 / units,
+                        display_size=_display_size(),
+                        backend=backend,
+                    )
+
+                def update(widget, value):
+                    widget.value = value
+
+                yield "BubbleDisplay", params, build, update, list(range(UPDATES))
+
+    # Float values in each numeric notation
+    values = [(i - (UPDATES // 2)) * 123.456 for i in range(UPDATES)]
+    for notation in ("Fixed", "Scientific", "Engineering"):
+        params = {"units": 2, "digits": 4, "backend": "Palette", "notation": notation}
+
+        def build(notation=notation):
+            return BubbleDisplay(
+                units=2,
+                digits=4,
+                size=0.5,
+                display_size=_display_size(),
+                backend="Palette",
+                notation=notation,
+            )
+
+        def update(widget, value):
+            widget.value = value
+
+        yield "BubbleDisplay", params, build, update, values
+
+
+def _bargraph_cases():
+    from cedargrove_widgets.bargraph import Bargraph
+
+    for units in (1, 2, 4):
+        for mode in ("BAR", "DOT"):
+
+            def build(units=units, mode=mode):
+                return Bargraph(
+                    units=units, center=(0, 0), mode=mode, display_size=_display_size()
+                )
+
+            def update(widget, value):
+                widget.value = value
+
+            params = {"units": units, "mode": mode}
+            yield "Bargraph", params, build, update, _sweep(UPDATES)
+
+    # 256-sample unsigned 16-bit batches through the level ballistics
+    batches = []
+    for amplitude in _sweep(UPDATES, 0, 32767):
+        batches.append(
+            array("H", [32768 + int(amplitude) * (i % 2 * 2 - 1) for i in range(256)])
+        )
+    for units in (1, 2, 4):
+
+        def build(units=units):
+            return Bargraph(
+                units=units,
+                center=(0, 0),
+                attack=0.01,
+                release=0.3,
+                peak_hold=1.0,
+                display_size=_display_size(),
+            )
+
+        def update(widget, value):
+            widget.process(value, sample_rate=16000, full_scale=32768, offset=32768)
+
+        params = {"units": units, "batch": 256}
+        yield "Bargraph", params, build, update, batches
+
+
+def _neopixel_cases():
+    from cedargrove_widgets.neopixel import NeoPixel
+
+    for units in (8, 16, 40):
+        values = [(i % units, (i * 0x0F1F3F) & 0xFFFFFF) for i in range(UPDATES)]
+
+        def build(units=units):
+            return NeoPixel(units=units, center=(0, 0), display_size=_display_size())
+
+        def update(widget, value):
+            widget.show(value[0], value[1])
+
+        yield "NeoPixel", {"units": units}, build, update, values
+
+    # Whole GRB frames written as one slice assignment and show()
+    for units in (8, 16, 40):
+        frames = [
+            bytes((i * 7 + frame) & 0xFF for i in range(3 * units))
+            for frame in range(UPDATES)
+        ]
+
+        def build(units=units):
+            return NeoPixel(
+                units=units,
+                center=(0, 0),
+                auto_write=False,
+                display_size=_display_size(),
+            )
+
+        def update(widget, value):
+            widget[:] = value
+            widget.show()
+
+        params = {"units": units, "buffer": True}
+        yield "NeoPixel", params, build, update, frames
+
+    # Whole frames blitted to serpentine matrix panels
+    for columns, rows in ((8, 8), (16, 16), (32, 8)):
+        units = columns * rows
+        frames = [
+            bytes((i * 7 + frame) & 0xFF for i in range(3 * units))
+            for frame in range(UPDATES)
+        ]
+
+        def build(units=units, columns=columns):
+            return NeoPixel(
+                units=units,
+                center=(0, 0),
+                columns=columns,
+                serpentine=True,
+                display_size=_display_size(),
+            )
+
+        def update(widget, value):
+            widget.blit(value)
+
+        params = {"columns": columns, "rows": rows, "serpentine": True}
+        yield "NeoPixel", params, build, update, frames
+
+
+CASES = (
+    _scale_cases,
+    _magic_eye_cases,
+    _bubble_display_cases,
+    _bargraph_cases,
+    _neopixel_cases,
+)
+
+
+def _display_size():
+    return (board.DISPLAY.width, board.DISPLAY.height)
+
+
+def _allocated(update, widget, values, refresh):
+    """Return the average bytes allocated per update."""
+    if sys.implementation.name == "cpython":
+        total = 0
+        tracemalloc.start()
+        for value in values:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            update(widget, value)
+            if refresh:
+                board.DISPLAY.refresh()
+            total += tracemalloc.get_traced_memory()[1] - base
+        tracemalloc.stop()
+        return total / len(values)
+
+    gc.collect()
+    gc.disable()
+    free = gc.mem_free()
+    for value in values:
+        update(widget, value)
+        if refresh:
+            board.DISPLAY.refresh()
+    used = free - gc.mem_free()
+    gc.enable()
+    return used / len(values)
+
+
+def run_case(name, params, build, update, values, refresh=False):
+    """Benchmark one widget configuration and return its result record."""
+    gc.collect()
+    t0 = time.monotonic_ns()
+    widget = build()
+    construct_ns = time.monotonic_ns() - t0
+    board.DISPLAY.show(widget)
+
+    # Warm up caches, then time the updates
+    update(widget, values[-1])
+    gc.collect()
+    t0 = time.monotonic_ns()
+    for value in values:
+        update(widget, value)
+        if refresh:
+            board.DISPLAY.refresh()
+    update_ns = (time.monotonic_ns() - t0) / len(values)
+
+    alloc = _allocated(update, widget, values, refresh)
+    board.DISPLAY.show(None)
+    return {
+        "widget": name,
+        "params": params,
+        "construct_ms": round(construct_ns / 1e6, 3),
+        "update_us": round(update_ns / 1e3, 2),
+        "updates_per_sec": round(1e9 / update_ns, 1) if update_ns else None,
+        "alloc_bytes_per_update": round(alloc, 1),
+        "alloc_method": "tracemalloc_peak"
+        if sys.implementation.name == "cpython"
+        else "gc_mem_free",
+        "refresh": refresh,
+        "platform": sys.platform,
+        "implementation": sys.implementation.name,
+        "display_size": list(_display_size()),
+    }
+
+
+def run(refresh=False, output=None):
+    """Run every benchmark case, printing and returning the result records."""
+    import json
+
+    results = []
+    for cases in CASES:
+        for name, params, build, update, values in cases():
+            result = run_case(name, params, build, update, values, refresh)
+            line = json.dumps(result)
+            print(line)
+            if output is not None:
+                output.write(line + "\n")
+            results.append(result)
+    return results
+
+
+def run_geometry_cache(directory, output=None):
+    """Measure each widget's construction time with an empty geometry cache
+    (cold) and again with the geometry saved by the first construction
+    (warm), printing and returning the result records."""
+    import json
+    from cedargrove_widgets import geometry_cache
+
+    geometry_cache.configure(directory)
+    results = []
+    for cases in CASES:
+        for name, params, build, _, _ in cases():
+            geometry_cache.clear()
+            gc.collect()
+            t0 = time.monotonic_ns()
+            build()
+            cold_ns = time.monotonic_ns() - t0
+            gc.collect()
+            t0 = time.monotonic_ns()
+            build()
+            warm_ns = time.monotonic_ns() - t0
+            result = {
+                "widget": name,
+                "params": params,
+                "cold_construct_ms": round(cold_ns / 1e6, 3),
+                "warm_construct_ms": round(warm_ns / 1e6, 3),
+                "platform": sys.platform,
+                "implementation": sys.implementation.name,
+                "display_size": list(_display_size()),
+            }
+            line = json.dumps(result)
+            print(line)
+            if output is not None:
+                output.write(line + "\n")
+            results.append(result)
+    geometry_cache.clear()
+    geometry_cache.configure(None)
+    return results
+
+
+def run_trig(calls=2000, output=None):
+    """Measure the time per dial_to_pixel call of the shared trig_table with
+    the sine table and with exact trigonometry, and the largest pixel
+    difference between them, printing and returning the result record."""
+    import json
+    from cedargrove_widgets import trig_table
+
+    factors = [(i * 0.618034) % 2 - 1 for i in range(calls)]
+    center = (_display_size()[0] // 2, _display_size()[1] // 2)
+    radius = min(center)
+    timings = {}
+    points = {}
+    for exact in (False, True):
+        trig_table.configure(trig_table.resolution(), exact)
+        trig_table.dial_to_pixel(0, center, radius)  # Build the table
+        dial_to_pixel = trig_table.dial_to_pixel
+        timings[exact] = None
+        for _ in range(3):  # Keep the fastest of three passes
+            gc.collect()
+            t0 = time.monotonic_ns()
+            for factor in factors:
+                dial_to_pixel(factor, center, radius)
+            elapsed = (time.monotonic_ns() - t0) / calls
+            if timings[exact] is None or elapsed < timings[exact]:
+                timings[exact] = elapsed
+        points[exact] = [dial_to_pixel(factor, center, radius) for factor in factors]
+    trig_table.configure(trig_table.resolution(), False)
+    deviation = 0
+    for (x0, y0), (x1, y1) in zip(points[False], points[True]):
+        deviation = max(deviation, abs(x0 - x1), abs(y0 - y1))
+    result = {
+        "benchmark": "trig_table.dial_to_pixel",
+        "resolution": trig_table.resolution(),
+        "table_ns_per_call": round(timings[False], 1),
+        "exact_ns_per_call": round(timings[True], 1),
+        "speedup": round(timings[True] / timings[False], 2),
+        "max_deviation_px": deviation,
+        "radius_px": radius,
+        "platform": sys.platform,
+        "implementation": sys.implementation.name,
+    }
+    line = json.dumps(result)
+    print(line)
+    if output is not None:
+        output.write(line + "\n")
+    return result
+
+
+def _key(result):
+    return (result["widget"], tuple(sorted(result["params"].items())))
+
+
+def compare(old_path, new_path):
+    """Print the update time and allocation ratios of two result files."""
+    import json
+
+    def load(path):
+        with open(path) as results:
+            return {_key(r): r for r in (json.loads(line) for line in results if line.strip())}
+
+    old, new = load(old_path), load(new_path)
+    for key in sorted(new, key=str):
+        if key not in old:
+            continue
+        o, n = old[key], new[key]
+        print(
+            "%-14s %-60s update %8.1f -> %8.1f us (x%.2f)  alloc %8.1f -> %8.1f B"
+            % (
+                key[0],
+                dict(key[1]),
+                o["update_us"],
+                n["update_us"],
+                n["update_us"] / o["update_us"] if o["update_us"] else 0,
+                o["alloc_bytes_per_update"],
+                n["alloc_bytes_per_update"],
+            )
+        )
+
+
+if __name__ == "__main__" and sys.implementation.name == "cpython":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--refresh", action="store_true")
+    parser.add_argument("--output")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--geometry-cache", metavar="DIR")
+    parser.add_argument("--trig", action="store_true")
+    args = parser.parse_args()
+    if args.compare:
+        compare(*args.compare)
+    elif args.trig:
+        run_trig()
+    elif args.geometry_cache:
+        os.makedirs(args.geometry_cache, exist_ok=True)
+        run_geometry_cache(args.geometry_cache)
+    elif args.output:
+        with open(args.output, "w") as out:
+            run(args.refresh, out)
+    else:
+        run(args.refresh)
+elif sys.implementation.name != "cpython":
+    run()
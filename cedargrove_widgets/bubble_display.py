@@ -2,13 +2,24 @@
 # SPDX-License-Identifier: MIT# LED bubble display widget
 
 # based on the HP QDSP-6064 4-Digit Micro 7 Segment Numeric Indicator
-# 2021-12-12 v1.0
+# 2026-10-18 v1.4
 
 import displayio
 import vectorio
+from array import array
+from math import floor, log
 from adafruit_display_shapes.line import Line
 from adafruit_display_shapes.rect import Rect
 from adafruit_display_shapes.roundrect import RoundRect
+from cedargrove_widgets import (
+    coordinates,
+    dirty_rect,
+    geometry_cache,
+    trig_table,
+    value_filter,
+)
+
+__version__ = "1.4"
 
 # 8-bit to 7 segment
 #  bits: dp g f e d c b a
@@ -35,6 +46,109 @@ NUMBERS = {
     "x": 0b00001000,  # _ (replace x with underscore for hexadecimal text)
 }
 
+# Extended character set; upper and lower case letters share a form unless
+# both have a distinct seven-segment shape
+LETTERS = {
+    "A": 0b01110111,  # A
+    "B": 0b01111100,  # b
+    "C": 0b00111001,  # C
+    "D": 0b01011110,  # d
+    "E": 0b01111001,  # E
+    "F": 0b01110001,  # F
+    "G": 0b00111101,  # G
+    "g": 0b01101111,  # g
+    "H": 0b01110110,  # H
+    "h": 0b01110100,  # h
+    "I": 0b00000110,  # I
+    "i": 0b00000100,  # i
+    "J": 0b00011110,  # J
+    "j": 0b00011110,  # J
+    "L": 0b00111000,  # L
+    "l": 0b00111000,  # L
+    "N": 0b01010100,  # n
+    "n": 0b01010100,  # n
+    "O": 0b00111111,  # O
+    "o": 0b01011100,  # o
+    "P": 0b01110011,  # P
+    "p": 0b01110011,  # P
+    "Q": 0b01100111,  # q
+    "q": 0b01100111,  # q
+    "R": 0b01010000,  # r
+    "r": 0b01010000,  # r
+    "S": 0b01101101,  # S
+    "s": 0b01101101,  # S
+    "T": 0b01111000,  # t
+    "t": 0b01111000,  # t
+    "U": 0b00111110,  # U
+    "u": 0b00011100,  # u
+    "Y": 0b01101110,  # y
+    "y": 0b01101110,  # y
+    "X": 0b00001000,  # _ (as x)
+    "_": 0b00001000,  # _
+    "=": 0b01001000,  # =
+    "'": 0b00000010,  # '
+    '"': 0b00100010,  # "
+    "?": 0b01010011,  # ?
+}
+
+
+def _segment_table():
+    """Return the 128-entry ASCII to segment mask table."""
+    table = bytearray(128)
+    for characters in (NUMBERS, LETTERS):
+        for char, mask in characters.items():
+            table[ord(char)] = mask
+    return bytes(table)
+
+
+# ASCII character code to segment mask; unsupported characters are blank
+SEGMENTS = _segment_table()
+
+# Numeric formatter segment masks
+_DIGITS = SEGMENTS[ord("0") : ord("9") + 1]
+_MINUS = SEGMENTS[ord("-")]
+_DP = 0b10000000
+_INF = float("inf")
+
+
+def _count_digits(magnitude, limit):
+    """Return the number of integer digits of a non-negative int or float,
+    counting no further than limit + 1."""
+    count = 1
+    power = 10
+    while count <= limit and magnitude >= power:
+        count += 1
+        power *= 10
+    return count
+
+
+def _shift(magnitude, exponent):
+    """Return magnitude / 10 ** exponent without the divisor of a very small
+    or very large float underflowing to zero or overflowing."""
+    if exponent < -300:
+        return (magnitude * 1e300) / (10.0 ** (exponent + 300))
+    if exponent > 300:
+        return (magnitude / 1e300) / (10.0 ** (exponent - 300))
+    return magnitude / (10.0 ** exponent)
+
+
+def encode(text, masks=None, start=0):
+    """Return a bytearray of the segment masks of the characters of text.
+    If masks is specified, the masks are written into it beginning at index
+    start. Unsupported characters are blank.
+
+    :param str text: The characters to encode.
+    :param bytearray masks: The destination mask buffer. Defaults to None (a
+    new bytearray).
+    :param integer start: The first destination index. Defaults to 0."""
+    if masks is None:
+        masks = bytearray(start + len(text))
+    for char in text:
+        code = ord(char)
+        masks[start] = SEGMENTS[code] if code < 128 else 0
+        start += 1
+    return masks
+
 
 class Colors:
     # Define a few colors (https://en.wikipedia.org/wiki/Web_colors)
@@ -46,10 +160,13 @@ class Colors:
     WHITE = 0xFFFFFF
 
 
-class BubbleDisplay(displayio.Group):
+class BubbleDisplay(
+    dirty_rect.DirtyRectMixin, value_filter.ValueFilterMixin, displayio.Group
+):
     def __init__(
         self, units=1, digits=4, mode="Normal", center=(0.5, 0.5), size=1,
-        display_size=(None, None),
+        display_size=(None, None), backend="Shapes", deadband=0, max_rate=None,
+        notation="Fixed", precision=None, leading_zeros=False,
     ):
         """Instantiate the multi-digit 7-segment numeric end-stackable
         LED display graphic object for DisplayIO devices. Builds a hierachical
@@ -63,9 +180,9 @@ class BubbleDisplay(displayio.Group):
         as alphanumeric strings (with a limited character set). Decimal values
         are right-justified with the decimal point placed within the 'ones'
         digit or between digits as specified by the mode parameter. Strings are
-        left-justified. Alpha string characters are limited to upper or lower
-        case 'a', 'b', 'c', 'd', 'e', 'f', 'x', '.', '-', and the space
-        character.
+        left-justified. Alpha string characters are the letters with a
+        seven-segment form (not 'k', 'm', 'v', 'w' or 'z'), '.', '-', '_', '=',
+        '?', quotes and the space character; other characters are blank.
 
         Display size in pixels is specified as an integer tuple. If the
         display_size tuple is not specified and a built-in display is listed in
@@ -87,20 +204,37 @@ class BubbleDisplay(displayio.Group):
         :param integer display_size: The host display's integer width and
         height tuple expressed in pixels. If (None, None) and the host includes
         an integral display, the tuple value is set to (board.DISPLAY.width,
-        board.DISPLAY.height)."""
-
-        # Determine default display size in pixels
-        if None in display_size:
-            import board
-
-            if "DISPLAY" in dir(board):
-                self.WIDTH = board.DISPLAY.width
-                self.HEIGHT = board.DISPLAY.height
-            else:
-                raise ValueError("No integral display. Specify display size.")
-        else:
-            self.WIDTH = display_size[0]
-            self.HEIGHT = display_size[1]
+        board.DISPLAY.height).
+        :param string backend: The segment rendering backend. The default
+        'Shapes' backend draws each segment as a display_shapes Line or Rect
+        with its own bitmap and palette; the 'Palette' backend draws segments
+        and lenses as vectorio shapes that share a single 'on' and 'off'
+        palette across all digits and lights a segment by swapping its
+        palette. The 'Palette' backend uses much less memory per digit but
+        draws lenses without rounded corners.
+        :param float deadband: The minimum value change that is displayed.
+        Defaults to 0 (any change).
+        :param float max_rate: The maximum number of displayed value changes
+        per second. Faster changes are recorded and the latest is displayed by
+        apply_pending(). Defaults to None (no limit).
+        :param string notation: The numeric value notation. 'Fixed' shows a
+        fixed-point value; 'Scientific' and 'Engineering' show an HP-35 style
+        mantissa with a right-justified signed exponent, which is a multiple
+        of three with a mantissa from 1 to 999 in 'Engineering' notation. A
+        value that does not fit in the selected notation is shown as a
+        fixed-point value, then in scientific notation, before dashes.
+        Non-numeric values are shown as their str() text. Defaults to
+        'Fixed'.
+        :param integer precision: The number of decimal places of a fixed-point
+        value or mantissa. Defaults to None (as many as fit, without trailing
+        zeros).
+        :param bool leading_zeros: Fill unused digits to the left of a
+        fixed-point value with zeros. Defaults to False (blank)."""
+
+        # Shared display coordinate transforms and size in pixels
+        self._coords = coordinates.for_display(display_size)
+        self.WIDTH = self._coords.width
+        self.HEIGHT = self._coords.height
 
         # Define object center in normalized display and pixel coordinates
         self._center_norm = center
@@ -109,6 +243,16 @@ class BubbleDisplay(displayio.Group):
         self._mode = mode
         self._units = max(0, units)
         self._num_digits = min(5, max(1, digits))
+        if backend not in ("Shapes", "Palette"):
+            raise ValueError("Backend must be 'Shapes' or 'Palette'.")
+        self._backend = backend
+        if notation not in ("Fixed", "Scientific", "Engineering"):
+            raise ValueError("Notation must be 'Fixed', 'Scientific' or 'Engineering'.")
+        if precision is not None and precision < 0:
+            raise ValueError("Precision must be 0 or greater or None.")
+        self._notation = notation
+        self._precision = precision
+        self._leading_zeros = leading_zeros
 
         # Create displayio group layers
         cluster = displayio.Group()
@@ -121,6 +265,35 @@ class BubbleDisplay(displayio.Group):
         blk_palette = displayio.Palette(1)
         blk_palette[0] = Colors.BLACK
 
+        # Shared segment palettes for the 'Palette' backend
+        self._on_palette = displayio.Palette(1)
+        self._on_palette[0] = Colors.RED
+        self._off_palette = red_bkg_palette
+        lens_palette = displayio.Palette(1)
+        lens_palette[0] = Colors.RED_LENS
+
+        self._digit_bounds = []  # Lens area of each digit
+
+        # Package, lens and decimal point dimensions followed by segment
+        # a, b, c, d, e, f and dp end point offsets in pixels
+        geometry = geometry_cache.fetch(
+            "bubble_display_digit",
+            __version__,
+            (self._coords.min_axis, self._size, self._num_digits, mode),
+            self._digit_geometry,
+        )
+        (
+            pkg_width,
+            pkg_height,
+            index_y,
+            index_size,
+            step_width,
+            step_offset,
+            lens_radius,
+            dp_size,
+        ) = geometry[:8]
+        end_points = geometry[8:]
+
         widget_upper_left = (
             self._center[0]
             - self.cart_dist_to_pixel(0.250 / 2 * self._units, self._size),
@@ -137,68 +310,82 @@ class BubbleDisplay(displayio.Group):
                 pixel_shader=dip_pkg_palette,
                 x=upper_left_corner[0],
                 y=upper_left_corner[1],
-                width=self.cart_dist_to_pixel(0.250, self._size),
-                height=self.cart_dist_to_pixel(0.100, self._size),
+                width=pkg_width,
+                height=pkg_height,
             )
             cluster.append(dip_pkg)
 
             dip_index = vectorio.Rectangle(
                 pixel_shader=blk_palette,
                 x=upper_left_corner[0],
-                y=self.cart_dist_to_pixel(0.096, self._size) + upper_left_corner[1],
-                width=self.cart_dist_to_pixel(0.010, self._size),
-                height=self.cart_dist_to_pixel(0.010, self._size),
+                y=index_y + upper_left_corner[1],
+                width=index_size,
+                height=index_size,
             )
             cluster.append(dip_index)
 
-            a1 = (
-                self.cart_dist_to_pixel(0.021, self._size) + upper_left_corner[0],
-                self.cart_dist_to_pixel(0.025, self._size) + upper_left_corner[1],
-            )
-            b1 = (
-                self.cart_dist_to_pixel(0.046, self._size) + upper_left_corner[0],
-                self.cart_dist_to_pixel(0.025, self._size) + upper_left_corner[1],
-            )
-            c1 = (
-                self.cart_dist_to_pixel(0.042, self._size) + upper_left_corner[0],
-                self.cart_dist_to_pixel(0.050, self._size) + upper_left_corner[1],
-            )
-            d1 = (
-                self.cart_dist_to_pixel(0.038, self._size) + upper_left_corner[0],
-                self.cart_dist_to_pixel(0.075, self._size) + upper_left_corner[1],
-            )
-            e1 = (
-                self.cart_dist_to_pixel(0.013, self._size) + upper_left_corner[0],
-                self.cart_dist_to_pixel(0.075, self._size) + upper_left_corner[1],
-            )
-            f1 = (
-                self.cart_dist_to_pixel(0.017, self._size) + upper_left_corner[0],
-                self.cart_dist_to_pixel(0.050, self._size) + upper_left_corner[1],
-            )
-            if mode == "HP-35":
-                dp = (
-                    self.cart_dist_to_pixel(0.029, self._size) + upper_left_corner[0],
-                    self.cart_dist_to_pixel(0.065, self._size) + upper_left_corner[1],
+            a1, b1, c1, d1, e1, f1, dp = [
+                (
+                    end_points[i] + upper_left_corner[0],
+                    end_points[i + 1] + upper_left_corner[1],
+                )
+                for i in range(0, 14, 2)
+            ]
+
+            for i in range(0, self._num_digits):
+                step = i * step_width
+                self._digit_bounds.append(
+                    dirty_rect.rect_bounds(
+                        upper_left_corner[0] + step,
+                        upper_left_corner[1],
+                        step_width,
+                        pkg_height,
                     )
-            else:
-                dp = (
-                    self.cart_dist_to_pixel(0.046, self._size) + upper_left_corner[0],
-                    self.cart_dist_to_pixel(0.075, self._size) + upper_left_corner[1],
+                )
+                if self._backend == "Palette":
+                    lens_width = step_width
+                    lens_height = pkg_height
+                    lens = vectorio.Rectangle(
+                        pixel_shader=lens_palette,
+                        x=upper_left_corner[0] + step,
+                        y=upper_left_corner[1],
+                        width=lens_width,
+                        height=lens_height,
                     )
+                    cluster.append(lens)
+                    lens_fill = vectorio.Rectangle(
+                        pixel_shader=red_bkg_palette,
+                        x=upper_left_corner[0] + step + 1,
+                        y=upper_left_corner[1] + 1,
+                        width=max(1, lens_width - 2),
+                        height=max(1, lens_height - 2),
+                    )
+                    cluster.append(lens_fill)
+
+                    # Segments a, b, c, d, e, f, g end points
+                    for p0, p1 in (
+                        (a1, b1), (b1, c1), (c1, d1), (d1, e1), (e1, f1), (f1, a1), (f1, c1),
+                    ):
+                        self._digits.append(
+                            self._segment_polygon(p0, p1, step + step_offset)
+                        )
+
+                    seg_dp = vectorio.Rectangle(
+                        pixel_shader=self._off_palette,
+                        x=dp[0] + step + step_offset,
+                        y=dp[1],
+                        width=max(1, dp_size),
+                        height=max(1, dp_size),
+                    )
+                    self._digits.append(seg_dp)
+                    continue
 
-            dp_size = self.cart_dist_to_pixel(0.008, self._size)
-
-            step_norm = 0.250 / self._num_digits
-            step_offset = self.cart_dist_to_pixel(0.09374 - ((0.25 - step_norm) / 2), self._size)
-
-            for i in range(0, self._num_digits):
-                step = i * self.cart_dist_to_pixel(step_norm, self._size)
                 lens = RoundRect(
                     upper_left_corner[0] + step,
                     upper_left_corner[1],
-                    self.cart_dist_to_pixel(step_norm, self._size),
-                    self.cart_dist_to_pixel(0.100, self._size),
-                    self.cart_dist_to_pixel(0.029, self._size),
+                    step_width,
+                    pkg_height,
+                    lens_radius,
                     fill=Colors.RED_BKG,
                     outline=Colors.RED_LENS,
                 )
@@ -275,6 +462,15 @@ class BubbleDisplay(displayio.Group):
                     fill=Colors.RED_BKG,
                 )
                 self._digits.append(seg_dp)
+
+        # Currently lit segment bitmask per digit; all segments start unlit
+        self._masks = bytearray(self._units * self._num_digits)
+        self._text_masks = bytearray(self._units * self._num_digits)  # Encoded text
+        self._segment_writes = 0
+        self._value = None
+        self._text = ""
+        self._value_filter = value_filter.ValueFilter(deadband, max_rate)
+
         super().__init__()
         self.append(cluster)
         self.append(self._digits)
@@ -295,6 +491,45 @@ class BubbleDisplay(displayio.Group):
         """Bubble display display mode."""
         return self._mode
 
+    @property
+    def backend(self):
+        """Segment rendering backend."""
+        return self._backend
+
+    @property
+    def notation(self):
+        """Numeric value notation."""
+        return self._notation
+
+    @notation.setter
+    def notation(self, notation="Fixed"):
+        if notation not in ("Fixed", "Scientific", "Engineering"):
+            raise ValueError("Notation must be 'Fixed', 'Scientific' or 'Engineering'.")
+        self._notation = notation
+        self._show_value(self._value, self._mode)
+
+    @property
+    def precision(self):
+        """Number of decimal places of a value or mantissa or None."""
+        return self._precision
+
+    @precision.setter
+    def precision(self, precision=None):
+        if precision is not None and precision < 0:
+            raise ValueError("Precision must be 0 or greater or None.")
+        self._precision = precision
+        self._show_value(self._value, self._mode)
+
+    @property
+    def leading_zeros(self):
+        """True if unused digits left of a fixed-point value show zeros."""
+        return self._leading_zeros
+
+    @leading_zeros.setter
+    def leading_zeros(self, leading_zeros=False):
+        self._leading_zeros = leading_zeros
+        self._show_value(self._value, self._mode)
+
     @property
     def center(self):
         """Bubble display object center."""
@@ -317,17 +552,29 @@ class BubbleDisplay(displayio.Group):
 
     @value.setter
     def value(self, value=None):
-        self._show_value(value, self._mode)
+        if self._value_filter.submit("value", value, self._value):
+            self._show_value(value, self._mode)
+
+    def _show_pending(self, pending):
+        """Display the released rate-limited value."""
+        self._show_value(pending["value"], self._mode)
 
     @property
     def text(self):
-        """Currently displayed text."""
+        """Currently displayed text. Setting text drops any rate-limited
+        value waiting for apply_pending()."""
         return self._text
 
     @text.setter
     def text(self, text=""):
+        self._value_filter.discard("value")
         self._show_text(text)
 
+    @property
+    def segment_writes(self):
+        """Number of segment color changes made by the most recent update."""
+        return self._segment_writes
+
     # @property
     # def center(self, cluster=0):
     #    """Normalized display coordinates of the object center."""
@@ -343,77 +590,293 @@ class BubbleDisplay(displayio.Group):
     #    SHOULD THIS BE A FUNCTION?
     #    return
 
-    def _show_text(self, text=""):
-        text = text[0 : self._units * self._num_digits]  # Truncate to left-most digits
-        text = (" " * ((self._units * self._num_digits) - len(text))) + text
-
-        for _digit in range(0, self._units * self._num_digits):
-            if text[_digit] in NUMBERS:
-                _decode = NUMBERS[text[_digit]]
-            else:
-                _decode = NUMBERS[" "]
+    def _show_text(self, text="", dp_digit=-1):
+        """Display a text string, lighting the decimal point of dp_digit if
+        specified. The string is encoded to segment masks in one pass and
+        only segments that change state are redrawn."""
+        self._text = text
+        self._segment_writes = 0
+        digits = self._units * self._num_digits
+        text = text[0:digits]  # Truncate to left-most digits
+        masks = self._text_masks
+        blank = digits - len(text)
+        for _digit in range(0, blank):
+            masks[_digit] = 0
+        encode(text, masks, blank)
+        if 0 <= dp_digit < digits:
+            masks[dp_digit] |= 0b10000000
+
+        for _digit in range(0, digits):
+            self._show_segments(_digit, masks[_digit])
+
+    def _show_segments(self, digit, decode):
+        """Set a digit's segments to the decode bitmask, touching only the
+        segments that differ from the currently displayed bitmask."""
+        _changed = self._masks[digit] ^ decode
+        if not _changed:
+            return
+        self._masks[digit] = decode
+        self._mark_dirty(self._digit_bounds[digit])
+        if self._backend == "Palette":
             for _segment in range(0, 8):
-                if _decode & pow(2, _segment):
-                    self._digits[(_digit * 8) + _segment].color = Colors.RED
-                    self._digits[(_digit * 8) + _segment].fill = Colors.RED
+                if _changed & (1 << _segment):
+                    if decode & (1 << _segment):
+                        self._digits[(digit * 8) + _segment].pixel_shader = self._on_palette
+                    else:
+                        self._digits[(digit * 8) + _segment].pixel_shader = self._off_palette
+                    self._segment_writes += 1
+            return
+        for _segment in range(0, 7):
+            if _changed & (1 << _segment):
+                if decode & (1 << _segment):
+                    self._digits[(digit * 8) + _segment].color = Colors.RED
                 else:
-                    self._digits[(_digit * 8) + _segment].color = Colors.RED_BKG
-                    self._digits[(_digit * 8) + _segment].fill = Colors.RED_BKG
+                    self._digits[(digit * 8) + _segment].color = Colors.RED_BKG
+                self._segment_writes += 1
+        if _changed & 0b10000000:
+            if decode & 0b10000000:
+                self._digits[(digit * 8) + 7].fill = Colors.RED
+            else:
+                self._digits[(digit * 8) + 7].fill = Colors.RED_BKG
+            self._segment_writes += 1
 
     def _show_value(self, value=None, mode="Normal"):
-        """ use mode='HP-35' for decimal point between digits """
+        """Display a value right-justified; use mode='HP-35' for the decimal
+        point between digits. A numeric value is converted digit by digit to
+        segment masks without intermediate strings; any other value is shown
+        as its str() text. A value that cannot be displayed is shown as
+        dashes."""
         self._mode = mode
-        if value == None:
-            _display = ""
-        else:
-            _display = str(value)
-
-        # if value string is larger than can be displayed, show dashes
-        if len(_display) > self._units * self._num_digits:
-            _display = "-" * self._units * self._num_digits
+        self._value = value
+        self._segment_writes = 0
+        masks = self._text_masks
+        if value is None:
+            shown = True
+            for _digit in range(0, len(masks)):
+                masks[_digit] = 0
+        elif isinstance(value, (int, float)):
+            shown = self._format_value(value, masks)
         else:
-            _display = (" " * ((self._units * self._num_digits) - len(_display))) + _display
+            shown = self._format_text(str(value), masks)
+        if not shown:
+            for _digit in range(0, len(masks)):
+                masks[_digit] = _MINUS
+
+        for _digit in range(0, len(masks)):
+            self._show_segments(_digit, masks[_digit])
+
+    def _format_text(self, text, masks):
+        """Write the segment masks of a value's text right-justified to masks.
+        Outside of HP-35 mode a decimal point is merged into the digit to its
+        left. Returns False if the text does not fit."""
+        dp_index = -1 if self._mode == "HP-35" else text.find(".")
+        if dp_index > -1:
+            text = text[0:dp_index] + text[dp_index + 1 :]
+        start = len(masks) - len(text)
+        if start < 0:
+            return False
+        for _digit in range(0, start):
+            masks[_digit] = 0
+        encode(text, masks, start)
+        if dp_index > -1 and start + dp_index > 0:
+            masks[start + dp_index - 1] |= _DP
+        return True
+
+    def _format_value(self, value, masks):
+        """Write the segment masks of a numeric value to masks in the selected
+        notation. A value that does not fit falls back to fixed-point, then
+        to scientific notation and finally to scientific notation with as
+        many decimal places as fit. Returns False if the value does not fit."""
+        negative = value < 0
+        magnitude = -value if negative else value
+        if magnitude != magnitude or magnitude == _INF:
+            return False  # NaN or infinity
+
+        precision = self._precision
+        if self._notation != "Fixed":
+            step = 3 if self._notation == "Engineering" else 1
+            if self._format_exponent(negative, magnitude, step, precision, masks):
+                return True
+
+        position = self._format_fixed(
+            magnitude, len(masks) - 1, len(masks) - negative, len(masks),
+            precision, masks,
+        )
+        if position is not None:
+            if self._leading_zeros and self._notation == "Fixed":
+                while position >= negative:
+                    masks[position] = _DIGITS[0]
+                    position -= 1
+            return self._format_sign(negative, position, masks)
+
+        if self._notation != "Scientific" and self._format_exponent(
+            negative, magnitude, 1, precision, masks
+        ):
+            return True
+        return precision is not None and self._format_exponent(
+            negative, magnitude, 1, None, masks
+        )
 
-        # locate decimal point and remove from display string
-        dp_digit = _display.find(".")
-        if dp_digit > -1 and self._mode != "HP-35":
-            _display = " " + _display[0:dp_digit] + _display[dp_digit + 1 :]
+    def _format_exponent(self, negative, magnitude, step, precision, masks):
+        """Write a magnitude as an HP-35 style mantissa and right-justified
+        signed exponent that is a multiple of step. The mantissa is kept
+        between 1 and 10 ** step. Returns False if the value does not fit."""
+        exponent = 0
+        if magnitude:
+            exponent = floor(log(magnitude) / log(10))
+            if _shift(magnitude, exponent) >= 10:
+                exponent += 1  # Correct logarithm rounding
+            elif _shift(magnitude, exponent) < 1:
+                exponent -= 1
+            exponent -= exponent % step
+        for retry in range(0, 2):
+            position = len(masks) - 1
+            exponent_magnitude = -exponent if exponent < 0 else exponent
+            exponent_digits = max(2, _count_digits(exponent_magnitude, 3))
+            if exponent_digits + 1 + negative >= len(masks):
+                return False  # No room for the exponent, sign and mantissa
+            for _ in range(0, exponent_digits):
+                masks[position] = _DIGITS[exponent_magnitude % 10]
+                exponent_magnitude //= 10
+                position -= 1
+            masks[position] = _MINUS if exponent < 0 else 0
+            mantissa = _shift(magnitude, exponent)
+            room = position - negative
+            position = self._format_fixed(
+                mantissa, position - 1, room, step, precision, masks
+            )
+            if position is None:
+                if retry or not magnitude or _count_digits(mantissa, room) > room:
+                    return False
+                exponent += step  # Retry if the mantissa rounded up to 10 ** step
+                continue
+            if retry and masks[position + 1] & ~_DP == _DIGITS[0]:
+                return False  # The retried mantissa did not round up to 1
+            return self._format_sign(negative, position, masks)
+        return False
+
+    def _format_fixed(self, magnitude, position, room, int_limit, precision, masks):
+        """Write a fixed-point magnitude right-justified at masks[position]
+        within room digits and int_limit integer digits, with precision
+        decimal places or, if None, as many as fit without trailing zeros.
+        Returns the next unused position to the left or None if the magnitude
+        does not fit or a non-zero magnitude rounds to zero without a
+        specified precision."""
+        if room < 1:
+            return None
+        hp_35 = self._mode == "HP-35"
+        int_digits = _count_digits(magnitude, room)
+        if int_digits > room:
+            return None
+        fit = precision is None
+        if fit:
+            if isinstance(magnitude, int):
+                precision = 0
+            else:
+                precision = max(0, room - int_digits - hp_35)
 
-        self._show_text(_display)
+        while True:
+            if isinstance(magnitude, int):
+                scaled = magnitude * (10 ** precision)
+            else:
+                scaled = int((magnitude * (10.0 ** precision)) + 0.5)
+            places = precision
+            if fit:
+                if magnitude and not scaled:
+                    return None
+                while places and not scaled % 10:
+                    scaled //= 10  # Remove trailing zeros
+                    places -= 1
+            width = max(_count_digits(scaled, room), places + 1)
+            if width - places > int_limit:
+                return None
+            if width + (hp_35 and places > 0) <= room:
+                break
+            if not fit or not precision:
+                return None
+            precision -= 1  # Rounding added an integer digit
+
+        for place in range(0, width):
+            mask = _DIGITS[scaled % 10]
+            scaled //= 10
+            if place == places and places:
+                if hp_35:
+                    masks[position] = _DP  # Decimal point in its own digit
+                    position -= 1
+                else:
+                    mask |= _DP
+            masks[position] = mask
+            position -= 1
+        return position
+
+    def _format_sign(self, negative, position, masks):
+        """Write the minus sign at masks[position] if negative and blank the
+        remaining digits to the left. Returns True."""
+        if negative:
+            masks[position] = _MINUS
+            position -= 1
+        while position >= 0:
+            masks[position] = 0
+            position -= 1
+        return True
+
+    def _digit_geometry(self):
+        """Return the package, lens and decimal point dimensions and the
+        segment end point offsets of a digit as an array of pixel values."""
+        step_norm = 0.250 / self._num_digits
+        if self._mode == "HP-35":
+            dp_norm = (0.029, 0.065)
+        else:
+            dp_norm = (0.046, 0.075)
+        return array(
+            "h",
+            self._coords.cart_dists_to_pixel(
+                (
+                    0.250,
+                    0.100,
+                    0.096,
+                    0.010,
+                    step_norm,
+                    0.09374 - ((0.25 - step_norm) / 2),
+                    0.029,
+                    0.008,
+                    0.021, 0.025, 0.046, 0.025, 0.042, 0.050, 0.038, 0.075,
+                    0.013, 0.075, 0.017, 0.050,
+                )
+                + dp_norm,
+                self._size,
+            ),
+        )
 
-        # clear all decimal points and plot the current point
-        for digit in range(0, self._units * self._num_digits):
-            self._digits[(digit * 8) + 7].fill = Colors.RED_BKG
-        if dp_digit > -1:
-            self._digits[(dp_digit * 8) + 7].fill = Colors.RED
-        return
+    def _segment_polygon(self, p0, p1, x_offset=0):
+        """Build a one pixel wide vectorio polygon between segment end points
+        p0 and p1, shifted horizontally by x_offset pixels. The polygon uses
+        the shared 'off' palette."""
+        x0, y0 = p0[0] + x_offset, p0[1]
+        x1, y1 = p1[0] + x_offset, p1[1]
+        if abs(x1 - x0) > abs(y1 - y0):
+            _points = [(x0, y0), (x1, y1), (x1, y1 + 1), (x0, y0 + 1)]
+        else:
+            _points = [(x0, y0), (x1, y1), (x1 + 1, y1), (x0 + 1, y0)]
+        return vectorio.Polygon(pixel_shader=self._off_palette, points=_points)
 
     def display_to_pixel(self, width_factor=0, height_factor=0, size=1.0):
         """Convert normalized display position input (0.0 to 1.0) to display
         pixel position."""
-        return int(round(size * self.WIDTH * width_factor, 0)), int(
-            round(size * self.HEIGHT * height_factor, 0)
-        )
+        return self._coords.display_to_pixel(width_factor, height_factor, size)
 
     def dial_to_pixel(self, dial_factor, center=(0, 0), radius=0):
         """Convert normalized dial_factor input (-1.0 to 1.0) to display pixel
         position on the circumference of the dial's circle with center
-        (x,y pixels) and radius (pixels)."""
-        rads = (-2 * pi) * (dial_factor)  # convert scale_factor to radians
-        rads = rads + (pi / 2)  # rotate axis counterclockwise
-        x = center[0] + int(cos(rads) * radius)
-        y = center[1] - int(sin(rads) * radius)
-        return x, y
+        (x,y pixels) and radius (pixels). Uses the shared trig_table angle
+        lookup."""
+        return trig_table.dial_to_pixel(dial_factor, center, radius)
 
     def cart_to_pixel(self, x, y, size=1.0):
         """Convert normalized cartesian position value (-0.5, to + 0.5) to display
         pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        x1 = int(round(min_axis * size * x, 0)) + self._center[0]
-        y1 = self._center[1] - int(round(min_axis * size * y, 0))
-        return x1, y1
+        return self._coords.cart_to_pixel(x, y, self._center, size)
 
     def cart_dist_to_pixel(self, distance=0, size=1.0):
         """Convert normalized cartesian distance value to display pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        return int(round(min_axis * size * distance, 0))
+        return self._coords.cart_dist_to_pixel(distance, size)
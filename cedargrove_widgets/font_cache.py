@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# font_cache.py
+# 2026-10-18 v1.0
+
+from collections import OrderedDict
+from adafruit_bitmap_font import bitmap_font
+
+# Loaded fonts keyed by file path; shared by all widget instances
+_fonts = {}
+
+
+class CachedFont:
+    def __init__(self, path, glyph_budget=None):
+        """A reference-counted bitmap font shared between widgets. Parses the
+        font file once and passes glyph requests through to the underlying
+        font object. If a glyph memory budget is specified, the least
+        recently used glyphs are discarded from the font's glyph table when
+        the estimated glyph memory exceeds the budget.
+
+        :param string path: The font file path.
+        :param integer glyph_budget: The estimated glyph bitmap memory limit
+        in bytes. Defaults to None (no limit)."""
+        self._path = path
+        self._font = bitmap_font.load_font(path)
+        self._glyph_budget = glyph_budget
+        self._glyph_bytes = 0
+        self._lru = OrderedDict()
+        self.refs = 0
+
+    @property
+    def path(self):
+        """Font file path."""
+        return self._path
+
+    @property
+    def glyph_budget(self):
+        """Glyph memory budget in bytes or None."""
+        return self._glyph_budget
+
+    @glyph_budget.setter
+    def glyph_budget(self, budget=None):
+        self._glyph_budget = budget
+        self._trim()
+
+    @property
+    def glyph_bytes(self):
+        """Estimated memory used by the glyphs tracked for the budget."""
+        return self._glyph_bytes
+
+    def get_glyph(self, code_point):
+        """Return the glyph for code_point, marking it most recently used."""
+        glyph = self._font.get_glyph(code_point)
+        if self._glyph_budget is None or glyph is None:
+            return glyph
+        if code_point in self._lru:
+            self._lru[code_point] = self._lru.pop(code_point)
+        else:
+            size = _glyph_size(glyph)
+            self._lru[code_point] = size
+            self._glyph_bytes += size
+            self._trim(keep=code_point)
+        return glyph
+
+    def get_bounding_box(self):
+        """Return the font's maximum glyph bounding box."""
+        return self._font.get_bounding_box()
+
+    def load_glyphs(self, code_points):
+        """Preload glyphs for the code_points string or iterable."""
+        self._font.load_glyphs(code_points)
+
+    def _trim(self, keep=None):
+        """Discard least recently used glyphs until within budget."""
+        if self._glyph_budget is None:
+            return
+        glyphs = getattr(self._font, "_glyphs", None)
+        while self._glyph_bytes > self._glyph_budget and self._lru:
+            code_point = next(iter(self._lru))
+            if code_point == keep:
+                break
+            self._glyph_bytes -= self._lru.pop(code_point)
+            if glyphs is not None and code_point in glyphs:
+                del glyphs[code_point]
+
+    def __getattr__(self, name):
+        # Pass remaining font attributes (ascent, descent, etc.) through
+        return getattr(self._font, name)
+
+
+def _glyph_size(glyph):
+    """Estimate glyph bitmap bytes; rows are packed into 32-bit words."""
+    bitmap = glyph.bitmap
+    return ((bitmap.width + 31) // 32) * 4 * bitmap.height
+
+
+def load_font(path, glyph_budget=None):
+    """Return the shared font for path, parsing the font file only on first
+    use. Each call adds a reference that is removed with release_font.
+
+    :param string path: The font file path.
+    :param integer glyph_budget: The estimated glyph bitmap memory limit in
+    bytes applied when the font is first loaded. Defaults to None."""
+    font = _fonts.get(path)
+    if font is None:
+        font = CachedFont(path, glyph_budget=glyph_budget)
+        _fonts[path] = font
+    font.refs += 1
+    return font
+
+
+def release_font(font):
+    """Remove a reference to a shared font specified by object or path. The
+    font is dropped from the cache when no references remain."""
+    path = font if isinstance(font, str) else font.path
+    font = _fonts.get(path)
+    if font is None:
+        return
+    font.refs -= 1
+    if font.refs <= 0:
+        del _fonts[path]
+
+
+def cached_fonts():
+    """Return a dictionary of cached font paths and reference counts."""
+    return {path: font.refs for path, font in _fonts.items()}
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# geometry_cache.py
+# 2026-10-18 v1.0
+
+import os
+import struct
+from array import array
+from binascii import crc32
+from cedargrove_widgets import trig_table
+
+# Geometry file header: magic, parameter key, number of array("h") values
+_HEADER = "<4sII"
+_MAGIC = b"CGGC"
+
+# Shared cache state; caching is disabled until a directory is configured
+_directory = None
+
+
+def configure(directory=None):
+    """Set the directory used to store computed widget geometry, such as
+    "/sd" or a writable folder in internal flash. Call before instantiating
+    widgets.
+
+    :param str directory: The cache directory path. Defaults to None
+    (caching disabled)."""
+    global _directory
+    _directory = directory
+
+
+def directory():
+    """The current cache directory or None if caching is disabled."""
+    return _directory
+
+
+def key(name, version, params):
+    """Return the 32-bit key of a widget geometry parameter set. The key
+    changes with the widget name, version, parameters and the shared
+    trig_table configuration.
+
+    :param str name: The geometry name.
+    :param str version: The widget module version.
+    :param tuple params: The parameters that determine the geometry."""
+    text = repr(
+        (name, version, params, trig_table.resolution(), trig_table.exact())
+    )
+    return crc32(text.encode()) & 0xFFFFFFFF
+
+
+def fetch(name, version, params, compute):
+    """Return the array("h") of geometry values for a parameter set. The
+    values are loaded from the cache directory if present; otherwise they
+    are calculated with compute() and saved for next time.
+
+    :param str name: The geometry name.
+    :param str version: The widget module version.
+    :param tuple params: The parameters that determine the geometry.
+    :param compute: A function without parameters that returns the
+    geometry values as an array("h")."""
+    if _directory is None:
+        return compute()
+    geometry_key = key(name, version, params)
+    path = "%s/%s_%08x.geo" % (_directory, name, geometry_key)
+    values = _load(path, geometry_key)
+    if values is None:
+        values = compute()
+        _save(path, geometry_key, values)
+    return values
+
+
+def clear():
+    """Remove all cached geometry files from the cache directory."""
+    if _directory is None:
+        return
+    for file_name in os.listdir(_directory):
+        if file_name.endswith(".geo"):
+            try:
+                os.remove("%s/%s" % (_directory, file_name))
+            except OSError:
+                pass
+
+
+def _load(path, geometry_key):
+    """Return the cached values or None if missing, stale or invalid."""
+    try:
+        with open(path, "rb") as geometry_file:
+            header = geometry_file.read(struct.calcsize(_HEADER))
+            if len(header) != struct.calcsize(_HEADER):
+                return None
+            magic, file_key, count = struct.unpack(_HEADER, header)
+            if magic != _MAGIC or file_key != geometry_key:
+                return None
+            values = array("h", [0]) * count
+            if geometry_file.readinto(values) != count * 2:
+                return None
+    except OSError:
+        return None
+    return values
+
+
+def _save(path, geometry_key, values):
+    """Write values to the cache; a read-only filesystem is ignored."""
+    try:
+        with open(path, "wb") as geometry_file:
+            geometry_file.write(struct.pack(_HEADER, _MAGIC, geometry_key, len(values)))
+            geometry_file.write(values)
+    except OSError:
+        pass
@@ -2,12 +2,21 @@
 # SPDX-License-Identifier: MIT
 
 # magic_eye.py
-# 2021-12-12 v2.3
+# 2026-10-18 v2.5
 
 import displayio
 import vectorio
-from math import pi, pow, sin, cos, sqrt
+from array import array
 from adafruit_display_shapes.circle import Circle
+from cedargrove_widgets import (
+    coordinates,
+    dirty_rect,
+    geometry_cache,
+    trig_table,
+    value_filter,
+)
+
+__version__ = "2.5"
 
 
 class Colors:
@@ -18,13 +27,18 @@ class Colors:
     GREEN_LT = 0x00A060
 
 
-class MagicEye(displayio.Group):
+class MagicEye(
+    dirty_rect.DirtyRectMixin, value_filter.ValueFilterMixin, displayio.Group
+):
     def __init__(
         self,
         center=(0.50, 0.50),
         size=0.5,
         display_size=(None, None),
         bezel_color=Colors.BLACK,
+        signal_step=None,
+        deadband=0,
+        max_rate=None,
     ):
         """Instantiate the 6E5 magic eye graphic object for DisplayIO devices.
         Builds a hierarchical DisplayIO group consisting of sub-groups for the
@@ -44,20 +58,22 @@ class MagicEye(displayio.Group):
         an integral display, the tuple value is set to (board.DISPLAY.width,
         board.DISPLAY.height).
         :param bezel_color: The integer RGB color value for the outer bezel.
-        Recommend setting to display background color. Defaults to 0x000000 (black)."""
-
-        # Determine default display size in pixels
-        if None in display_size:
-            import board
-
-            if "DISPLAY" in dir(board):
-                self.WIDTH = board.DISPLAY.width
-                self.HEIGHT = board.DISPLAY.height
-            else:
-                raise ValueError("No integral display. Specify display size.")
-        else:
-            self.WIDTH = display_size[0]
-            self.HEIGHT = display_size[1]
+        Recommend setting to display background color. Defaults to 0x000000 (black).
+        :param float signal_step: The signal quantization step. If specified,
+        the shadow wedge polygon points for every step from 0.0 to 2.0 are
+        precomputed and signal changes are displayed by table lookup; signal
+        changes smaller than the step are not displayed. Defaults to None
+        (continuous signal).
+        :param float deadband: The minimum signal value change that is displayed.
+        Defaults to 0 (any change).
+        :param float max_rate: The maximum number of displayed signal value changes
+        per second. Faster changes are recorded and the latest is displayed by
+        apply_pending(). Defaults to None (no limit)."""
+
+        # Shared display coordinate transforms and size in pixels
+        self._coords = coordinates.for_display(display_size)
+        self.WIDTH = self._coords.width
+        self.HEIGHT = self._coords.height
 
         # Define object center in normalized display and pixel coordinates
         self._center_norm = center
@@ -66,7 +82,7 @@ class MagicEye(displayio.Group):
         self._radius_norm = self._size / 2
 
         # Target anode and cathode light shield pixel screen values
-        self._outside_radius = int(self._radius_norm * min(self.WIDTH, self.HEIGHT))
+        self._outside_radius = int(self._radius_norm * self._coords.min_axis)
         self._inside_radius = int(0.90 * self._outside_radius)
         self._shield_radius = int(0.40 * self._outside_radius)
 
@@ -123,13 +139,9 @@ class MagicEye(displayio.Group):
             center=self._center,
             radius=self._outside_radius,
         )
-        _points = [
-            self._center,
-            (x1, y1),
-            (x1, self._center[1] + self._outside_radius),
-            (x2, self._center[1] + self._outside_radius),
-            (x2, y2),
-        ]
+        _points = self._wedge_points(x1, y1, x2, y2)
+        self._eye_points = _points
+        self._eye_overlap = False
         self.eye = vectorio.Polygon(
             pixel_shader=self._shadow_palette,
             points=_points,
@@ -144,27 +156,13 @@ class MagicEye(displayio.Group):
             self._bezel_color = bezel_color
         self._bezel_palette[0] = self._bezel_color
 
-        bezel_resolution = self._outside_radius * 2
-        bezel_range_min = int(round(0.25 * bezel_resolution, 0))
-        bezel_range_max = int(round(0.75 * bezel_resolution, 0))
-        bezel_min = self.dial_to_pixel(
-            0.25, center=self._center, radius=self._outside_radius
+        bezel = geometry_cache.fetch(
+            "magic_eye_bezel",
+            __version__,
+            (self._center, self._outside_radius),
+            self._bezel_geometry,
         )
-        bezel_max = self.dial_to_pixel(
-            0.75, center=self._center, radius=self._outside_radius
-        )
-
-        _points = []
-        for i in range(bezel_range_min, bezel_range_max + 1):
-            _points.append(
-                self.dial_to_pixel(
-                    i / bezel_resolution,
-                    center=self._center,
-                    radius=self._outside_radius,
-                )
-            )
-        _points.append((bezel_max[0], self._center[1] + self._outside_radius + 2))
-        _points.append((bezel_min[0], self._center[1] + self._outside_radius + 2))
+        _points = [(bezel[i], bezel[i + 1]) for i in range(0, len(bezel), 2)]
         doughnut_mask = vectorio.Polygon(
             pixel_shader=self._bezel_palette,
             points=_points,
@@ -197,8 +195,28 @@ class MagicEye(displayio.Group):
         self.append(self._eye_group)
         self.append(self._bezel_group)
 
+        # Precompute the quantized shadow wedge corner points of every signal
+        # level: x1, y1, x2, y2
+        self._wedge_table = None
+        self._signal_step = signal_step
+        if signal_step is not None:
+            if signal_step <= 0 or signal_step > 2.0:
+                raise ValueError("Signal step must be greater than 0.0 and <= 2.0.")
+            levels = int(round(2.0 / signal_step, 0)) + 1
+            self._level_scale = (levels - 1) / 2.0
+            self._overlap_level = int(self._level_scale)  # 1.0 signal level
+            self._wedge_table = geometry_cache.fetch(
+                "magic_eye_wedge",
+                __version__,
+                (self._center, self._outside_radius, levels),
+                lambda: self._wedge_geometry(levels),
+            )
+        self._eye_level = -1
+
+        self._value_filter = value_filter.ValueFilter(deadband, max_rate)
         self._eye_value = 1
         self._show_signal(0)  # Plot no signal shadow wedge
+        self.clear_dirty_rect()
         return
 
     @property
@@ -216,15 +234,27 @@ class MagicEye(displayio.Group):
         """Size of display."""
         return (self.WIDTH, self.HEIGHT)
 
+    @property
+    def signal_step(self):
+        """Signal quantization step or None if continuous."""
+        return self._signal_step
+
     @property
     def value(self):
         """Currently displayed value."""
+        if self._wedge_table is not None:
+            return self._eye_level / self._level_scale
         return self._eye_value
 
     @value.setter
     def value(self, signal=0):
         signal = min(max(0, signal), 2.0)
-        self._show_signal(signal)
+        if self._value_filter.submit("value", signal, self.value):
+            self._show_signal(signal)
+
+    def _show_pending(self, pending):
+        """Display the released rate-limited signal value."""
+        self._show_signal(pending["value"])
 
     def _show_signal(self, signal=0):
         """Plot the MagicEye shadow wedge. Input is a positive floating point
@@ -235,61 +265,133 @@ class MagicEye(displayio.Group):
         :param eye_normal: The normalized floating point signal  value for the
         shadow wedge. Defaults to 0 (no signal)."""
 
+        if self._wedge_table is not None:
+            level = int(signal * self._level_scale + 0.5)
+            if level != self._eye_level:
+                self._eye_level = level
+                table = self._wedge_table
+                i = level * 4
+                self._show_wedge(
+                    table[i],
+                    table[i + 1],
+                    table[i + 2],
+                    table[i + 3],
+                    level > self._overlap_level,
+                )
+            return
+
         if signal != self._eye_value:
             self._eye_value = signal
-            # Combined shadow wedge and tarsus polygon points
-            x1, y1 = self.dial_to_pixel(
-                0.35 + (self._eye_value * 0.15),
-                center=self._center,
-                radius=self._outside_radius,
-            )
-            x2, y2 = self.dial_to_pixel(
-                0.65 - (self._eye_value * 0.15),
-                center=self._center,
-                radius=self._outside_radius,
-            )
-            _points = [
-                self._center,
-                (x1, y1),
-                (x1, self._center[1] + self._outside_radius),
-                (x2, self._center[1] + self._outside_radius),
-                (x2, y2),
-            ]
-
-            if self._eye_value > 1.0:
+            x1, y1, x2, y2 = self._wedge_corners(self._eye_value)
+            self._show_wedge(x1, y1, x2, y2, self._eye_value > 1.0)
+        return
+
+    def _bezel_geometry(self):
+        """Return the doughnut bezel mask polygon points as a flat array of
+        x, y pixel values."""
+        bezel_resolution = self._outside_radius * 2
+        bezel_range_min = int(round(0.25 * bezel_resolution, 0))
+        bezel_range_max = int(round(0.75 * bezel_resolution, 0))
+        bezel_min = self.dial_to_pixel(
+            0.25, center=self._center, radius=self._outside_radius
+        )
+        bezel_max = self.dial_to_pixel(
+            0.75, center=self._center, radius=self._outside_radius
+        )
+
+        _points = array("h")
+        for point in self._coords.dial_points_to_pixel(
+            [i / bezel_resolution for i in range(bezel_range_min, bezel_range_max + 1)],
+            center=self._center,
+            radius=self._outside_radius,
+        ):
+            _points.extend(point)
+        _points.extend((bezel_max[0], self._center[1] + self._outside_radius + 2))
+        _points.extend((bezel_min[0], self._center[1] + self._outside_radius + 2))
+        return _points
+
+    def _wedge_geometry(self, levels):
+        """Return the quantized shadow wedge table of x1, y1, x2, y2 pixel
+        values for each of levels signal steps from 0.0 to 2.0."""
+        table = array("h", [0] * (levels * 4))
+        for level in range(levels):
+            x1, y1, x2, y2 = self._wedge_corners(level / self._level_scale)
+            table[level * 4] = x1
+            table[level * 4 + 1] = y1
+            table[level * 4 + 2] = x2
+            table[level * 4 + 3] = y2
+        return table
+
+    def _wedge_corners(self, signal=0):
+        """Return the x1, y1, x2, y2 pixel positions of the shadow wedge edges
+        on the target anode circumference for a signal value."""
+        x1, y1 = self.dial_to_pixel(
+            0.35 + (signal * 0.15),
+            center=self._center,
+            radius=self._outside_radius,
+        )
+        x2, y2 = self.dial_to_pixel(
+            0.65 - (signal * 0.15),
+            center=self._center,
+            radius=self._outside_radius,
+        )
+        return x1, y1, x2, y2
+
+    def _wedge_points(self, x1, y1, x2, y2):
+        """Return the combined shadow wedge and tarsus polygon point list for
+        the wedge corner pixel positions."""
+        return [
+            self._center,
+            (x1, y1),
+            (x1, self._center[1] + self._outside_radius),
+            (x2, self._center[1] + self._outside_radius),
+            (x2, y2),
+        ]
+
+    def _show_wedge(self, x1, y1, x2, y2, overlap=False):
+        """Update the combined shadow wedge and tarsus polygon for the wedge
+        corner pixel positions. The preallocated point buffer is refilled in
+        place and reassigned to the polygon. The polygon and its palette are
+        only changed if the wedge corner pixels or the overlap state differ
+        from those displayed."""
+        points = self._eye_points
+        if overlap != self._eye_overlap:
+            self._eye_overlap = overlap
+            if overlap:
                 self.eye.pixel_shader = self._overlap_palette
             else:
                 self.eye.pixel_shader = self._shadow_palette
+            self._mark_dirty(dirty_rect.points_bounds(points))
 
-            self.eye.points = _points
-        return
+        if points[1] == (x1, y1) and points[4] == (x2, y2):
+            return
+
+        old_bounds = dirty_rect.points_bounds(points)
+        bottom = self._center[1] + self._outside_radius
+        points[1] = (x1, y1)
+        points[2] = (x1, bottom)
+        points[3] = (x2, bottom)
+        points[4] = (x2, y2)
+        self._mark_dirty(dirty_rect.union(old_bounds, dirty_rect.points_bounds(points)))
+        self.eye.points = points
 
     def display_to_pixel(self, width_factor=0, height_factor=0, size=1.0):
         """Convert normalized display position input (0.0 to 1.0) to display
         pixel position."""
-        return int(round(size * self.WIDTH * width_factor, 0)), int(
-            round(size * self.HEIGHT * height_factor, 0)
-        )
+        return self._coords.display_to_pixel(width_factor, height_factor, size)
 
     def dial_to_pixel(self, dial_factor, center=(0, 0), radius=0):
         """Convert normalized dial_factor input (-1.0 to 1.0) to display pixel
         position on the circumference of the dial's circle with center
-        (x,y pixels) and radius (pixels)."""
-        rads = (-2 * pi) * (dial_factor)  # convert scale_factor to radians
-        rads = rads + (pi / 2)  # rotate axis counterclockwise
-        x = center[0] + int(cos(rads) * radius)
-        y = center[1] - int(sin(rads) * radius)
-        return x, y
+        (x,y pixels) and radius (pixels). Uses the shared trig_table angle
+        lookup."""
+        return trig_table.dial_to_pixel(dial_factor, center, radius)
 
     def cart_to_pixel(self, x, y, size=1.0):
         """Convert normalized cartesian position value (-0.5, to + 0.5) to display
         pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        x1 = int(round(min_axis * size * x, 0)) + self._center[0]
-        y1 = self._center[1] - int(round(min_axis * size * y, 0))
-        return x1, y1
+        return self._coords.cart_to_pixel(x, y, self._center, size)
 
     def cart_dist_to_pixel(self, distance=0, size=1.0):
         """Convert normalized cartesian distance value to display pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        return int(round(min_axis * size * distance, 0))
+        return self._coords.cart_dist_to_pixel(distance, size)
@@ -2,18 +2,28 @@
 # SPDX-License-Identifier: MIT
 
 # scale.py
-# 2022-08-25 v2.51
+# 2026-10-18 v2.52
 
 import displayio
 import vectorio
 import terminalio
-from math import pi, pow, sin, cos, sqrt
-from adafruit_bitmap_font import bitmap_font
+from array import array
 from adafruit_display_shapes.circle import Circle
 from adafruit_display_shapes.line import Line
 from adafruit_display_shapes.roundrect import RoundRect
 from adafruit_display_shapes.triangle import Triangle
 from adafruit_display_text.label import Label
+from cedargrove_widgets import (
+    coordinates,
+    dirty_rect,
+    font_cache,
+    geometry_cache,
+    static_layer,
+    trig_table,
+    value_filter,
+)
+
+__version__ = "2.52"
 
 
 class Colors:
@@ -29,7 +39,13 @@ class Colors:
     WHITE = 0xFFFFFF
 
 
-class Scale(displayio.Group):
+# Marks update() parameters that were not specified
+_UNCHANGED = object()
+
+
+class Scale(
+    dirty_rect.DirtyRectMixin, value_filter.ValueFilterMixin, displayio.Group
+):
     def __init__(
         self,
         num_hands=1,
@@ -37,6 +53,11 @@ class Scale(displayio.Group):
         size=0.5,
         max_scale=100,
         display_size=(None, None),
+        lazy=False,
+        static_layers=False,
+        static_cache=None,
+        deadband=0,
+        max_rate=None,
     ):
         """Instantiate the scale graphic object for DisplayIO devices.
         The Scale class is a displayio group representing the scale widget.
@@ -51,20 +72,31 @@ class Scale(displayio.Group):
         :param integer display_size: The host display's integer width and
         height tuple expressed in pixels. If (None, None) and the host includes
         an integral display, the tuple value is set to (board.DISPLAY.width,
-        board.DISPLAY.height)."""
-
-        # Determine default display size in pixels
-        if None in display_size:
-            import board
-
-            if "DISPLAY" in dir(board):
-                self.WIDTH = board.DISPLAY.width
-                self.HEIGHT = board.DISPLAY.height
-            else:
-                raise ValueError("No integral display. Specify display size.")
-        else:
-            self.WIDTH = display_size[0]
-            self.HEIGHT = display_size[1]
+        board.DISPLAY.height).
+        :param bool lazy: Defer building the widget's displayio objects until
+        materialize() is called or a hand or alarm value is first changed.
+        Use with release() to hold widgets for pages that are not shown
+        without their RAM cost. Defaults to False.
+        :param bool static_layers: Flatten the static base, foot, dial face,
+        hashmarks, labels and bezel into two indexed bitmaps at construction
+        to reduce the number of layers walked on each display refresh.
+        Defaults to False.
+        :param str static_cache: A writable directory, such as "/sd", where
+        flattened static layers are saved and loaded from on later
+        instantiations with the same size, max_scale and display_size. The
+        file name changes with the module version and the trig_table
+        configuration so that stale layers are not reused.
+        Requires static_layers. Defaults to None (no cache).
+        :param float deadband: The minimum hand value change that is displayed.
+        Defaults to 0 (any change).
+        :param float max_rate: The maximum number of displayed hand value changes
+        per second. Faster changes are recorded and the latest is displayed by
+        apply_pending(). Defaults to None (no limit)."""
+
+        # Shared display coordinate transforms and size in pixels
+        self._coords = coordinates.for_display(display_size)
+        self.WIDTH = self._coords.width
+        self.HEIGHT = self._coords.height
 
         if num_hands < 1 or num_hands > 2:
             raise ValueError("Number of hands must be 1 or 2.")
@@ -77,29 +109,170 @@ class Scale(displayio.Group):
         self._hand2 = 0
         self._alarm1 = None
         self._alarm2 = None
+        self._batch_depth = 0
+        self._pending = {}
+        self._value_filter = value_filter.ValueFilter(deadband, max_rate)
 
         # Define object center relative to normalized display and pixel coordinates
         self._center_norm = center
         self._center = self.display_to_pixel(self._center_norm[0], self._center_norm[1])
 
-        if self._size < 0.50:
-            self.FONT_0 = terminalio.FONT
-        else:
-            self.FONT_0 = bitmap_font.load_font("/fonts/OpenSans-9.bdf")
-
-        scale_group = displayio.Group()
-        self._hands_group = displayio.Group()
-        pivot_group = displayio.Group()
-
         # Define dial radii layout
         self._outside_radius = self.cart_dist_to_pixel(0.5, self._size)
-        major_radius = int(round(self._outside_radius * 0.88, 0))
-        minor_radius = int(round(self._outside_radius * 0.93, 0))
-        label_radius = int(round(self._outside_radius * 0.70, 0))
-        point_radius = int(round(self._outside_radius * 0.06, 0))
+        self._point_radius = int(round(self._outside_radius * 0.06, 0))
+        self._base = self._outside_radius // 16
+        self._riser_size = (
+            self.cart_dist_to_pixel(0.14, self._size),
+            self.cart_dist_to_pixel(0.20, self._size),
+        )
+        self._plate_size = (
+            self.cart_dist_to_pixel(1.0, self._size),
+            self.cart_dist_to_pixel(0.08, self._size),
+        )
+        self._plate_y = 0.65
+        self._static_layers = static_layers
+        self._static_cache = static_cache
+        self.FONT_0 = None
+
+        super().__init__()
+        self._materialized = False
+        if not lazy:
+            self.materialize()
+            self._dirty = None
+        return
+
+    @property
+    def center(self):
+        """Normalized display coordinates of object center."""
+        return self._center_norm
+
+    @property
+    def size(self):
+        """Normalized object size."""
+        return self._size
+
+    @property
+    def max_scale(self):
+        """Maximum scale value."""
+        return self._max_scale
+
+    @property
+    def display_size(self):
+        """Size of display."""
+        return (self.WIDTH, self.HEIGHT)
+
+    @property
+    def hand1(self):
+        """Currently displayed hand1 value."""
+        return self._hand1
+
+    @hand1.setter
+    def hand1(self, value=0):
+        if self._batch_depth:
+            self._pending["hand1"] = value
+            return
+        if self._value_filter.submit("hand1", value, self._hand1):
+            self._show_hands(hand1=value, hand2=self._hand2)
+
+    @property
+    def hand2(self):
+        """Currently displayed hand2 value."""
+        return self._hand2
+
+    @hand2.setter
+    def hand2(self, value=0):
+        if self._batch_depth:
+            self._pending["hand2"] = value
+            return
+        if self._value_filter.submit("hand2", value, self._hand2):
+            self._show_hands(self._hand1, hand2=value)
 
-        x1, y1 = self.cart_to_pixel(-0.49, -0.51, self._size)
-        x2, y2 = self.cart_to_pixel(0.49, -0.51, self._size)
+    @property
+    def alarm1(self):
+        """Current alarm1 value."""
+        return self._alarm1
+
+    @alarm1.setter
+    def alarm1(self, value=None):
+        if self._batch_depth:
+            self._pending["alarm1"] = value
+            return
+        self._show_alarms(alarm1=value, alarm2=self._alarm2)
+
+    @property
+    def alarm2(self):
+        """Current alarm2 value."""
+        if self._num_hands != 2:
+            return None
+        return self._alarm2
+
+    @alarm2.setter
+    def alarm2(self, value=None):
+        if self._num_hands != 2:
+            return
+        if self._batch_depth:
+            self._pending["alarm2"] = value
+            return
+        self._show_alarms(self._alarm1, alarm2=value)
+
+    def update(
+        self, hand1=_UNCHANGED, hand2=_UNCHANGED, alarm1=_UNCHANGED, alarm2=_UNCHANGED
+    ):
+        """Change any combination of hands and alarms with a single plate,
+        hand and alarm marker recalculation. Parameters that are not specified
+        keep their current value. Specified hands replace any rate-limited
+        value waiting for apply_pending().
+
+        :param float hand1: The first hand position on the scale dial.
+        :param float hand2: The second hand position on the scale dial.
+        :param float alarm1: The first alarm position or None to hide it.
+        :param float alarm2: The second alarm position or None to hide it."""
+        if hand1 is _UNCHANGED:
+            hand1 = self._hand1
+        else:
+            self._value_filter.discard("hand1")
+        if hand2 is _UNCHANGED:
+            hand2 = self._hand2
+        else:
+            self._value_filter.discard("hand2")
+        if alarm1 is _UNCHANGED:
+            alarm1 = self._alarm1
+        if alarm2 is _UNCHANGED or self._num_hands != 2:
+            alarm2 = self._alarm2
+        self._show_hands(hand1=hand1, hand2=hand2)
+        self._show_alarms(alarm1=alarm1, alarm2=alarm2)
+
+    def _show_pending(self, pending):
+        """Display the released rate-limited hand values."""
+        self.update(**pending)
+
+    def batch(self):
+        """Return a context manager that defers hand and alarm property changes
+        until the end of the with block, then applies them with a single
+        update(). Property getters return the displayed values until then.
+
+            with scale.batch():
+                scale.hand1 = 0.25
+                scale.hand2 = 0.75"""
+        return self
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self._batch_depth -= 1
+        if not self._batch_depth and self._pending:
+            pending = self._pending
+            self._pending = {}
+            self.update(**pending)
+
+    def _build_back(self):
+        """Return a group of the static base and foot shapes."""
+        back_group = displayio.Group()
+        (x1, y1), (x2, y2) = self._coords.cart_points_to_pixel(
+            ((-0.49, -0.51), (0.49, -0.51)), self._center, self._size
+        )
         base = Triangle(
             self._center[0],
             self._center[1],
@@ -110,7 +283,7 @@ class Scale(displayio.Group):
             fill=Colors.GRAY,
             outline=Colors.BLACK,
         )
-        scale_group.append(base)
+        back_group.append(base)
 
         x, y = self.cart_to_pixel(-0.5, -0.5, self._size)
         foot = RoundRect(
@@ -122,33 +295,18 @@ class Scale(displayio.Group):
             fill=Colors.GRAY,
             outline=Colors.BLACK,
         )
-        scale_group.append(foot)
+        back_group.append(foot)
+        return back_group
 
-        # Define moveable plate graphic
-        self._plate_y = 0.65
-        x, y = self.cart_to_pixel(-0.07, self._plate_y, self._size)
-        self.riser = RoundRect(
-            x,
-            y,
-            width=self.cart_dist_to_pixel(0.14, self._size),
-            height=self.cart_dist_to_pixel(0.20, self._size),
-            r=0,
-            fill=Colors.GRAY,
-            outline=Colors.BLACK,
-        )
-        scale_group.append(self.riser)
+    def _build_face(self):
+        """Return a group of the static dial face, hashmarks, labels and
+        bezel shapes."""
+        if self._size < 0.50:
+            self.FONT_0 = terminalio.FONT
+        else:
+            self.FONT_0 = font_cache.load_font("/fonts/OpenSans-9.bdf")
 
-        x, y = self.cart_to_pixel(-0.5, self._plate_y, self._size)
-        self.plate = RoundRect(
-            x,
-            y,
-            width=self.cart_dist_to_pixel(1.0, self._size),
-            height=self.cart_dist_to_pixel(0.08, self._size),
-            r=int(10 * self._size),
-            fill=Colors.GRAY,
-            outline=Colors.BLACK,
-        )
-        scale_group.append(self.plate)
+        face_group = displayio.Group()
 
         # Define primary dial graphic
         dial = Circle(
@@ -159,40 +317,42 @@ class Scale(displayio.Group):
             outline=Colors.WHITE,
             stroke=1,
         )
-        scale_group.append(dial)
-
-        # Define hashmarks
-        for i in range(0, self._max_scale, self._max_scale // 10):
+        face_group.append(dial)
+
+        # Define hashmarks; label position and major and minor hashmark end
+        # points for each of the ten major dial divisions
+        hashmarks = geometry_cache.fetch(
+            "scale_hashmarks",
+            __version__,
+            (self._center, self._outside_radius, self._max_scale),
+            self._hashmark_geometry,
+        )
+        for n, i in enumerate(range(0, self._max_scale, self._max_scale // 10)):
+            j = n * 10
             hash_value = Label(self.FONT_0, text=str(i), color=Colors.CYAN)
             hash_value.anchor_point = (0.5, 0.5)
-            hash_value.anchored_position = self.dial_to_pixel(
-                i / self._max_scale, center=self._center, radius=label_radius
-            )
-            scale_group.append(hash_value)
+            hash_value.anchored_position = (hashmarks[j], hashmarks[j + 1])
+            face_group.append(hash_value)
 
             # Major hashmarks
-            x0, y0 = self.dial_to_pixel(
-                i / self._max_scale, center=self._center, radius=major_radius
-            )
-            x1, y1 = self.dial_to_pixel(
-                i / self._max_scale, center=self._center, radius=self._outside_radius
+            hashmark_a = Line(
+                hashmarks[j + 2],
+                hashmarks[j + 3],
+                hashmarks[j + 4],
+                hashmarks[j + 5],
+                Colors.CYAN,
             )
-            hashmark_a = Line(x0, y0, x1, y1, Colors.CYAN)
-            scale_group.append(hashmark_a)
+            face_group.append(hashmark_a)
 
             # Minor hashmarks
-            x0, y0 = self.dial_to_pixel(
-                (i + self._max_scale / 20) / self._max_scale,
-                center=self._center,
-                radius=minor_radius,
+            hashmark_b = Line(
+                hashmarks[j + 6],
+                hashmarks[j + 7],
+                hashmarks[j + 8],
+                hashmarks[j + 9],
+                Colors.CYAN,
             )
-            x1, y1 = self.dial_to_pixel(
-                (i + self._max_scale / 20) / self._max_scale,
-                center=self._center,
-                radius=self._outside_radius,
-            )
-            hashmark_b = Line(x0, y0, x1, y1, Colors.CYAN)
-            scale_group.append(hashmark_b)
+            face_group.append(hashmark_b)
 
         # Define dial bezel
         bezel = Circle(
@@ -203,93 +363,147 @@ class Scale(displayio.Group):
             outline=Colors.BLACK,
             stroke=1,
         )
-        scale_group.append(bezel)
+        face_group.append(bezel)
+        return face_group
 
-        # Define pointer 1
-        self._base = self._outside_radius // 16
-        self._hand1 = 0
-        x0, y0 = self.dial_to_pixel(
-            self._hand1, center=self._center, radius=self._outside_radius
-        )
-        x1, y1 = self.dial_to_pixel(
-            self._hand1 - 0.25, center=self._center, radius=self._base
+    def _hashmark_geometry(self):
+        """Return the label position and the major and minor hashmark end
+        points of each major dial division as a flat array of pixel values."""
+        major_radius = int(round(self._outside_radius * 0.88, 0))
+        minor_radius = int(round(self._outside_radius * 0.93, 0))
+        label_radius = int(round(self._outside_radius * 0.70, 0))
+
+        divisions = range(0, self._max_scale, self._max_scale // 10)
+        majors = [i / self._max_scale for i in divisions]
+        minors = [(i + self._max_scale / 20) / self._max_scale for i in divisions]
+        dial_points = self._coords.dial_points_to_pixel
+        hashmarks = array("h")
+        for points in zip(
+            dial_points(majors, center=self._center, radius=label_radius),
+            dial_points(majors, center=self._center, radius=major_radius),
+            dial_points(majors, center=self._center, radius=self._outside_radius),
+            dial_points(minors, center=self._center, radius=minor_radius),
+            dial_points(minors, center=self._center, radius=self._outside_radius),
+        ):
+            for point in points:
+                hashmarks.extend(point)
+        return hashmarks
+
+    def _static_layer(self, name, builder):
+        """Return the group of static shapes made by builder or, if static
+        layers are enabled, a TileGrid of the flattened shapes loaded from or
+        saved to the static cache.
+
+        :param str name: The static layer's cache file name.
+        :param builder: The method that builds the static shapes group."""
+        if not self._static_layers:
+            return builder()
+        path = None
+        if self._static_cache is not None:
+            path = "%s/scale_%s_%08x.bin" % (
+                self._static_cache,
+                name,
+                geometry_cache.key(
+                    "scale_" + name,
+                    __version__,
+                    (self._size, self._max_scale, self.WIDTH, self.HEIGHT),
+                ),
+            )
+            layer = static_layer.load(path)
+            if layer is not None:
+                return static_layer.tile_grid(layer, *self._center)
+        bitmap, palette, x, y = static_layer.flatten(builder())
+        layer = (bitmap, palette, x - self._center[0], y - self._center[1])
+        if path is not None:
+            static_layer.save(path, *layer)
+        return static_layer.tile_grid(layer, *self._center)
+
+    def _release_font(self):
+        """Release the hashmark label font."""
+        if self.FONT_0 is not None and self.FONT_0 is not terminalio.FONT:
+            font_cache.release_font(self.FONT_0)
+        self.FONT_0 = None
+
+    def _build(self):
+        """Build the scale's displayio objects with the hands at zero and the
+        alarm markers hidden."""
+        scale_group = displayio.Group()
+        self._hands_group = displayio.Group()
+        pivot_group = displayio.Group()
+
+        scale_group.append(self._static_layer("back", self._build_back))
+
+        # Define moveable plate graphic
+        x, y = self.cart_to_pixel(-0.07, self._plate_y, self._size)
+        self.riser = RoundRect(
+            x,
+            y,
+            width=self._riser_size[0],
+            height=self._riser_size[1],
+            r=0,
+            fill=Colors.GRAY,
+            outline=Colors.BLACK,
         )
-        x2, y2 = self.dial_to_pixel(
-            self._hand1 + 0.25, center=self._center, radius=self._base
+        scale_group.append(self.riser)
+
+        x, y = self.cart_to_pixel(-0.5, self._plate_y, self._size)
+        self.plate = RoundRect(
+            x,
+            y,
+            width=self._plate_size[0],
+            height=self._plate_size[1],
+            r=int(10 * self._size),
+            fill=Colors.GRAY,
+            outline=Colors.BLACK,
         )
-        pointer_1 = Triangle(
-            x0,
-            y0,
-            x1,
-            y1,
-            x2,
-            y2,
-            fill=Colors.ORANGE,
-            outline=Colors.ORANGE,
+        scale_group.append(self.plate)
+
+        scale_group.append(self._static_layer("face", self._build_face))
+        if self._static_layers:
+            self._release_font()  # Labels are part of the flattened face
+
+        # Define pointers; one persistent polygon per hand, updated in place
+        self._hand1_palette = displayio.Palette(1)
+        self._hand1_palette[0] = Colors.ORANGE
+        self._hand1_over = False
+        self._hand1_points = self._hand_points(0)
+        self.pointer_1 = vectorio.Polygon(
+            pixel_shader=self._hand1_palette,
+            points=self._hand1_points,
         )
-        self._hands_group.append(pointer_1)
+        self._hands_group.append(self.pointer_1)
 
-        # Define pointer 2
         if self._num_hands == 2:
-            self._hand2 = 0
-            hand2_fill = hand2_outline = None
-            x0, y0 = self.dial_to_pixel(
-                self._hand2, center=self._center, radius=self._outside_radius
-            )
-            x1, y1 = self.dial_to_pixel(
-                self._hand2 - 0.25, center=self._center, radius=self._base
-            )
-            x2, y2 = self.dial_to_pixel(
-                self._hand2 + 0.25, center=self._center, radius=self._base
-            )
-            pointer_2 = Triangle(
-                x0,
-                y0,
-                x1,
-                y1,
-                x2,
-                y2,
-                fill=Colors.GREEN,
-                outline=Colors.GREEN,
+            self._hand2_palette = displayio.Palette(1)
+            self._hand2_palette[0] = Colors.GREEN
+            self._hand2_over = False
+            self._hand2_points = self._hand_points(0)
+            self.pointer_2 = vectorio.Polygon(
+                pixel_shader=self._hand2_palette,
+                points=self._hand2_points,
             )
-            self._hands_group.append(pointer_2)
+            self._hands_group.append(self.pointer_2)
 
         # Define alarm points
         self._alarm1_palette = displayio.Palette(1)
         self._alarm1_palette[0] = Colors.ORANGE
-        if self._alarm1 != None:
-            x0, y0 = self.dial_to_pixel(
-                self._alarm1, center=self._center, radius=self._outside_radius
-            )
-            self._alarm1_palette.make_opaque(0)
-        else:
-            x0 = y0 = 0
-            self._alarm1_palette.make_transparent(0)
-
+        self._alarm1_palette.make_transparent(0)
         self.alarm1_marker = vectorio.Circle(
             pixel_shader=self._alarm1_palette,
-            radius=point_radius,
-            x=x0,
-            y=y0,
+            radius=self._point_radius,
+            x=0,
+            y=0,
         )
         scale_group.append(self.alarm1_marker)
 
         self._alarm2_palette = displayio.Palette(1)
         self._alarm2_palette[0] = Colors.GREEN
-        if self._alarm2 != None:
-            x0, y0 = self.dial_to_pixel(
-                self._alarm2, center=self._center, radius=self._outside_radius
-            )
-            self._alarm2_palette.make_opaque(0)
-        else:
-            x0 = y0 = 0
-            self._alarm2_palette.make_transparent(0)
-
+        self._alarm2_palette.make_transparent(0)
         self.alarm2_marker = vectorio.Circle(
             pixel_shader=self._alarm2_palette,
-            radius=point_radius,
-            x=x0,
-            y=y0,
+            radius=self._point_radius,
+            x=0,
+            y=0,
         )
         scale_group.append(self.alarm2_marker)
 
@@ -305,89 +519,80 @@ class Scale(displayio.Group):
         )
         pivot_group.append(pivot)
 
-        super().__init__()
         self.append(scale_group)
         self.append(self._hands_group)
         self.append(pivot_group)
-        return
-
-    @property
-    def center(self):
-        """Normalized display coordinates of object center."""
-        return self._center_norm
-
-    @property
-    def size(self):
-        """Normalized object size."""
-        return self._size
-
-    @property
-    def max_scale(self):
-        """Maximum scale value."""
-        return self._max_scale
 
     @property
-    def display_size(self):
-        """Size of display."""
-        return (self.WIDTH, self.HEIGHT)
-
-    @property
-    def hand1(self):
-        """Currently displayed hand1 value."""
-        return self._hand1
-
-    @hand1.setter
-    def hand1(self, value=0):
-        self._show_hands(hand1=value, hand2=self._hand2)
-
-    @property
-    def hand2(self):
-        """Currently displayed hand2 value."""
-        return self._hand2
-
-    @hand2.setter
-    def hand2(self, value=0):
-        self._show_hands(self._hand1, hand2=value)
-
-    @property
-    def alarm1(self):
-        """Current alarm1 value."""
-        return self._alarm1
-
-    @alarm1.setter
-    def alarm1(self, value=None):
-        self._alarm1 = value
-        self._alarm1_palette[0] = Colors.ORANGE
-        if self._alarm1 != None:
-            self.alarm1_marker.x, self.alarm1_marker.y = self.dial_to_pixel(
-                self._alarm1, center=self._center, radius=self._outside_radius
+    def materialized(self):
+        """True if the widget's displayio objects are built."""
+        return self._materialized
+
+    def materialize(self):
+        """Build the widget's displayio objects and show the current hand and
+        alarm values. Does nothing if the widget is already materialized."""
+        if self._materialized:
+            return
+        self._materialized = True
+        hand1, hand2 = self._hand1, self._hand2
+        alarm1, alarm2 = self._alarm1, self._alarm2
+        self._hand1 = self._hand2 = 0
+        self._alarm1 = self._alarm2 = None
+        self._build()
+        self._show_hands(hand1=hand1, hand2=hand2)
+        self._show_alarms(alarm1=alarm1, alarm2=alarm2)
+        self._mark_dirty_widget()
+
+    def release(self):
+        """Remove and free the widget's displayio objects and font while
+        keeping its hand and alarm values. The widget is rebuilt by
+        materialize() or the next hand or alarm value change."""
+        if not self._materialized:
+            return
+        self._materialized = False
+        self._mark_dirty_widget()
+        while len(self):
+            self.pop()
+        self._release_font()
+        self._hands_group = None
+        self.riser = self.plate = None
+        self.pointer_1 = self.pointer_2 = None
+        self.alarm1_marker = self.alarm2_marker = None
+        self._hand1_palette = self._hand2_palette = None
+        self._alarm1_palette = self._alarm2_palette = None
+
+    def _show_alarms(self, alarm1=None, alarm2=None):
+        """Display or hide the alarm markers. Only markers whose value changed
+        are moved.
+
+        :param float alarm1: The first alarm position or None to hide it.
+        :param float alarm2: The second alarm position or None to hide it."""
+        if not self._materialized:
+            self.materialize()
+        if alarm1 != self._alarm1:
+            self._alarm1 = self._show_alarm(
+                self.alarm1_marker, self._alarm1_palette, self._alarm1, alarm1
+            )
+        if alarm2 != self._alarm2 and self._num_hands == 2:
+            self._alarm2 = self._show_alarm(
+                self.alarm2_marker, self._alarm2_palette, self._alarm2, alarm2
             )
-            self._alarm1_palette.make_opaque(0)
-        else:
-            self.alarm1_marker.x = self.alarm1_marker.y = 0
-            self._alarm1_palette.make_transparent(0)
-
-    @property
-    def alarm2(self):
-        """Current alarm2 value."""
-        if self._num_hands != 2:
-            return None
-        return self._alarm2
 
-    @alarm2.setter
-    def alarm2(self, value=None):
-        if self._num_hands != 2:
-            return
-        self._alarm2 = value
-        self._alarm2_palette[0] = Colors.GREEN
-        if self._alarm2 != None:
-            self.alarm2_marker.x, self.alarm2_marker.y = self.dial_to_pixel(
-                self._alarm2, center=self._center, radius=self._outside_radius
+    def _show_alarm(self, marker, palette, old_value, value):
+        """Move an alarm marker from old_value to value; returns value."""
+        if old_value != None:
+            self._mark_dirty_marker(marker)
+        if value != None:
+            marker.x, marker.y = self.dial_to_pixel(
+                value, center=self._center, radius=self._outside_radius
             )
-            self._alarm2_palette.make_opaque(0)
+            if old_value == None:
+                palette.make_opaque(0)
+            self._mark_dirty_marker(marker)
         else:
-            self.alarm2_marker.x = self.alarm2_marker.y = 0
-            self._alarm2_palette.make_transparent(0)
+            marker.x = marker.y = 0
+            palette.make_transparent(0)
+        return value
 
     def _show_hands(self, hand1=0, hand2=0):
         """Display hand(s) and move scale plate proportionally. Input
@@ -396,97 +601,127 @@ class Scale(displayio.Group):
 
         :param float hand1: The first hand position on the scale dial.
         :param float hand1: The second hand position on the scale dial."""
+        if not self._materialized:
+            self.materialize()
 
         # Move plate/riser
         if hand1 != self._hand1 or hand2 != self._hand2:
             plate_disp = self._plate_y - (min(2, max(-2, (hand1 + hand2))) * 0.10 / 2)
-            _, self.plate.y = self.cart_to_pixel(0.00, plate_disp, size=self._size)
-            self.riser.y = self.plate.y
-
-        # Draw hands
+            _, plate_y = self.cart_to_pixel(0.00, plate_disp, size=self._size)
+            if plate_y != self.plate.y:
+                self._mark_dirty_plate()
+                self.plate.y = plate_y
+                self.riser.y = self.plate.y
+                self._mark_dirty_plate()
+
+        # Draw hands; refill each hand's point buffer in place and reassign it
+        # to the existing polygon only when the hand's pixel vertices change.
+        # A palette change marks the hand dirty even if no vertex moves.
         if hand1 != self._hand1:
             self._hand1 = hand1
-            hand1_fill = hand1_outline = Colors.ORANGE
-            if self._hand1 != min(1.0, max(self._hand1, 0.0)):
-                hand1_outline = Colors.RED
-
-            x0, y0 = self.dial_to_pixel(
-                self._hand1, center=self._center, radius=self._outside_radius
-            )
-            x1, y1 = self.dial_to_pixel(
-                self._hand1 - 0.25, center=self._center, radius=self._base
-            )
-            x2, y2 = self.dial_to_pixel(
-                self._hand1 + 0.25, center=self._center, radius=self._base
-            )
-            pointer_1 = Triangle(
-                x0,
-                y0,
-                x1,
-                y1,
-                x2,
-                y2,
-                fill=hand1_fill,
-                outline=hand1_outline,
-            )
-            self._hands_group[0] = pointer_1
+            over = self._hand1 != min(1.0, max(self._hand1, 0.0))
+            if over != self._hand1_over:
+                self._hand1_over = over
+                self._hand1_palette[0] = Colors.RED if over else Colors.ORANGE
+                self._mark_dirty(dirty_rect.points_bounds(self._hand1_points))
+            self._move_hand(self.pointer_1, self._hand1_points, self._hand1)
 
         if hand2 != self._hand2:
             self._hand2 = hand2
-            hand2_fill = hand2_outline = None
             if self._num_hands == 2:
-                hand2_fill = hand2_outline = Colors.GREEN
-                if self._hand2 != min(1.0, max(self._hand2, 0.0)):
-                    hand2_outline = Colors.RED
-
-                x0, y0 = self.dial_to_pixel(
-                    self._hand2, center=self._center, radius=self._outside_radius
-                )
-                x1, y1 = self.dial_to_pixel(
-                    self._hand2 - 0.25, center=self._center, radius=self._base
-                )
-                x2, y2 = self.dial_to_pixel(
-                    self._hand2 + 0.25, center=self._center, radius=self._base
-                )
-                pointer_2 = Triangle(
-                    x0,
-                    y0,
-                    x1,
-                    y1,
-                    x2,
-                    y2,
-                    fill=hand2_fill,
-                    outline=hand2_outline,
-                )
-                self._hands_group[1] = pointer_2
+                over = self._hand2 != min(1.0, max(self._hand2, 0.0))
+                if over != self._hand2_over:
+                    self._hand2_over = over
+                    self._hand2_palette[0] = Colors.RED if over else Colors.GREEN
+                    self._mark_dirty(dirty_rect.points_bounds(self._hand2_points))
+                self._move_hand(self.pointer_2, self._hand2_points, self._hand2)
         return
 
+    def _hand_points(self, hand=0):
+        """Return a new point buffer with the three pixel vertices of a
+        pointer hand polygon.
+
+        :param float hand: The normalized hand position on the scale dial."""
+        return [
+            self.dial_to_pixel(hand, center=self._center, radius=self._outside_radius),
+            self.dial_to_pixel(hand - 0.25, center=self._center, radius=self._base),
+            self.dial_to_pixel(hand + 0.25, center=self._center, radius=self._base),
+        ]
+
+    def _move_hand(self, pointer, points, hand=0):
+        """Fill a hand's preallocated three-point buffer with the vertices of
+        the hand position and assign the same buffer to the pointer polygon.
+        Skipped if no vertex moved. The old and new hand areas are added to
+        the changed area.
+
+        :param vectorio.Polygon pointer: The hand's polygon.
+        :param list points: The hand's point buffer, last assigned to pointer.
+        :param float hand: The normalized hand position on the scale dial."""
+        tip = self.dial_to_pixel(hand, center=self._center, radius=self._outside_radius)
+        left = self.dial_to_pixel(hand - 0.25, center=self._center, radius=self._base)
+        right = self.dial_to_pixel(hand + 0.25, center=self._center, radius=self._base)
+        if tip == points[0] and left == points[1] and right == points[2]:
+            return
+        old_bounds = dirty_rect.points_bounds(points)
+        points[0] = tip
+        points[1] = left
+        points[2] = right
+        self._mark_dirty(dirty_rect.union(old_bounds, dirty_rect.points_bounds(points)))
+        pointer.points = points
+
+    def _mark_dirty_plate(self):
+        """Add the current plate and riser areas to the changed area."""
+        self._mark_dirty(
+            dirty_rect.union(
+                dirty_rect.rect_bounds(
+                    self.plate.x, self.plate.y, self._plate_size[0], self._plate_size[1]
+                ),
+                dirty_rect.rect_bounds(
+                    self.riser.x, self.riser.y, self._riser_size[0], self._riser_size[1]
+                ),
+            )
+        )
+
+    def _mark_dirty_widget(self):
+        """Add the whole widget area, including the plate's highest position
+        and the alarm markers, to the changed area."""
+        (x0, y0), (x1, y1) = self._coords.cart_points_to_pixel(
+            ((-0.5, 0.75), (0.5, -0.58)), self._center, self._size
+        )
+        self._mark_dirty(
+            dirty_rect.union(
+                (x0 - 1, y0 - 1, x1 + 2, y1 + 2),
+                dirty_rect.circle_bounds(
+                    self._center[0],
+                    self._center[1],
+                    self._outside_radius + 1 + self._point_radius,
+                ),
+            )
+        )
+
+    def _mark_dirty_marker(self, marker):
+        """Add an alarm marker's current area to the changed area."""
+        self._mark_dirty(
+            dirty_rect.circle_bounds(marker.x, marker.y, self._point_radius)
+        )
+
     def display_to_pixel(self, width_factor=0, height_factor=0, size=1.0):
         """Convert normalized display position input (0.0 to 1.0) to display
         pixel position."""
-        return int(round(size * self.WIDTH * width_factor, 0)), int(
-            round(size * self.HEIGHT * height_factor, 0)
-        )
+        return self._coords.display_to_pixel(width_factor, height_factor, size)
 
     def dial_to_pixel(self, dial_factor, center=(0, 0), radius=0):
         """Convert normalized dial_factor input (-1.0 to 1.0) to display pixel
         position on the circumference of the dial's circle with center
-        (x,y pixels) and radius (pixels)."""
-        rads = (-2 * pi) * (dial_factor)  # convert scale_factor to radians
-        rads = rads + (pi / 2)  # rotate axis counterclockwise
-        x = center[0] + int(cos(rads) * radius)
-        y = center[1] - int(sin(rads) * radius)
-        return x, y
+        (x,y pixels) and radius (pixels). Uses the shared trig_table angle
+        lookup."""
+        return trig_table.dial_to_pixel(dial_factor, center, radius)
 
     def cart_to_pixel(self, x, y, size=1.0):
         """Convert normalized cartesian position value (-0.5, to + 0.5) to display
         pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        x1 = int(round(min_axis * size * x, 0)) + self._center[0]
-        y1 = self._center[1] - int(round(min_axis * size * y, 0))
-        return x1, y1
+        return self._coords.cart_to_pixel(x, y, self._center, size)
 
     def cart_dist_to_pixel(self, distance=0, size=1.0):
         """Convert normalized cartesian distance value to display pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        return int(round(min_axis * size * distance, 0))
+        return self._coords.cart_dist_to_pixel(distance, size)
@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# scheduler.py
+# 2026-10-18 v1.0
+
+import time
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+_NS_PER_SECOND = 1000000000
+
+
+class _Entry:
+    def __init__(self, widget, update, rate, budget, name):
+        """A registered widget update and its statistics."""
+        self.widget = widget
+        self.update = update
+        self.period_ns = int(_NS_PER_SECOND / rate)
+        self.budget_ns = int(budget * _NS_PER_SECOND) if budget else self.period_ns
+        self.name = name
+        self.updates = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.task = None
+
+
+class Scheduler:
+    def __init__(self, display=None, frame_rate=30):
+        """Run widget update functions concurrently under asyncio, each at its
+        own target rate, and refresh the display at most once per frame when
+        any widget has changed. Widget updates that exceed their time budget
+        are counted as overruns and update periods missed while behind
+        schedule are counted as skipped.
+
+        :param display: The display to refresh, such as board.DISPLAY. Its
+        auto_refresh is turned off while the scheduler runs. If None, the
+        host's integral display is used.
+        :param float frame_rate: The maximum display refresh rate in frames per
+        second. Defaults to 30."""
+        if display is None:
+            import board
+
+            if "DISPLAY" in dir(board):
+                display = board.DISPLAY
+            else:
+                raise ValueError("No integral display. Specify display.")
+        if frame_rate <= 0:
+            raise ValueError("Frame rate must be greater than 0.")
+        self._display = display
+        self._frame_ns = int(_NS_PER_SECOND / frame_rate)
+        self._entries = []
+        self._pending = False
+        self._running = False
+        self.frames = 0
+
+    @property
+    def display(self):
+        """The display refreshed by the scheduler."""
+        return self._display
+
+    @property
+    def frame_rate(self):
+        """The maximum display refresh rate in frames per second."""
+        return _NS_PER_SECOND / self._frame_ns
+
+    def add(self, widget, update, rate=10, budget=None, name=None):
+        """Register a widget update function. update(widget) is called rate
+        times per second and may be a plain function or a coroutine function.
+        Coroutine updates are timed from start to completion, including time
+        spent awaiting.
+
+        :param widget: The widget to update.
+        :param update: The function called with the widget as its only
+        argument.
+        :param float rate: The target update rate in updates per second.
+        Defaults to 10.
+        :param float budget: The update execution time budget in seconds.
+        Defaults to None (the update period, 1 / rate).
+        :param str name: The widget name used in stats(). Defaults to the
+        widget's class name followed by its registration index."""
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0.")
+        if name is None:
+            name = "%s_%d" % (type(widget).__name__, len(self._entries))
+        entry = _Entry(widget, update, rate, budget, name)
+        self._entries.append(entry)
+        if self._running:
+            entry.task = asyncio.create_task(self._run_entry(entry))
+        return name
+
+    def remove(self, name):
+        """Stop and unregister the widget update registered with name."""
+        for entry in self._entries:
+            if entry.name == name:
+                if entry.task is not None:
+                    entry.task.cancel()
+                self._entries.remove(entry)
+                return
+        raise ValueError("No widget update named %s." % name)
+
+    def stats(self):
+        """Return a dictionary of per-widget update statistics keyed by name:
+        updates, overruns (updates over budget), skipped (periods missed
+        while behind schedule), and average and maximum update time in
+        microseconds."""
+        report = {}
+        for entry in self._entries:
+            report[entry.name] = {
+                "updates": entry.updates,
+                "overruns": entry.overruns,
+                "skipped": entry.skipped,
+                "avg_us": entry.total_ns // max(1, entry.updates) // 1000,
+                "max_us": entry.max_ns // 1000,
+            }
+        return report
+
+    async def run(self, duration=None):
+        """Run all registered widget updates and the display refresh loop.
+
+        :param float duration: Stop after duration seconds. Defaults to None
+        (run until cancelled)."""
+        auto_refresh = getattr(self._display, "auto_refresh", None)
+        if auto_refresh is not None:
+            self._display.auto_refresh = False
+        self._running = True
+        for entry in self._entries:
+            entry.task = asyncio.create_task(self._run_entry(entry))
+        try:
+            if duration is None:
+                await self._refresh_loop(None)
+            else:
+                await self._refresh_loop(
+                    time.monotonic_ns() + int(duration * _NS_PER_SECOND)
+                )
+        finally:
+            self._running = False
+            for entry in self._entries:
+                if entry.task is not None:
+                    entry.task.cancel()
+                    entry.task = None
+            if auto_refresh is not None:
+                self._display.auto_refresh = auto_refresh
+
+    async def _refresh_loop(self, stop_ns):
+        """Refresh the display once per frame if any widget has changed."""
+        next_ns = time.monotonic_ns()
+        while stop_ns is None or next_ns < stop_ns:
+            next_ns += self._frame_ns
+            if self._pending:
+                self._pending = False
+                self._display.refresh()
+                self.frames += 1
+            now = time.monotonic_ns()
+            if now > next_ns:
+                next_ns = now
+            await asyncio.sleep((next_ns - now) / _NS_PER_SECOND)
+        if self._pending:
+            self._pending = False
+            self._display.refresh()
+            self.frames += 1
+
+    async def _run_entry(self, entry):
+        """Call a widget update at its target rate and record its timing."""
+        clear_dirty_rect = getattr(entry.widget, "clear_dirty_rect", None)
+        apply_pending = getattr(entry.widget, "apply_pending", None)
+        next_ns = time.monotonic_ns()
+        while True:
+            start = time.monotonic_ns()
+            result = entry.update(entry.widget)
+            if result is not None and hasattr(result, "send"):
+                await result
+            if apply_pending is not None:
+                apply_pending()  # Show values held back by the widget's max_rate
+            elapsed = time.monotonic_ns() - start
+            entry.updates += 1
+            entry.total_ns += elapsed
+            if elapsed > entry.max_ns:
+                entry.max_ns = elapsed
+            if elapsed > entry.budget_ns:
+                entry.overruns += 1
+
+            # Request a refresh only if the widget changed the display
+            if clear_dirty_rect is None or clear_dirty_rect() is not None:
+                self._pending = True
+
+            next_ns += entry.period_ns
+            now = time.monotonic_ns()
+            if now > next_ns:
+                missed = (now - next_ns) // entry.period_ns
+                entry.skipped += missed
+                next_ns += missed * entry.period_ns
+            await asyncio.sleep(max(0, next_ns - now) / _NS_PER_SECOND)
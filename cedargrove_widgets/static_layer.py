@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# static_layer.py
+# 2026-10-18 v1.0
+
+import struct
+import displayio
+
+try:
+    import bitmaptools
+except ImportError:
+    bitmaptools = None
+
+# Static layer file header: magic, format version, width, height, x, y, colors
+_HEADER = "<4sBHHhhB"
+_MAGIC = b"CGSL"
+_VERSION = 1
+
+
+def flatten(group):
+    """Render the TileGrids of a group, including those of nested groups such
+    as Labels, into a single indexed bitmap the size of the group's bounding
+    box. Palette index 0 is transparent. Returns a (bitmap, palette, x, y)
+    tuple where x, y is the bitmap's upper left corner in the group's
+    coordinates, or None if the group is empty.
+
+    :param displayio.Group group: The group of static layers to flatten."""
+    layers = []
+    _collect(group, 0, 0, 1, layers)
+    if not layers:
+        return None
+    x0 = min(layer[1] for layer in layers)
+    y0 = min(layer[2] for layer in layers)
+    x1 = max(layer[1] + layer[3] for layer in layers)
+    y1 = max(layer[2] + layer[4] for layer in layers)
+    width = x1 - x0
+    height = y1 - y0
+
+    colors = [0x000000]  # Index 0 is transparent
+    pixels = bytearray(width * height)
+    for grid, x, y, _, _, scale in layers:
+        shader = grid.pixel_shader
+        # Map source color indices to flattened indices once per layer
+        index_map = []
+        for index in range(len(shader)):
+            if shader.is_transparent(index):
+                index_map.append(0)
+                continue
+            color = shader[index]
+            if color not in colors[1:]:
+                colors.append(color)
+            index_map.append(colors.index(color, 1))
+        _render(grid, x - x0, y - y0, scale, index_map, pixels, width)
+
+    if len(colors) > 255:
+        raise ValueError("Static layer requires too many colors.")
+    return _to_bitmap(pixels, width, height, colors) + (x0, y0)
+
+
+def save(path, bitmap, palette, x=0, y=0):
+    """Write a flattened static layer to a file. Returns True if the file was
+    written or False if the filesystem is read-only or the path is invalid.
+
+    :param str path: The file path.
+    :param displayio.Bitmap bitmap: The flattened bitmap.
+    :param displayio.Palette palette: The flattened bitmap's palette.
+    :param integer x: The bitmap's upper left corner x offset.
+    :param integer y: The bitmap's upper left corner y offset."""
+    pixels = bytearray(bitmap.width * bitmap.height)
+    i = 0
+    for row in range(bitmap.height):
+        for col in range(bitmap.width):
+            pixels[i] = bitmap[col, row]
+            i += 1
+    try:
+        with open(path, "wb") as layer_file:
+            layer_file.write(
+                struct.pack(
+                    _HEADER,
+                    _MAGIC,
+                    _VERSION,
+                    bitmap.width,
+                    bitmap.height,
+                    x,
+                    y,
+                    len(palette),
+                )
+            )
+            for index in range(len(palette)):
+                layer_file.write(struct.pack("<I", palette[index])[:3])
+            layer_file.write(pixels)
+    except OSError:
+        return False
+    return True
+
+
+def load(path):
+    """Read a static layer file written by save(). Returns a (bitmap, palette,
+    x, y) tuple or None if the file is missing or not a valid layer file.
+
+    :param str path: The file path."""
+    try:
+        with open(path, "rb") as layer_file:
+            header = layer_file.read(struct.calcsize(_HEADER))
+            if len(header) != struct.calcsize(_HEADER):
+                return None
+            magic, version, width, height, x, y, count = struct.unpack(
+                _HEADER, header
+            )
+            if magic != _MAGIC or version != _VERSION:
+                return None
+            colors = []
+            for _ in range(count):
+                colors.append(struct.unpack("<I", layer_file.read(3) + b"\0")[0])
+            pixels = layer_file.read(width * height)
+    except (OSError, struct.error):
+        return None
+    if len(pixels) != width * height:
+        return None
+    return _to_bitmap(pixels, width, height, colors) + (x, y)
+
+
+def tile_grid(layer, x_offset=0, y_offset=0):
+    """Return a TileGrid showing a (bitmap, palette, x, y) static layer offset
+    by x_offset, y_offset pixels."""
+    bitmap, palette, x, y = layer
+    return displayio.TileGrid(
+        bitmap, pixel_shader=palette, x=x + x_offset, y=y + y_offset
+    )
+
+
+def _collect(layer, x, y, scale, layers):
+    """Append (grid, x, y, width, height, scale) for every visible TileGrid
+    in layer, with positions in the outermost group's coordinates."""
+    if layer.hidden:
+        return
+    if isinstance(layer, displayio.TileGrid):
+        x += layer.x * scale
+        y += layer.y * scale
+        width = layer.width * layer.tile_width * scale
+        height = layer.height * layer.tile_height * scale
+        layers.append((layer, x, y, width, height, scale))
+    elif isinstance(layer, displayio.Group):
+        x += layer.x * scale
+        y += layer.y * scale
+        scale *= layer.scale
+        for child in layer:
+            _collect(child, x, y, scale, layers)
+    else:
+        raise ValueError("Only TileGrid and Group layers can be flattened.")
+
+
+def _render(grid, x, y, scale, index_map, pixels, stride):
+    """Draw a TileGrid's opaque pixels into the pixels buffer at x, y."""
+    bitmap = grid.bitmap
+    tile_width = grid.tile_width
+    tile_height = grid.tile_height
+    tiles_per_row = bitmap.width // tile_width
+    for tile_y in range(grid.height):
+        for tile_x in range(grid.width):
+            tile = grid[tile_x, tile_y]
+            src_x = (tile % tiles_per_row) * tile_width
+            src_y = (tile // tiles_per_row) * tile_height
+            for row in range(tile_height):
+                dst_y = y + (tile_y * tile_height + row) * scale
+                for col in range(tile_width):
+                    index = index_map[bitmap[src_x + col, src_y + row]]
+                    if not index:
+                        continue
+                    dst_x = x + (tile_x * tile_width + col) * scale
+                    for sy in range(scale):
+                        offset = (dst_y + sy) * stride + dst_x
+                        for sx in range(scale):
+                            pixels[offset + sx] = index
+
+
+def _to_bitmap(pixels, width, height, colors):
+    """Return a (bitmap, palette) pair from row-major color index bytes."""
+    palette = displayio.Palette(len(colors))
+    for index, color in enumerate(colors):
+        palette[index] = color
+    palette.make_transparent(0)
+    bitmap = displayio.Bitmap(width, height, max(2, len(colors)))
+    if bitmaptools is not None:
+        bitmaptools.arrayblit(bitmap, pixels)
+    else:
+        i = 0
+        for row in range(height):
+            for col in range(width):
+                if pixels[i]:
+                    bitmap[col, row] = pixels[i]
+                i += 1
+    return bitmap, palette
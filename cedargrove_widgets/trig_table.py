@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# trig_table.py
+# 2026-10-18 v1.0
+
+from array import array
+from math import pi, sin, cos
+
+# Shared angle table state; one table per process, built on first use
+_resolution = 1024
+_quarter = _resolution // 4
+_exact = False
+_sine = None
+
+
+def configure(resolution=1024, exact=False):
+    """Set the resolution and mode of the shared angle table used by all
+    widgets. Call before instantiating widgets; an existing table is
+    discarded and rebuilt on next use if the resolution changes.
+
+    :param integer resolution: The number of table steps per full dial
+    revolution. Must be a positive multiple of 4. Defaults to 1024 steps.
+    :param bool exact: Bypass the table and calculate dial positions with
+    math.sin and math.cos for verification. Defaults to False."""
+    global _resolution, _quarter, _exact, _sine
+    if resolution < 4 or resolution % 4:
+        raise ValueError("Resolution must be a positive multiple of 4.")
+    if resolution != _resolution:
+        _sine = None
+    _resolution = resolution
+    _quarter = resolution // 4
+    _exact = exact
+
+
+def resolution():
+    """The current number of table steps per full dial revolution."""
+    return _resolution
+
+
+def exact():
+    """True if dial positions are calculated with exact trigonometry."""
+    return _exact
+
+
+def _build_table():
+    """Build the shared sine table for one full dial revolution plus a
+    quarter-revolution overlap so cosine lookups never wrap."""
+    global _sine
+    step = 2 * pi / _resolution
+    _sine = array(
+        "f", [sin(i * step) for i in range(_resolution + _quarter + 1)]
+    )
+    return _sine
+
+
+def dial_to_pixel(dial_factor, center=(0, 0), radius=0):
+    """Convert normalized dial_factor input (-1.0 to 1.0) to display pixel
+    position on the circumference of the dial's circle with center
+    (x,y pixels) and radius (pixels). Zero is at the top of the dial and
+    positive values rotate clockwise."""
+    if _exact:
+        rads = (-2 * pi) * (dial_factor)  # convert scale_factor to radians
+        rads = rads + (pi / 2)  # rotate axis counterclockwise
+        return center[0] + int(cos(rads) * radius), center[1] - int(
+            sin(rads) * radius
+        )
+
+    table = _sine
+    if table is None:
+        table = _build_table()
+    # cos(pi/2 - a) == sin(a) and sin(pi/2 - a) == cos(a)
+    i = int((dial_factor * _resolution) % _resolution + 0.5)
+    return center[0] + int(table[i] * radius), center[1] - int(
+        table[i + _quarter] * radius
+    )
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# value_filter.py
+# 2026-10-18 v1.3
+
+import time
+
+
+def _is_number(value):
+    """True if value is an int or float, excluding bool."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ValueFilter:
+    def __init__(self, deadband=0, max_rate=None):
+        """Decide which widget value changes are displayed. A change smaller
+        than the deadband is suppressed and discarded. A change arriving
+        faster than max_rate is suppressed but recorded as pending, so the
+        latest value can be displayed by release() once the rate window
+        opens. Counts applied and suppressed changes.
+
+        :param float deadband: The minimum change from the displayed value,
+        in widget units, that is displayed. Defaults to 0 (any change).
+        :param float max_rate: The maximum number of displayed changes per
+        second. Defaults to None (no limit)."""
+        self.deadband = deadband
+        self.max_rate = max_rate
+        self.applied = 0
+        self.suppressed = 0
+        self._pending = {}
+        self._next_ns = 0
+
+    @property
+    def deadband(self):
+        """The minimum displayed change in widget units."""
+        return self._deadband
+
+    @deadband.setter
+    def deadband(self, deadband=0):
+        if deadband < 0:
+            raise ValueError("Deadband must be 0 or greater.")
+        self._deadband = deadband
+
+    @property
+    def max_rate(self):
+        """The maximum number of displayed changes per second or None."""
+        return self._max_rate
+
+    @max_rate.setter
+    def max_rate(self, max_rate=None):
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("Max rate must be greater than 0 or None.")
+        self._max_rate = max_rate
+        self._interval_ns = int(1000000000 / max_rate) if max_rate else 0
+        self._next_ns = 0
+
+    @property
+    def pending(self):
+        """True if a rate-limited value is waiting to be displayed."""
+        return bool(self._pending)
+
+    def submit(self, name, value, shown):
+        """Return True if value should be displayed now in place of the shown
+        value. Rate-limited values are recorded as pending under name.
+
+        :param str name: The widget value name, such as "hand1".
+        :param value: The new value. The deadband applies only when value
+        and shown are both numbers; any other value, such as None or a
+        string, is always a change.
+        :param shown: The currently displayed value."""
+        if not self._deadband and not self._interval_ns:
+            self._pending.pop(name, None)
+            self.applied += 1
+            return True
+        if (
+            self._deadband
+            and _is_number(value)
+            and _is_number(shown)
+            and abs(value - shown) < self._deadband
+        ):
+            self._pending.pop(name, None)
+            self.suppressed += 1
+            return False
+        if self._interval_ns:
+            now = time.monotonic_ns()
+            if now < self._next_ns:
+                self._pending[name] = value
+                self.suppressed += 1
+                return False
+            self._next_ns = now + self._interval_ns
+        self._pending.pop(name, None)
+        self.applied += 1
+        return True
+
+    def discard(self, name):
+        """Drop the pending value of name, if any. Call when a value is
+        displayed without submit() so that release() cannot later replace it
+        with an older one.
+
+        :param str name: The widget value name, such as "hand1"."""
+        self._pending.pop(name, None)
+
+    def release(self):
+        """Return a dictionary of the pending values by name if the rate
+        window is open, otherwise None. Returned values are no longer
+        pending."""
+        if not self._pending:
+            return None
+        now = time.monotonic_ns()
+        if now < self._next_ns:
+            return None
+        self._next_ns = now + self._interval_ns
+        pending = self._pending
+        self._pending = {}
+        self.applied += len(pending)
+        return pending
+
+
+class ValueFilterMixin:
+    """Deadband and rate-limit properties of a widget that filters its value
+    changes through self._value_filter. The widget displays released
+    pending values with _show_pending()."""
+
+    @property
+    def deadband(self):
+        """Minimum displayed value change."""
+        return self._value_filter.deadband
+
+    @deadband.setter
+    def deadband(self, deadband=0):
+        self._value_filter.deadband = deadband
+
+    @property
+    def max_rate(self):
+        """Maximum displayed value changes per second or None."""
+        return self._value_filter.max_rate
+
+    @max_rate.setter
+    def max_rate(self, max_rate=None):
+        self._value_filter.max_rate = max_rate
+
+    @property
+    def update_counts(self):
+        """Tuple of the number of applied and suppressed value changes."""
+        return (self._value_filter.applied, self._value_filter.suppressed)
+
+    def apply_pending(self):
+        """Display the latest rate-limited values if the max_rate window has
+        opened. Call periodically when max_rate is set."""
+        pending = self._value_filter.release()
+        if pending:
+            self._show_pending(pending)
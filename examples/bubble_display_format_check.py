@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# bubble_display_format_check.py
+# 2026-10-18 v1.1
+
+# Checks the BubbleDisplay numeric formatter against the expected digits of
+# each notation, precision and fallback case. Runs on a host board from the
+# REPL with `import bubble_display_format_check` or under CPython with the
+# headless stand-in:
+#
+#     python examples/bubble_display_format_check.py
+
+import sys
+
+if sys.implementation.name == "cpython":
+    # Use the headless displayio stand-in
+    import os
+
+    _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path[:0] = [os.path.join(_root, "headless"), _root]
+    os.environ.setdefault("HEADLESS_ROOT", os.path.join(_root, "7.x_scale_bundle"))
+
+import board
+
+from cedargrove_widgets.bubble_display import BubbleDisplay, SEGMENTS
+
+# (digits, widget parameters, value, expected text); a "." follows the digit
+# holding the decimal point, or is a digit of its own in HP-35 mode
+CASES = (
+    (1, {}, 0, "0"),
+    (1, {}, 12, "-"),  # Too wide for one digit
+    (1, {}, -3, "-"),
+    (1, {"precision": 2}, 7, "-"),
+    (1, {"notation": "Scientific"}, 0, "0"),
+    (1, {"notation": "Scientific"}, 12, "-"),
+    (1, {"notation": "Engineering", "mode": "HP-35"}, 1e20, "-"),
+    (2, {}, 12, "12"),
+    (2, {}, -3, "-3"),
+    (2, {"precision": 2}, 7, "--"),
+    (2, {"notation": "Scientific"}, 1e20, "--"),
+    (2, {"notation": "Engineering"}, 0.5, "0.5"),
+    (5, {}, 12345, "12345"),
+    (5, {}, -1234, "-1234"),
+    (5, {}, -0.5, "  -0.5"),
+    (5, {}, -12345, "-1 04"),  # Falls back to scientific
+    (5, {}, 123456, "1.2 05"),
+    (5, {}, float("nan"), "-----"),
+    (5, {}, None, "     "),
+    (5, {}, "12", "   12"),  # Non-numeric values are shown as text
+    (5, {}, "1.5", "   1.5"),
+    (5, {"mode": "HP-35"}, "1.5", "  1.5"),
+    (5, {"leading_zeros": True}, 42, "00042"),
+    (5, {"notation": "Scientific"}, 999.96, " 1 03"),
+    (5, {"notation": "Engineering"}, 123, "  123"),  # Mantissa alone fits
+    (5, {"notation": "Engineering"}, 1234, "1.2 03"),
+    (5, {"notation": "Engineering"}, 1e20, " 1 20"),
+    (5, {"notation": "Engineering", "mode": "HP-35"}, 0.5, "  0.5"),
+    (5, {"notation": "Scientific", "precision": 2}, 0, "  0.00"),
+    (5, {"notation": "Engineering", "precision": 2}, 0, "  0.00"),
+    (5, {"notation": "Scientific", "precision": 2, "mode": "HP-35"}, 123, " 1 02"),
+    (8, {"notation": "Engineering"}, 123, "  123 00"),
+    (8, {"notation": "Engineering"}, 1e20, "  100 18"),
+    (8, {"notation": "Engineering"}, 0.5, "  500-03"),
+    (8, {"notation": "Engineering"}, 999999.7, "    1 06"),
+    (8, {"notation": "Engineering"}, 0.00099999, "999.99-06"),
+    (8, {"notation": "Engineering", "precision": 2}, 123, "123.00 00"),
+    (8, {"notation": "Engineering", "precision": 2, "mode": "HP-35"}, 123, "  123.00"),
+    (8, {"notation": "Scientific", "precision": 2}, 0, "  0.00 00"),
+    (8, {"notation": "Scientific"}, 5e-324, "4.941-324"),
+)
+
+
+def expected_masks(text, hp_35=False):
+    """Return the segment masks of expected text, merging each decimal point
+    into the digit to its left unless in HP-35 mode."""
+    masks = bytearray()
+    for char in text:
+        if char == "." and not hp_35 and masks:
+            masks[-1] |= SEGMENTS[ord(".")]
+        else:
+            masks.append(SEGMENTS[ord(char)])
+    return masks
+
+
+def check():
+    """Display each case and return the number of mismatches."""
+    display_size = (board.DISPLAY.width, board.DISPLAY.height)
+    failures = 0
+    for digits, params, value, text in CASES:
+        units = 2 if digits == 8 else 1
+        widget = BubbleDisplay(
+            units=units, digits=digits // units, display_size=display_size, **params
+        )
+        widget.value = value
+        masks = bytes(widget._masks)
+        if masks != expected_masks(text, params.get("mode") == "HP-35"):
+            failures += 1
+            print("FAIL", digits, params, repr(value), "expected", repr(text))
+    print("%d of %d cases passed" % (len(CASES) - failures, len(CASES)))
+    return failures
+
+
+if __name__ == "__main__" and sys.implementation.name == "cpython":
+    sys.exit(1 if check() else 0)
+else:
+    check()
@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# dirty_rect_check.py
+# 2026-10-18 v1.0
+
+# Checks that every widget's dirty_rect encloses all of the display pixels
+# changed by each update. Each widget is updated with a seeded sequence of
+# values, including hands crossing the 0 to 1.0 range without moving and
+# magic eye overlap changes, and the headless framebuffer is compared before
+# and after every update. Runs under CPython with the headless stand-in:
+#
+#     python examples/dirty_rect_check.py
+
+import os
+import random
+import sys
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [
+    os.path.join(_root, "headless"),
+    _root,
+    os.path.join(_root, "in_development"),
+]
+os.environ.setdefault("HEADLESS_ROOT", os.path.join(_root, "7.x_scale_bundle"))
+
+import board
+
+from cedargrove_widgets.scale import Scale
+from cedargrove_widgets.magic_eye import MagicEye
+from cedargrove_widgets.bubble_display import BubbleDisplay
+from cedargrove_widgets.bargraph import Bargraph
+from cedargrove_widgets.neopixel import NeoPixel
+
+UPDATES = 200  # Updates checked per widget
+
+
+def _changed_bounds(before, after):
+    """Return the (x0, y0, x1, y1) bounds of the pixels that differ between
+    two framebuffers, with x1 and y1 exclusive, or None if identical."""
+    changed = (before != after).reshape(before.shape[0], before.shape[1], -1)
+    rows, columns = changed.any(axis=2).nonzero()
+    if not len(rows):
+        return None
+    return (columns.min(), rows.min(), columns.max() + 1, rows.max() + 1)
+
+
+def check(name, widget, update):
+    """Apply UPDATES updates to widget and return the number of updates that
+    changed pixels outside of the reported dirty_rect."""
+    display = board.DISPLAY
+    display.show(widget)
+    widget.clear_dirty_rect()
+    before = display.refresh().copy()
+    failures = 0
+    for i in range(UPDATES):
+        update(widget, i)
+        rect = widget.clear_dirty_rect()
+        after = display.refresh().copy()
+        bounds = _changed_bounds(before, after)
+        if bounds is not None and (
+            rect is None
+            or bounds[0] < rect[0]
+            or bounds[1] < rect[1]
+            or bounds[2] > rect[0] + rect[2]
+            or bounds[3] > rect[1] + rect[3]
+        ):
+            failures += 1
+        before = after
+    print("%-24s %d of %d updates outside dirty_rect" % (name, failures, UPDATES))
+    return failures
+
+
+def _update_scale(widget, i):
+    step = i % 8
+    if step == 0:
+        widget.hand1 = random.random() * 1.2
+    elif step in (1, 6):
+        widget.hand2 = random.random()
+    elif step in (2, 4):
+        widget.hand1 = 1.0
+    elif step == 3:
+        widget.hand1 = 1.0001  # Over-range without moving a hand pixel
+    else:
+        widget.alarm1 = random.random() if step == 5 else None
+
+
+def _update_magic_eye(widget, i):
+    widget.value = random.random() * 2.0
+
+
+def _update_bubble_display(widget, i):
+    widget.value = random.randrange(0, 9999)
+
+
+def _update_bargraph(widget, i):
+    widget.value = random.random()
+
+
+def _update_neopixel(widget, i):
+    widget[random.randrange(len(widget))] = random.randrange(1 << 24)
+
+
+def run():
+    """Check every widget and return the total number of failed updates."""
+    random.seed(1)
+    display_size = (board.DISPLAY.width, board.DISPLAY.height)
+    cases = (
+        ("Scale", Scale(num_hands=2, display_size=display_size), _update_scale),
+        ("MagicEye", MagicEye(display_size=display_size), _update_magic_eye),
+        (
+            "MagicEye signal_step",
+            MagicEye(display_size=display_size, signal_step=0.01),
+            _update_magic_eye,
+        ),
+        (
+            "BubbleDisplay",
+            BubbleDisplay(display_size=display_size),
+            _update_bubble_display,
+        ),
+        (
+            "BubbleDisplay Palette",
+            BubbleDisplay(display_size=display_size, backend="Palette"),
+            _update_bubble_display,
+        ),
+        (
+            "Bargraph",
+            Bargraph(units=2, center=(10, 10), display_size=display_size),
+            _update_bargraph,
+        ),
+        (
+            "Bargraph DOT",
+            Bargraph(units=2, center=(10, 10), mode="DOT", display_size=display_size),
+            _update_bargraph,
+        ),
+        (
+            "NeoPixel",
+            NeoPixel(units=10, center=(10, 100), display_size=display_size),
+            _update_neopixel,
+        ),
+    )
+    return sum(check(name, widget, update) for name, widget, update in cases)
+
+
+if __name__ == "__main__":
+    sys.exit(1 if run() else 0)
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# scheduler_example.py
+# 2026-10-18 v1.1
+
+# For host board with integral display (PyPortal, Clue, FunHouse, etc.) or
+# under CPython with the headless stand-in:
+#
+#     python examples/scheduler_example.py
+
+import sys
+
+if sys.implementation.name == "cpython":
+    # Use the headless displayio stand-in
+    import os
+
+    _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path[:0] = [os.path.join(_root, "headless"), _root]
+    os.environ.setdefault("HEADLESS_ROOT", os.path.join(_root, "7.x_scale_bundle"))
+
+import asyncio
+import board
+import displayio
+import random
+
+from cedargrove_widgets.scale import Scale
+from cedargrove_widgets.magic_eye import MagicEye
+from cedargrove_widgets.bubble_display import BubbleDisplay
+from cedargrove_widgets.scheduler import Scheduler
+
+display = board.DISPLAY
+display_size = (display.width, display.height)
+
+# Instantiate the widgets on one screen
+scale = Scale(num_hands=2, center=(0.25, 0.40), size=0.4, display_size=display_size)
+magic_eye = MagicEye(center=(0.75, 0.40), size=0.35, display_size=display_size)
+bubble_display = BubbleDisplay(
+    center=(0.50, 0.85), size=1.2, display_size=display_size
+)
+
+screen = displayio.Group()
+screen.append(scale)
+screen.append(magic_eye)
+screen.append(bubble_display)
+display.show(screen)
+
+
+def update_scale(widget):
+    # Move both hands in one plate and hand recalculation
+    widget.update(hand1=random.random(), hand2=random.random())
+
+
+async def update_magic_eye(widget):
+    # Sweep the shadow wedge open and closed
+    for i in range(0, 200, 20):
+        widget.value = i / 100
+        await asyncio.sleep(0)
+
+
+def update_bubble_display(widget):
+    widget.value = random.randrange(0, 9999)
+
+
+# Each widget updates at its own rate; the display is refreshed at most
+# 30 times per second and only when a widget has changed
+scheduler = Scheduler(display, frame_rate=30)
+scheduler.add(scale, update_scale, rate=5, name="scale")
+scheduler.add(magic_eye, update_magic_eye, rate=20, name="magic_eye")
+scheduler.add(bubble_display, update_bubble_display, rate=2, name="bubble")
+
+while True:
+    asyncio.run(scheduler.run(duration=10))
+    for name, stats in scheduler.stats().items():
+        print(name, stats)
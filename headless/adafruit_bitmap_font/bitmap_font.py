@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# bitmap_font.py (headless stand-in)
+# 2026-10-18 v1.0
+
+"""Headless stand-in for adafruit_bitmap_font.bitmap_font. Loads BDF fonts
+and parses glyphs on first use."""
+
+import os
+from collections import namedtuple
+import displayio
+
+Glyph = namedtuple(
+    "Glyph",
+    ["bitmap", "tile_index", "width", "height", "dx", "dy", "shift_x", "shift_y"],
+)
+
+
+def _host_path(path):
+    """Map an absolute CIRCUITPY path onto HEADLESS_ROOT (or the current
+    directory) if it does not exist on the host."""
+    if os.path.exists(path) or not path.startswith("/"):
+        return path
+    return os.path.join(os.environ.get("HEADLESS_ROOT", "."), path.lstrip("/"))
+
+
+class BDF:
+    def __init__(self, path):
+        """A BDF font. Glyph bitmaps are parsed on first request."""
+        with open(_host_path(path), "r", encoding="latin-1") as bdf:
+            self._lines = bdf.read().splitlines()
+        self._glyphs = {}
+        self._starts = {}
+        self.ascent = 0
+        self.descent = 0
+        self._boundingbox = (0, 0, 0, 0)
+        start = None
+        for number, line in enumerate(self._lines):
+            if line.startswith("STARTCHAR"):
+                start = number
+            elif line.startswith("ENCODING") and start is not None:
+                self._starts[int(line.split()[1])] = start
+            elif line.startswith("FONTBOUNDINGBOX"):
+                self._boundingbox = tuple(int(n) for n in line.split()[1:5])
+            elif line.startswith("FONT_ASCENT"):
+                self.ascent = int(line.split()[1])
+            elif line.startswith("FONT_DESCENT"):
+                self.descent = int(line.split()[1])
+
+    def get_bounding_box(self):
+        """Return the font's (width, height, x_offset, y_offset) bounding box."""
+        return self._boundingbox
+
+    def load_glyphs(self, code_points):
+        """Parse the glyphs for a string or iterable of code points."""
+        if isinstance(code_points, int):
+            code_points = (code_points,)
+        for code_point in code_points:
+            if isinstance(code_point, str):
+                code_point = ord(code_point)
+            if code_point not in self._glyphs and code_point in self._starts:
+                self._glyphs[code_point] = self._parse(self._starts[code_point])
+
+    def get_glyph(self, code_point):
+        """Return the Glyph for code_point or None if not in the font."""
+        if code_point not in self._glyphs:
+            self.load_glyphs((code_point,))
+        return self._glyphs.get(code_point)
+
+    def _parse(self, number):
+        shift_x = width = height = dx = dy = 0
+        rows = None
+        for line in self._lines[number:]:
+            if line.startswith("DWIDTH"):
+                shift_x = int(line.split()[1])
+            elif line.startswith("BBX"):
+                width, height, dx, dy = (int(n) for n in line.split()[1:5])
+            elif line.startswith("BITMAP"):
+                rows = []
+            elif line.startswith("ENDCHAR"):
+                break
+            elif rows is not None:
+                rows.append(int(line, 16))
+        bitmap = displayio.Bitmap(max(1, width), max(1, height), 2)
+        pixels = bitmap.pixels
+        bits = ((width + 7) // 8) * 8
+        for y, row in enumerate(rows or ()):
+            for x in range(width):
+                if row & (1 << (bits - 1 - x)):
+                    pixels[y, x] = 1
+        return Glyph(bitmap, 0, width, height, dx, dy, shift_x, 0)
+
+
+def load_font(filename):
+    """Load a BDF font file."""
+    if not filename.lower().endswith(".bdf"):
+        raise ValueError("Only BDF fonts are supported by the headless stand-in")
+    return BDF(filename)
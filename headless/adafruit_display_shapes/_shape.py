@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# _shape.py (headless stand-in)
+# 2026-10-18 v1.0
+
+"""Common bitmap-backed shape base for the headless adafruit_display_shapes
+stand-ins. Palette index 0 is transparent, 1 is the fill color and 2 is the
+outline color."""
+
+import numpy as np
+import displayio
+
+
+class _BitmapShape(displayio.TileGrid):
+    def __init__(self, x, y, width, height, fill=None, outline=None):
+        self._palette = displayio.Palette(3)
+        self._palette.make_transparent(0)
+        super().__init__(
+            displayio.Bitmap(max(1, width), max(1, height), 3),
+            pixel_shader=self._palette,
+            x=x,
+            y=y,
+        )
+        self.fill = fill
+        self.outline = outline
+
+    def _set_color(self, index, color):
+        if color is None:
+            self._palette[index] = 0
+            self._palette.make_transparent(index)
+        else:
+            self._palette[index] = color
+            self._palette.make_opaque(index)
+
+    @property
+    def fill(self):
+        """The fill color or None for transparent."""
+        return self._fill
+
+    @fill.setter
+    def fill(self, color):
+        self._fill = color
+        self._set_color(1, color)
+
+    @property
+    def outline(self):
+        """The outline color or None for transparent."""
+        return self._outline
+
+    @outline.setter
+    def outline(self, color):
+        self._outline = color
+        self._set_color(2, color)
+
+    def _draw(self, fill_mask, outline_mask):
+        """Write fill (1) and outline (2) masks into the shape's bitmap."""
+        pixels = self.bitmap.pixels
+        pixels[:, :] = 0
+        pixels[fill_mask] = 1
+        pixels[outline_mask] = 2
+        self.bitmap.version += 1
+
+
+def _round_rect_mask(width, height, r):
+    """Boolean mask of a width x height rectangle with corner radius r."""
+    yy, xx = np.mgrid[0:height, 0:width]
+    r = max(0, min(r, width // 2, height // 2))
+    if r == 0:
+        return np.ones((height, width), dtype=bool)
+    cx = np.clip(xx, r, width - 1 - r)
+    cy = np.clip(yy, r, height - 1 - r)
+    return (xx - cx) ** 2 + (yy - cy) ** 2 <= r * r
+
+
+def _line_pixels(x0, y0, x1, y1):
+    """Bresenham line pixel coordinates from x0, y0 to x1, y1 inclusive."""
+    points = []
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        points.append((x0, y0))
+        if x0 == x1 and y0 == y1:
+            return points
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# circle.py (headless stand-in)
+# 2026-10-18 v1.0
+
+from adafruit_display_shapes.roundrect import RoundRect
+
+
+class Circle(RoundRect):
+    def __init__(self, x0, y0, r, *, fill=None, outline=None, stroke=1):
+        """A circle of radius r centered on x0, y0."""
+        super().__init__(
+            x0 - r,
+            y0 - r,
+            2 * r + 1,
+            2 * r + 1,
+            r,
+            fill=fill,
+            outline=outline,
+            stroke=stroke,
+        )
+        self.r = r
+
+    @property
+    def x0(self):
+        return self.x + self.r
+
+    @x0.setter
+    def x0(self, x0):
+        self.x = x0 - self.r
+
+    @property
+    def y0(self):
+        return self.y + self.r
+
+    @y0.setter
+    def y0(self, y0):
+        self.y = y0 - self.r
@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# line.py (headless stand-in)
+# 2026-10-18 v1.0
+
+from adafruit_display_shapes.polygon import Polygon
+
+
+class Line(Polygon):
+    def __init__(self, x0, y0, x1, y1, color):
+        """A one pixel wide line from x0, y0 to x1, y1."""
+        super().__init__([(x0, y0), (x1, y1)], outline=color, close=False)
+
+    @property
+    def color(self):
+        """The line color."""
+        return self.outline
+
+    @color.setter
+    def color(self, color):
+        self.outline = color
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# polygon.py (headless stand-in)
+# 2026-10-18 v1.0
+
+import numpy as np
+from vectorio import _polygon_mask
+from adafruit_display_shapes._shape import _BitmapShape, _line_pixels
+
+
+class Polygon(_BitmapShape):
+    def __init__(self, points, *, outline=None, fill=None, close=True):
+        """A polygon outline through a list of (x, y) points, optionally
+        filled."""
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        left, top = min(xs), min(ys)
+        width, height = max(xs) - left + 1, max(ys) - top + 1
+        super().__init__(left, top, width, height, fill=fill, outline=outline)
+        fill_mask = np.zeros((height, width), dtype=bool)
+        if fill is not None:
+            fx, fy, mask = _polygon_mask(points)
+            fill_mask[fy - top : fy - top + mask.shape[0], fx - left : fx - left + mask.shape[1]] = mask
+        outline_mask = np.zeros((height, width), dtype=bool)
+        edges = list(zip(points, points[1:] + (points[:1] if close else [])))
+        for (x0, y0), (x1, y1) in edges:
+            for px, py in _line_pixels(x0, y0, x1, y1):
+                outline_mask[py - top, px - left] = True
+        self._draw(fill_mask, outline_mask)
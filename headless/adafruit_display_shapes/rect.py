@@ -0,0 +1,15 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# rect.py (headless stand-in)
+# 2026-10-18 v1.0
+
+from adafruit_display_shapes.roundrect import RoundRect
+
+
+class Rect(RoundRect):
+    def __init__(self, x, y, width, height, *, fill=None, outline=None, stroke=1):
+        """A rectangle."""
+        super().__init__(
+            x, y, width, height, 0, fill=fill, outline=outline, stroke=stroke
+        )
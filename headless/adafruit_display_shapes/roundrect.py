@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# roundrect.py (headless stand-in)
+# 2026-10-18 v1.0
+
+from adafruit_display_shapes._shape import _BitmapShape, _round_rect_mask
+
+
+class RoundRect(_BitmapShape):
+    def __init__(self, x, y, width, height, r, *, fill=None, outline=None, stroke=1):
+        """A rectangle with rounded corners of radius r."""
+        super().__init__(x, y, width, height, fill=fill, outline=outline)
+        shape = _round_rect_mask(width, height, r)
+        inner = shape.copy()
+        if outline is not None and stroke > 0:
+            inner[:, :] = False
+            if width > 2 * stroke and height > 2 * stroke:
+                inner[stroke:-stroke, stroke:-stroke] = _round_rect_mask(
+                    width - 2 * stroke, height - 2 * stroke, max(0, r - stroke)
+                )
+        self._draw(inner, shape & ~inner)
@@ -0,0 +1,13 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# triangle.py (headless stand-in)
+# 2026-10-18 v1.0
+
+from adafruit_display_shapes.polygon import Polygon
+
+
+class Triangle(Polygon):
+    def __init__(self, x0, y0, x1, y1, x2, y2, *, fill=None, outline=None):
+        """A triangle through three vertices."""
+        super().__init__([(x0, y0), (x1, y1), (x2, y2)], outline=outline, fill=fill)
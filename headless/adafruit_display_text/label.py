@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# label.py (headless stand-in)
+# 2026-10-18 v1.0
+
+"""Headless stand-in for adafruit_display_text.label.Label. The text is
+rendered into a single bitmap, like bitmap_label.Label."""
+
+import displayio
+
+
+class Label(displayio.Group):
+    def __init__(
+        self,
+        font,
+        *,
+        text="",
+        color=0xFFFFFF,
+        background_color=None,
+        anchor_point=None,
+        anchored_position=None,
+        x=0,
+        y=0,
+        scale=1,
+        **kwargs
+    ):
+        """A text label. x, y is the left end of the text baseline."""
+        super().__init__(x=x, y=y, scale=scale)
+        self._font = font
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self.color = color
+        self.background_color = background_color
+        self._anchor_point = anchor_point
+        self._anchored_position = anchored_position
+        self._text = None
+        self.text = text
+
+    @property
+    def font(self):
+        return self._font
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        self._color = color
+        if color is None:
+            self._palette.make_transparent(1)
+        else:
+            self._palette[1] = color
+            self._palette.make_opaque(1)
+
+    @property
+    def background_color(self):
+        return self._background_color
+
+    @background_color.setter
+    def background_color(self, color):
+        self._background_color = color
+        if color is None:
+            self._palette.make_transparent(0)
+        else:
+            self._palette[0] = color
+            self._palette.make_opaque(0)
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        if text == self._text:
+            return
+        self._text = text
+        self._render()
+        self._reposition()
+
+    @property
+    def bounding_box(self):
+        """(x, y, width, height) of the text relative to the baseline origin."""
+        return (0, -self._ascent, self._width, self._height)
+
+    @property
+    def anchor_point(self):
+        return self._anchor_point
+
+    @anchor_point.setter
+    def anchor_point(self, point):
+        self._anchor_point = point
+        self._reposition()
+
+    @property
+    def anchored_position(self):
+        return self._anchored_position
+
+    @anchored_position.setter
+    def anchored_position(self, position):
+        self._anchored_position = position
+        self._reposition()
+
+    def _render(self):
+        font = self._font
+        box = font.get_bounding_box()
+        self._ascent = getattr(font, "ascent", 0) or box[1] - 2
+        descent = getattr(font, "descent", 0) or 2
+        glyphs = [font.get_glyph(ord(c)) for c in self._text]
+        glyphs = [g for g in glyphs if g is not None]
+        self._width = max(1, sum(g.shift_x for g in glyphs))
+        self._height = self._ascent + descent
+        bitmap = displayio.Bitmap(self._width, self._height, 2)
+        pixels = bitmap.pixels
+        x = 0
+        for glyph in glyphs:
+            top = self._ascent - (glyph.dy + glyph.height)
+            gx = x + glyph.dx
+            src = glyph.bitmap.pixels[: glyph.height, : glyph.width]
+            y0, y1 = max(0, top), min(self._height, top + glyph.height)
+            x0, x1 = max(0, gx), min(self._width, gx + glyph.width)
+            if y0 < y1 and x0 < x1:
+                pixels[y0:y1, x0:x1] |= src[y0 - top : y1 - top, x0 - gx : x1 - gx]
+            x += glyph.shift_x
+        bitmap.version += 1
+        tile_grid = displayio.TileGrid(bitmap, pixel_shader=self._palette, y=-self._ascent)
+        while len(self):
+            self.pop()
+        self.append(tile_grid)
+
+    def _reposition(self):
+        if self._anchor_point is None or self._anchored_position is None:
+            return
+        self.x = self._anchored_position[0] - int(
+            round(self._anchor_point[0] * self._width * self.scale)
+        )
+        self.y = (
+            self._anchored_position[1]
+            - int(round(self._anchor_point[1] * self._height * self.scale))
+            + self._ascent * self.scale
+        )
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# bitmaptools.py (headless stand-in)
+# 2026-10-18 v1.0
+
+"""Headless, NumPy-backed stand-in for the subset of CircuitPython's
+bitmaptools used by cedargrove_widgets."""
+
+import numpy as np
+
+
+def arrayblit(bitmap, data, x1=0, y1=0, x2=None, y2=None, skip_index=None):
+    """Copy row-major pixel values from data into the x1, y1 to x2, y2
+    region of bitmap, optionally leaving pixels equal to skip_index
+    unchanged."""
+    x2 = bitmap.width if x2 is None else x2
+    y2 = bitmap.height if y2 is None else y2
+    values = np.frombuffer(bytes(data), dtype=np.uint8)
+    values = values[: (x2 - x1) * (y2 - y1)].reshape(y2 - y1, x2 - x1)
+    target = bitmap.pixels[y1:y2, x1:x2]
+    if skip_index is None:
+        target[:, :] = values
+    else:
+        np.copyto(target, values, where=values != skip_index)
+    bitmap.version += 1
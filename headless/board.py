@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# board.py (headless stand-in)
+# 2026-10-18 v1.0
+
+"""Headless stand-in for a CircuitPython board with an integral display.
+The display size defaults to a 320x240 PyPortal and can be changed with the
+HEADLESS_DISPLAY environment variable, e.g. HEADLESS_DISPLAY=240x240."""
+
+import os
+from headless import HeadlessDisplay
+
+_width, _height = (
+    int(n) for n in os.environ.get("HEADLESS_DISPLAY", "320x240").lower().split("x")
+)
+
+DISPLAY = HeadlessDisplay(_width, _height)
@@ -0,0 +1,310 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# displayio.py (headless stand-in)
+# 2026-10-18 v1.0
+
+"""Headless, NumPy-backed stand-in for the subset of CircuitPython's
+displayio used by cedargrove_widgets. Groups, Bitmaps, Palettes and
+TileGrids behave like their CircuitPython counterparts and are rasterized
+into an in-memory framebuffer by headless.HeadlessDisplay."""
+
+import numpy as np
+
+
+class Palette:
+    def __init__(self, color_count):
+        """A color palette of color_count 24-bit RGB entries, each of which can
+        be made transparent."""
+        self._colors = np.zeros(color_count, dtype=np.uint32)
+        self._transparent = np.zeros(color_count, dtype=bool)
+        self.version = 0  # Incremented whenever a color or transparency changes
+
+    def __len__(self):
+        return len(self._colors)
+
+    def __getitem__(self, index):
+        return int(self._colors[index])
+
+    def __setitem__(self, index, color):
+        if isinstance(color, (tuple, list)):
+            color = (color[0] << 16) | (color[1] << 8) | color[2]
+        self._colors[index] = int(color) & 0xFFFFFF
+        self.version += 1
+
+    def make_transparent(self, index):
+        """Make the palette entry transparent."""
+        self._transparent[index] = True
+        self.version += 1
+
+    def make_opaque(self, index):
+        """Make the palette entry opaque."""
+        self._transparent[index] = False
+        self.version += 1
+
+    def is_transparent(self, index):
+        """True if the palette entry is transparent."""
+        return bool(self._transparent[index])
+
+
+class Bitmap:
+    def __init__(self, width, height, value_count):
+        """A width x height bitmap of integer color indices less than
+        value_count."""
+        if value_count < 1 or value_count > 65536:
+            raise ValueError("value_count must be in range 1-65536")
+        self._width = width
+        self._height = height
+        self._value_count = value_count
+        self._pixels = np.zeros((height, width), dtype=np.uint16)
+        self.version = 0  # Incremented whenever the bitmap contents change
+
+    @property
+    def width(self):
+        """Bitmap width in pixels."""
+        return self._width
+
+    @property
+    def height(self):
+        """Bitmap height in pixels."""
+        return self._height
+
+    def _index(self, index):
+        if isinstance(index, tuple):
+            return index[1], index[0]
+        return divmod(index, self._width)
+
+    def __getitem__(self, index):
+        return int(self._pixels[self._index(index)])
+
+    def __setitem__(self, index, value):
+        if value >= self._value_count:
+            raise ValueError("pixel value requires too many bits")
+        self._pixels[self._index(index)] = value
+        self.version += 1
+
+    def fill(self, value):
+        """Set every pixel to value."""
+        self._pixels[:, :] = value
+        self.version += 1
+
+    @property
+    def pixels(self):
+        """The underlying (height, width) NumPy index array."""
+        return self._pixels
+
+
+class _Layer:
+    """Common position and visibility attributes of drawable layers."""
+
+    def __init__(self, x=0, y=0):
+        self._x = x
+        self._y = y
+        self._hidden = False
+        self._parent = None
+
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = int(value)
+
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = int(value)
+
+    @property
+    def hidden(self):
+        return self._hidden
+
+    @hidden.setter
+    def hidden(self, value):
+        self._hidden = bool(value)
+
+
+class TileGrid(_Layer):
+    def __init__(
+        self,
+        bitmap,
+        *,
+        pixel_shader,
+        width=1,
+        height=1,
+        tile_width=None,
+        tile_height=None,
+        default_tile=0,
+        x=0,
+        y=0
+    ):
+        """A grid of width x height tiles drawn from bitmap through
+        pixel_shader. A single-tile grid shows the whole bitmap."""
+        super().__init__(x, y)
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self._grid_width = width
+        self._grid_height = height
+        self._tile_width = tile_width or bitmap.width
+        self._tile_height = tile_height or bitmap.height
+        self._tiles = np.full((height, width), default_tile, dtype=np.uint16)
+        self._tiles_version = 0
+        self._cache_key = None
+        self._cache = None
+        self._sprite_key = None
+        self._sprite_cache = None
+
+    @property
+    def width(self):
+        """Grid width in tiles."""
+        return self._grid_width
+
+    @property
+    def height(self):
+        """Grid height in tiles."""
+        return self._grid_height
+
+    @property
+    def tile_width(self):
+        return self._tile_width
+
+    @property
+    def tile_height(self):
+        return self._tile_height
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            return int(self._tiles[index[1], index[0]])
+        return int(self._tiles.flat[index])
+
+    def __setitem__(self, index, tile):
+        if isinstance(index, tuple):
+            self._tiles[index[1], index[0]] = tile
+        else:
+            self._tiles.flat[index] = tile
+        self._tiles_version += 1
+
+    def _indices(self):
+        """Return the (height, width) color index array of the whole grid."""
+        key = (id(self.bitmap), self.bitmap.version, self._tiles_version)
+        if key != self._cache_key:
+            pixels = self.bitmap.pixels
+            if (
+                self._grid_width == 1
+                and self._grid_height == 1
+                and self._tile_width == self.bitmap.width
+                and self._tile_height == self.bitmap.height
+                and self._tiles[0, 0] == 0
+            ):
+                self._cache = pixels
+            else:
+                tw, th = self._tile_width, self._tile_height
+                tiles_per_row = self.bitmap.width // tw
+                rows = []
+                for ty in range(self._grid_height):
+                    row = []
+                    for tx in range(self._grid_width):
+                        tile = int(self._tiles[ty, tx])
+                        sx = (tile % tiles_per_row) * tw
+                        sy = (tile // tiles_per_row) * th
+                        row.append(pixels[sy : sy + th, sx : sx + tw])
+                    rows.append(np.hstack(row))
+                self._cache = np.vstack(rows)
+            self._cache_key = key
+        return self._cache
+
+    def _sprite(self):
+        """Return the (opaque mask, colors) arrays of the whole grid."""
+        indices = self._indices()
+        palette = self.pixel_shader
+        key = (self._cache_key, id(palette), palette.version)
+        if key != self._sprite_key:
+            self._sprite_cache = (
+                ~palette._transparent[indices],
+                palette._colors[indices],
+            )
+            self._sprite_key = key
+        return self._sprite_cache
+
+
+class Group(_Layer):
+    def __init__(self, *, scale=1, x=0, y=0):
+        """An ordered collection of layers drawn back to front. scale is an
+        integer pixel multiplier applied to all contained layers."""
+        super().__init__(x, y)
+        self._scale = int(scale)
+        self._layers = []
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        if value < 1:
+            raise ValueError("scale must be >= 1")
+        self._scale = int(value)
+
+    def _claim(self, layer):
+        if getattr(layer, "_parent", None) is not None:
+            raise ValueError("Layer already in a group")
+        layer._parent = self
+
+    def append(self, layer):
+        """Add layer to the top of the group."""
+        self._claim(layer)
+        self._layers.append(layer)
+
+    def insert(self, index, layer):
+        """Insert layer at index."""
+        self._claim(layer)
+        self._layers.insert(index, layer)
+
+    def index(self, layer):
+        """Return the index of layer."""
+        return self._layers.index(layer)
+
+    def pop(self, index=-1):
+        """Remove and return the layer at index."""
+        layer = self._layers.pop(index)
+        layer._parent = None
+        return layer
+
+    def remove(self, layer):
+        """Remove layer from the group."""
+        self.pop(self._layers.index(layer))
+
+    def __len__(self):
+        return len(self._layers)
+
+    def __bool__(self):
+        return True
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def __contains__(self, layer):
+        return layer in self._layers
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __setitem__(self, index, layer):
+        old = self._layers[index]
+        if old is layer:
+            return
+        self._claim(layer)
+        old._parent = None
+        self._layers[index] = layer
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+
+def release_displays():
+    """Release displays; a no-op for the headless stand-in."""
+    return
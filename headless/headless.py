@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# headless.py
+# 2026-10-18 v1.0
+
+"""Headless display for running cedargrove_widgets under CPython. Add this
+directory to the front of sys.path so that the displayio, vectorio,
+terminalio, board, adafruit_display_shapes, adafruit_display_text and
+adafruit_bitmap_font stand-ins are imported instead of the CircuitPython
+libraries:
+
+    import sys
+    sys.path.insert(0, "headless")
+
+    import board
+    from cedargrove_widgets.scale import Scale
+
+    scale = Scale(display_size=(320, 240))
+    board.DISPLAY.show(scale)
+    scale.hand1 = 0.25
+    frame = board.DISPLAY.refresh()  # (240, 320) uint32 0xRRGGBB array
+
+Font files named with absolute CIRCUITPY paths such as /fonts/OpenSans-9.bdf
+are looked up relative to the HEADLESS_ROOT environment variable, or the
+current directory if it is not set."""
+
+import numpy as np
+from displayio import Group, TileGrid
+from vectorio import _Shape
+
+
+class HeadlessDisplay:
+    def __init__(self, width=320, height=240, background=0x000000):
+        """An in-memory display of width x height pixels. refresh() rasterizes
+        the shown group into the framebuffer, a (height, width) NumPy array
+        of 24-bit 0xRRGGBB colors."""
+        self._width = width
+        self._height = height
+        self.background = background
+        self.rotation = 0
+        self.brightness = 1.0
+        self.auto_refresh = True
+        self.root_group = None
+        self.frames = 0
+        self._framebuffer = np.zeros((height, width), dtype=np.uint32)
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def height(self):
+        return self._height
+
+    @property
+    def framebuffer(self):
+        """The most recently rendered frame."""
+        return self._framebuffer
+
+    def show(self, group):
+        """Set the group to be displayed."""
+        self.root_group = group
+
+    def refresh(self, **kwargs):
+        """Rasterize the shown group and return the framebuffer."""
+        self._framebuffer[:, :] = self.background
+        if self.root_group is not None:
+            _composite(self._framebuffer, self.root_group, 0, 0, 1)
+        self.frames += 1
+        return self._framebuffer
+
+    def pixel(self, x, y):
+        """Return the 0xRRGGBB color of the framebuffer pixel at x, y."""
+        return int(self._framebuffer[y, x])
+
+    def save(self, path):
+        """Write the framebuffer to a binary PPM image file."""
+        fb = self._framebuffer
+        rgb = np.dstack(((fb >> 16) & 0xFF, (fb >> 8) & 0xFF, fb & 0xFF))
+        with open(path, "wb") as ppm:
+            ppm.write(b"P6 %d %d 255\n" % (self._width, self._height))
+            ppm.write(rgb.astype(np.uint8).tobytes())
+
+
+def _composite(fb, layer, ox, oy, scale):
+    """Draw layer and its children into fb at origin ox, oy and scale."""
+    if layer._hidden:
+        return
+    if isinstance(layer, Group):
+        child_scale = scale * layer._scale
+        x = ox + layer._x * scale
+        y = oy + layer._y * scale
+        for child in layer._layers:
+            _composite(fb, child, x, y, child_scale)
+    elif isinstance(layer, _Shape):
+        palette = layer.pixel_shader
+        index = layer.color_index
+        if palette._transparent[index]:
+            return
+        left, top, mask = layer._coverage()
+        _blit(fb, ox + left * scale, oy + top * scale, mask, scale, palette._colors[index])
+    elif isinstance(layer, TileGrid):
+        mask, colors = layer._sprite()
+        _blit(fb, ox + layer._x * scale, oy + layer._y * scale, mask, scale, colors)
+
+
+def _blit(fb, x, y, mask, scale, colors):
+    """Copy colors (a scalar or an array shaped like mask) into fb where mask
+    is True, with mask's upper left corner at x, y, clipped to fb."""
+    if scale > 1:
+        mask = mask.repeat(scale, axis=0).repeat(scale, axis=1)
+        if np.ndim(colors):
+            colors = colors.repeat(scale, axis=0).repeat(scale, axis=1)
+    height, width = mask.shape
+    fb_height, fb_width = fb.shape
+    if x >= 0 and y >= 0 and x + width <= fb_width and y + height <= fb_height:
+        np.copyto(fb[y : y + height, x : x + width], colors, where=mask)
+        return
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + width, fb_width), min(y + height, fb_height)
+    if x0 >= x1 or y0 >= y1:
+        return
+    if np.ndim(colors):
+        colors = colors[y0 - y : y1 - y, x0 - x : x1 - x]
+    np.copyto(
+        fb[y0:y1, x0:x1], colors, where=mask[y0 - y : y1 - y, x0 - x : x1 - x]
+    )
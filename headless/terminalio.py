@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# terminalio.py (headless stand-in)
+# 2026-10-18 v1.0
+
+"""Headless stand-in for terminalio.FONT, a fixed 6x12 pixel font. Glyphs
+are drawn as hollow 4x7 boxes; text positions and sizes match the built-in
+font but the characters are not legible."""
+
+import displayio
+from adafruit_bitmap_font.bitmap_font import Glyph
+
+
+class BuiltinFont:
+    def __init__(self):
+        self._bitmap = displayio.Bitmap(6, 12, 2)
+        for x in range(1, 5):
+            self._bitmap[x, 2] = self._bitmap[x, 8] = 1
+        for y in range(2, 9):
+            self._bitmap[1, y] = self._bitmap[4, y] = 1
+        self._blank = displayio.Bitmap(6, 12, 2)
+
+    def get_bounding_box(self):
+        """Return the font's (width, height) bounding box."""
+        return (6, 12)
+
+    def get_glyph(self, code_point):
+        """Return the Glyph for code_point."""
+        bitmap = self._blank if code_point == 32 else self._bitmap
+        return Glyph(bitmap, 0, 6, 12, 0, -2, 6, 0)
+
+
+FONT = BuiltinFont()
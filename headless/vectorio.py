@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# vectorio.py (headless stand-in)
+# 2026-10-18 v1.0
+
+"""Headless, NumPy-backed stand-in for CircuitPython's vectorio Circle,
+Rectangle and Polygon shapes. Each shape rasterizes itself into a boolean
+coverage mask that is cached until its geometry changes."""
+
+import numpy as np
+from displayio import _Layer
+
+
+class _Shape(_Layer):
+    def __init__(self, pixel_shader, x=0, y=0, color_index=0):
+        super().__init__(x, y)
+        self.pixel_shader = pixel_shader
+        self.color_index = color_index
+        self._mask = None
+
+    def _coverage(self):
+        """Return (left, top, mask) of the shape in parent coordinates."""
+        if self._mask is None:
+            self._mask = self._rasterize()
+        left, top, mask = self._mask
+        return left + self._x, top + self._y, mask
+
+    def _rasterize(self):
+        raise NotImplementedError
+
+
+class Circle(_Shape):
+    def __init__(self, *, pixel_shader, radius, x=0, y=0, color_index=0):
+        """A filled circle of radius pixels centered on x, y."""
+        super().__init__(pixel_shader, x, y, color_index)
+        self._radius = int(radius)
+
+    @property
+    def radius(self):
+        return self._radius
+
+    @radius.setter
+    def radius(self, value):
+        self._radius = int(value)
+        self._mask = None
+
+    def _rasterize(self):
+        r = abs(self._radius)
+        yy, xx = np.mgrid[-r : r + 1, -r : r + 1]
+        return -r, -r, (xx * xx + yy * yy) <= r * r
+
+
+class Rectangle(_Shape):
+    def __init__(self, *, pixel_shader, width, height, x=0, y=0, color_index=0):
+        """A filled width x height rectangle with its upper left corner at x, y."""
+        super().__init__(pixel_shader, x, y, color_index)
+        self._width = int(width)
+        self._height = int(height)
+
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        self._width = int(value)
+        self._mask = None
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        self._height = int(value)
+        self._mask = None
+
+    def _rasterize(self):
+        return 0, 0, np.ones((max(0, self._height), max(0, self._width)), dtype=bool)
+
+
+class Polygon(_Shape):
+    def __init__(self, *, pixel_shader, points, x=0, y=0, color_index=0):
+        """A filled polygon through a list of (x, y) points, offset by x, y."""
+        super().__init__(pixel_shader, x, y, color_index)
+        self.points = points
+
+    @property
+    def points(self):
+        return list(self._points)
+
+    @points.setter
+    def points(self, points):
+        # Like the native points array, reuse the stored list when the point
+        # count is unchanged; integer points are stored without conversion
+        current = getattr(self, "_points", None)
+        if current is None or len(current) != len(points):
+            current = self._points = [None] * len(points)
+        for i in range(len(points)):
+            point = points[i]
+            if type(point[0]) is not int or type(point[1]) is not int:
+                point = (int(point[0]), int(point[1]))
+            current[i] = point
+        self._mask = None
+
+    def _rasterize(self):
+        return _polygon_mask(self._points)
+
+
+def _polygon_mask(points):
+    """Return (left, top, mask) of a filled polygon using a winding number
+    test at each integer pixel coordinate, vectorized over the polygon's
+    bounding box."""
+    if len(points) < 3:
+        return 0, 0, np.zeros((0, 0), dtype=bool)
+    pts = np.array(points, dtype=np.int64)
+    left, top = pts.min(axis=0)
+    right, bottom = pts.max(axis=0)
+    yy, xx = np.mgrid[top : bottom + 1, left : right + 1]
+    winding = np.zeros(xx.shape, dtype=np.int32)
+    for (x0, y0), (x1, y1) in zip(pts, np.roll(pts, -1, axis=0)):
+        if y0 == y1:
+            continue
+        cross = (x1 - x0) * (yy - y0) - (xx - x0) * (y1 - y0)
+        if y0 < y1:
+            winding += (yy >= y0) & (yy < y1) & (cross > 0)
+        else:
+            winding -= (yy >= y1) & (yy < y0) & (cross < 0)
+    return int(left), int(top), winding != 0
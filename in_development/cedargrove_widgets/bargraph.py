@@ -1,9 +1,34 @@
 # 10-Segment Bargraph widget
 # based on the Lucky Light LED 10-Segment LED Gauge Bar and LML391x controllers
-# 2021-12-10 v0.9
+# 2026-10-18 v0.93
 
+import math
+import time
 import displayio
 import vectorio
+from cedargrove_widgets import coordinates, dirty_rect, trig_table
+
+
+def _bisect(thresholds, value):
+    """Return the number of ascending thresholds less than or equal to value."""
+    low = 0
+    high = len(thresholds)
+    while low < high:
+        mid = (low + high) // 2
+        if value < thresholds[mid]:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+def _dim(color, factor=0.25):
+    """Return an RGB color scaled by factor for a segment's glow."""
+    return (
+        (int(((color >> 16) & 0xFF) * factor) << 16)
+        + (int(((color >> 8) & 0xFF) * factor) << 8)
+        + int((color & 0xFF) * factor)
+    )
 
 
 class Colors:
@@ -16,7 +41,7 @@ class Colors:
     YELLOW = 0xFFFF00
 
 
-class Bargraph(displayio.Group):
+class Bargraph(dirty_rect.DirtyRectMixin, displayio.Group):
     def __init__(
         self,
         units=0,
@@ -24,16 +49,22 @@ class Bargraph(displayio.Group):
         size=1,
         range="VU",
         mode="BAR",
+        attack=0,
+        release=0,
+        peak_hold=0,
         display_size=(None, None),
     ):
         """Bargraph display widget. Accepts a normalized (0 to 1.0) input
         representing full-scale of a single or stacked bargraph object.
 
-        Emulates the LM391x series of dot/bar display drivers:
-        LM3914 Dot/Bar Display Driver (volts; 1.2v full-scale/10 bars)
-        LM3915 (dB; 3dB per step, 30dB range/10 bars)
-        LM3916 (VU; 10v full-scale; -20, -10, -7, -5, -3, -1, 0, +1, +2, +3dB)
-            ( -40, -37, -34, -31, -28, -25, -22, -19, -16, -13, -10, -7, -5, -3, -1, 0, +1, +2, +3dB)
+        Emulates the LM391x series of dot/bar display drivers. The signal
+        thresholds of each segment are calculated once per range:
+        'VOLTS' LM3914 Dot/Bar Display Driver (linear; 1.2v full-scale/10 bars)
+        'DB' LM3915 (log; 3dB per step, 30dB range/10 bars)
+        'VU' LM3916 (VU; 10v full-scale; -20, -10, -7, -5, -3, -1, 0, +1, +2, +3dB)
+            Stacked units extend the scale below -10dB in 3dB steps; two units:
+            ( -43, -40, -37, -34, -31, -28, -25, -22, -19, -16, -13,
+              -10, -7, -5, -3, -1, 0, +1, +2, +3dB)
 
         'VU' range shades the top 4 bars of the single or stacked bargraph YEL,
         RED, RED, RED to represent a typical VU peak range.
@@ -42,14 +73,41 @@ class Bargraph(displayio.Group):
         the signal value segment with a slight glow of the surrounding segments,
         particularly useful when the signal value is zero.
 
-        The current version does not adjust normalized signal input to volts, VU,
-        or linear dB scale, nor does it implement DOT mode."""
+        Sample buffers passed to process() are reduced to one peak amplitude
+        per batch and smoothed by the attack and release ballistics before
+        the display is updated once. A held peak segment is shown above the
+        smoothed level for peak_hold seconds.
+
+        :param integer units: The number of stacked 10-segment units.
+        :param integer center: The upper left corner x,y pixel tuple.
+        :param integer size: The widget scale. Defaults to 1.
+        :param string range: The 'VOLTS', 'DB' or 'VU' signal range. Defaults
+        to 'VU'.
+        :param string mode: The 'BAR' or 'DOT' display mode. Defaults to 'BAR'.
+        :param float attack: The rising level time constant in seconds.
+        Defaults to 0 (instantaneous).
+        :param float release: The falling level time constant in seconds.
+        Defaults to 0 (instantaneous).
+        :param float peak_hold: The held peak display time in seconds.
+        Defaults to 0 (no peak hold).
+        :param integer display_size: The host display's integer width and
+        height tuple expressed in pixels."""
+
+        if range not in ("VOLTS", "DB", "VU"):
+            raise ValueError("Range must be 'VOLTS', 'DB' or 'VU'.")
+        if mode not in ("BAR", "DOT"):
+            raise ValueError("Mode must be 'BAR' or 'DOT'.")
+        if attack < 0 or release < 0 or peak_hold < 0:
+            raise ValueError("Ballistics times must be 0 or greater.")
 
         self._units = units
         self._origin = center
         self._size = size
         self._range = range
         self._mode = mode
+        self._attack = attack
+        self._release = release
+        self._peak_hold = peak_hold
         self._display_size = display_size
 
         bargraph_group = displayio.Group(scale=self._size)
@@ -66,10 +124,39 @@ class Bargraph(displayio.Group):
         self._grn_palette = displayio.Palette(1)
         self._grn_palette[0] = Colors.GREEN_LED
 
-        # Draw the DIP packages
+        # DOT mode glow palettes
+        self._glow_palettes = {}
+        for palette in (self._red_palette, self._yel_palette, self._grn_palette):
+            glow_palette = displayio.Palette(1)
+            glow_palette[0] = _dim(palette[0])
+            self._glow_palettes[palette] = glow_palette
+
         dip_pkg_palette = displayio.Palette(1)
         dip_pkg_palette[0] = Colors.GRAY_DK
 
+        # Draw the DIP packages; built in a separate method because the
+        # range parameter hides the range builtin within __init__
+        self._draw_units(chips, dip_pkg_palette)
+        self._lit_palettes = self._segment_palettes()
+        self._thresholds = self._range_thresholds()
+
+        super().__init__()
+        self.append(chips)
+        self.append(self._bars)
+        self._signal = 0
+        self._lit = 0  # Number of segments with a threshold at or below signal
+        self._peak = 0  # Held peak level
+        self._peak_lit = 0  # Number of segments at or below the held peak
+        self._hold_ns = 0  # Remaining peak hold time
+        self._last_ns = None  # Time of the previous value update
+        if self._mode == "DOT" and len(self._bars):
+            self._bars[0].pixel_shader = self._segment_shader(0)
+
+    def _draw_units(self, chips, dip_pkg_palette):
+        """Draw the DIP package, index mark and ten bar segments of each unit."""
+        self._bars_bounds = dirty_rect.rect_bounds(
+            self._origin[0] + 2, self._origin[1] + 10, (100 * self._units) - 4, 20
+        )
         for chip in range(0, self._units):
             upper_left_corner = (self._origin[0] + (100 * chip), self._origin[1])
 
@@ -103,9 +190,46 @@ class Bargraph(displayio.Group):
                 )
 
                 self._bars.append(bar_rect)
-        super().__init__()
-        self.append(chips)
-        self.append(self._bars)
+
+    def _segment_palettes(self):
+        """Return the lit palette of each bar segment. The 'VU' range shades
+        the top four segments yellow, red, red, red; other ranges are green."""
+        palettes = []
+        peak = ((self._units - 1) * 10) + 6  # Yellow segment of the top unit
+        for i in range(0, self._units * 10):
+            if self._range == "VU" and i > peak:
+                palettes.append(self._red_palette)
+            elif self._range == "VU" and i == peak:
+                palettes.append(self._yel_palette)
+            else:
+                palettes.append(self._grn_palette)
+        return palettes
+
+    def _range_thresholds(self):
+        """Return the ascending normalized signal threshold of each bar
+        segment for the signal range, where 1.0 is full-scale."""
+        segments = self._units * 10
+        if not segments:
+            return ()
+        if self._range == "VOLTS":
+            # LM3914: linear steps
+            return tuple((i + 1) / segments for i in range(segments))
+        if self._range == "DB":
+            # LM3915: 3dB steps with the top segment at full-scale
+            levels = [-3 * (segments - 1 - i) for i in range(segments)]
+            return tuple(10 ** (level / 20) for level in levels)
+        # LM3916: VU steps with full-scale at +3dB
+        if segments == 10:
+            levels = [-20]
+        else:
+            levels = [-10 - (3 * (segments - 9 - i)) for i in range(segments - 9)]
+        levels.extend((-10, -7, -5, -3, -1, 0, 1, 2, 3))
+        return tuple(10 ** ((level - 3) / 20) for level in levels[-segments:])
+
+    @property
+    def thresholds(self):
+        """The normalized signal threshold of each bar segment."""
+        return self._thresholds
 
     @property
     def center(self):
@@ -132,6 +256,46 @@ class Bargraph(displayio.Group):
         """Bargraph display mode."""
         return self._mode
 
+    @property
+    def attack(self):
+        """The rising level time constant in seconds."""
+        return self._attack
+
+    @attack.setter
+    def attack(self, attack=0):
+        if attack < 0:
+            raise ValueError("Ballistics times must be 0 or greater.")
+        self._attack = attack
+
+    @property
+    def release(self):
+        """The falling level time constant in seconds."""
+        return self._release
+
+    @release.setter
+    def release(self, release=0):
+        if release < 0:
+            raise ValueError("Ballistics times must be 0 or greater.")
+        self._release = release
+
+    @property
+    def peak_hold(self):
+        """The held peak display time in seconds."""
+        return self._peak_hold
+
+    @peak_hold.setter
+    def peak_hold(self, peak_hold=0):
+        if peak_hold < 0:
+            raise ValueError("Ballistics times must be 0 or greater.")
+        self._peak_hold = peak_hold
+        if not peak_hold:
+            self._show_signal(self._signal, 0)
+
+    @property
+    def peak(self):
+        """The held peak level."""
+        return self._peak
+
     @property
     def display_size(self):
         """Display size in pixels."""
@@ -139,12 +303,71 @@ class Bargraph(displayio.Group):
 
     @property
     def value(self):
-        """Currently displayed value."""
+        """Currently displayed value. A value that is set is displayed
+        directly, without the attack and release ballistics. The held peak
+        follows the same peak_hold timing as process(), using the time
+        elapsed since the previous update."""
         return self._signal
 
     @value.setter
     def value(self, signal=None):
-        self._show_signal(signal)
+        now = time.monotonic_ns()
+        if self._last_ns is None:
+            duration = 0
+        else:
+            duration = (now - self._last_ns) / 1000000000
+        self._last_ns = now
+        self._show_signal(signal, self._hold_peak(signal, signal, duration))
+
+    def process(self, samples, sample_rate=None, full_scale=1.0, offset=0):
+        """Apply a batch of samples, such as an ADC or audiobusio buffer, to
+        the level ballistics and update the display once. The batch is
+        reduced to its peak amplitude with the built-in max() and min()
+        functions so that no per-sample Python code is executed. Returns the
+        displayed level.
+
+        :param samples: A sequence of sample values such as an array, list or
+        bytes object.
+        :param integer sample_rate: The sample rate in samples per second used
+        to calculate the batch duration. Defaults to None (the time elapsed
+        since the previous batch).
+        :param float full_scale: The sample amplitude shown as a 1.0 signal.
+        Defaults to 1.0.
+        :param float offset: The sample value of a zero signal, such as 32768
+        for unsigned 16-bit audio. Defaults to 0."""
+        now = time.monotonic_ns()
+        if sample_rate:
+            duration = len(samples) / sample_rate
+        elif self._last_ns is None:
+            duration = 0
+        else:
+            duration = (now - self._last_ns) / 1000000000
+        self._last_ns = now
+        if not samples:
+            return self._signal
+
+        amplitude = max(max(samples) - offset, offset - min(samples)) / full_scale
+        level = self._signal
+        time_constant = self._attack if amplitude > level else self._release
+        if time_constant:
+            level += (amplitude - level) * (1 - math.exp(-duration / time_constant))
+        else:
+            level = amplitude
+
+        self._show_signal(level, self._hold_peak(amplitude, level, duration))
+        return level
+
+    def _hold_peak(self, amplitude, level, duration):
+        """Update the held peak after duration seconds and return the number
+        of segments at or below it, or 0 if peak hold is off. The peak is
+        replaced when the amplitude reaches it or its hold time expires."""
+        if not self._peak_hold:
+            return 0
+        self._hold_ns -= int(duration * 1000000000)
+        if amplitude >= self._peak or self._hold_ns <= 0:
+            self._peak = max(amplitude, level)
+            self._hold_ns = int(self._peak_hold * 1000000000)
+        return _bisect(self._thresholds, self._peak)
 
     # @property
     # def center(self, cluster=0):
@@ -161,46 +384,83 @@ class Bargraph(displayio.Group):
     #    SHOULD THIS BE A FUNCTION?
     #    return
 
-    def _show_signal(self, signal=None):
-        bar = int(round(signal * (self._units * 10), 0))
-
-        for i in range(0, self._units * 10):
-            if i <= bar and self._range == "VU":
-                if i > ((self._units - 1) * 10) + 6:
-                    self._bars[i].pixel_shader = self._red_palette
-                elif i == ((self._units - 1) * 10) + 6:
-                    self._bars[i].pixel_shader = self._yel_palette
-                else:
-                    self._bars[i].pixel_shader = self._grn_palette
-            else:
-                self._bars[i].pixel_shader = self._blk_palette
+    def _show_signal(self, signal=None, peak_lit=0):
+        """Light the segments representing the signal value and the held
+        peak. The signal is mapped to a segment by a binary search of the
+        range thresholds and only segments that change are updated."""
+        self._signal = signal
+        lit = _bisect(self._thresholds, signal)
+        if lit == self._lit and peak_lit == self._peak_lit:
+            return
+        if self._mode == "DOT":
+            changed = set(self._dot_segments(self._lit))
+            changed.update(self._dot_segments(lit))
+        else:
+            changed = set(range(min(lit, self._lit), max(lit, self._lit)))
+        for held in (self._peak_lit, peak_lit):
+            if held:
+                changed.add(held - 1)
+        self._lit = lit
+        self._peak_lit = peak_lit
+        if not changed:
+            return
+        for i in changed:
+            self._bars[i].pixel_shader = self._segment_shader(i)
+        self._mark_dirty_segments(min(changed), max(changed) + 1)
+
+    def _segment_shader(self, i):
+        """Return the palette of segment i for the displayed level and peak."""
+        if i == self._peak_lit - 1:
+            return self._lit_palettes[i]
+        if self._mode == "DOT":
+            dot = self._lit - 1
+            if i == dot:
+                return self._lit_palettes[i]
+            if i in (dot - 1, dot + 1):
+                return self._glow_palettes[self._lit_palettes[i]]
+        elif i < self._lit:
+            return self._lit_palettes[i]
+        return self._blk_palette
+
+    def _dot_segments(self, lit):
+        """Return the indices of the dot and glowing segments for lit."""
+        dot = lit - 1
+        return [i for i in (dot - 1, dot, dot + 1) if 0 <= i < len(self._bars)]
+
+    def _mark_dirty_segments(self, low, high):
+        """Add the area of segments low through high - 1 to the changed area."""
+        self._mark_dirty(
+            dirty_rect.rect_bounds(
+                self._origin[0] + 2 + (low * 10),
+                self._origin[1] + 10,
+                ((high - low) * 10) - 4,
+                20,
+            )
+        )
 
     def display_to_pixel(self, width_factor=0, height_factor=0, size=1.0):
         """Convert normalized display position input (0.0 to 1.0) to display
         pixel position."""
-        return int(round(size * self.WIDTH * width_factor, 0)), int(
-            round(size * self.HEIGHT * height_factor, 0)
+        return coordinates.for_display(self._display_size).display_to_pixel(
+            width_factor, height_factor, size
         )
 
     def dial_to_pixel(self, dial_factor, center=(0, 0), radius=0):
         """Convert normalized dial_factor input (-1.0 to 1.0) to display pixel
         position on the circumference of the dial's circle with center
-        (x,y pixels) and radius (pixels)."""
-        rads = (-2 * pi) * (dial_factor)  # convert scale_factor to radians
-        rads = rads + (pi / 2)  # rotate axis counterclockwise
-        x = center[0] + int(cos(rads) * radius)
-        y = center[1] - int(sin(rads) * radius)
-        return x, y
+        (x,y pixels) and radius (pixels). Uses the shared trig_table angle
+        lookup."""
+        return trig_table.dial_to_pixel(dial_factor, center, radius)
 
     def cart_to_pixel(self, x, y, size=1.0):
         """Convert normalized cartesian position value (-0.5, to + 0.5) to display
         pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        x1 = int(round(min_axis * size * x, 0)) + self._center[0]
-        y1 = self._center[1] - int(round(min_axis * size * y, 0))
-        return x1, y1
+        return coordinates.for_display(self._display_size).cart_to_pixel(
+            x, y, self._origin, size
+        )
 
     def cart_dist_to_pixel(self, distance=0, size=1.0):
         """Convert normalized cartesian distance value to display pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        return int(round(min_axis * size * distance, 0))
+        return coordinates.for_display(self._display_size).cart_dist_to_pixel(
+            distance, size
+        )
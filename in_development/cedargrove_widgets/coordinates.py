@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# coordinates.py
+# 2026-10-18 v1.0
+
+from cedargrove_widgets import trig_table
+
+# One shared Coordinates object per display size
+_displays = {}
+
+
+def for_display(display_size=(None, None)):
+    """Return the shared Coordinates object for a display, creating it on
+    first use.
+
+    :param integer display_size: The host display's integer width and
+    height tuple expressed in pixels. If (None, None) and the host includes
+    an integral display, the tuple value is set to (board.DISPLAY.width,
+    board.DISPLAY.height)."""
+    if None in display_size:
+        import board
+
+        if "DISPLAY" in dir(board):
+            display_size = (board.DISPLAY.width, board.DISPLAY.height)
+        else:
+            raise ValueError("No integral display. Specify display size.")
+    key = (display_size[0], display_size[1])
+    coords = _displays.get(key)
+    if coords is None:
+        coords = Coordinates(key[0], key[1])
+        _displays[key] = coords
+    return coords
+
+
+class Coordinates:
+    def __init__(self, width, height):
+        """Normalized to pixel coordinate transforms for a width x height
+        display. The smaller display axis is calculated once and shared by
+        all widgets on the display; use for_display() rather than
+        instantiating directly.
+
+        :param integer width: The display width in pixels.
+        :param integer height: The display height in pixels."""
+        self.width = width
+        self.height = height
+        self.min_axis = min(width, height)
+
+    def display_to_pixel(self, width_factor=0, height_factor=0, size=1.0):
+        """Convert normalized display position input (0.0 to 1.0) to display
+        pixel position."""
+        return int(round(size * self.width * width_factor, 0)), int(
+            round(size * self.height * height_factor, 0)
+        )
+
+    def dial_to_pixel(self, dial_factor, center=(0, 0), radius=0):
+        """Convert normalized dial_factor input (-1.0 to 1.0) to display pixel
+        position on the circumference of the dial's circle with center
+        (x,y pixels) and radius (pixels). Uses the shared trig_table angle
+        lookup."""
+        return trig_table.dial_to_pixel(dial_factor, center, radius)
+
+    def cart_to_pixel(self, x, y, center=(0, 0), size=1.0):
+        """Convert normalized cartesian position value (-0.5, to + 0.5)
+        relative to center (x,y pixels) to display pixels."""
+        scale = self.min_axis * size
+        return (
+            int(round(scale * x, 0)) + center[0],
+            center[1] - int(round(scale * y, 0)),
+        )
+
+    def cart_dist_to_pixel(self, distance=0, size=1.0):
+        """Convert normalized cartesian distance value to display pixels."""
+        return int(round(self.min_axis * size * distance, 0))
+
+    def cart_points_to_pixel(self, points, center=(0, 0), size=1.0):
+        """Convert a list of normalized cartesian (x, y) positions relative to
+        center (x,y pixels) to a list of display pixel positions."""
+        scale = self.min_axis * size
+        cx, cy = center
+        return [
+            (int(round(scale * x, 0)) + cx, cy - int(round(scale * y, 0)))
+            for x, y in points
+        ]
+
+    def cart_dists_to_pixel(self, distances, size=1.0):
+        """Convert a list of normalized cartesian distance values to a list of
+        display pixel distances."""
+        scale = self.min_axis * size
+        return [int(round(scale * distance, 0)) for distance in distances]
+
+    def dial_points_to_pixel(self, dial_factors, center=(0, 0), radius=0):
+        """Convert a list of normalized dial_factor values to a list of display
+        pixel positions on the circumference of the dial's circle with center
+        (x,y pixels) and radius (pixels)."""
+        dial_to_pixel = trig_table.dial_to_pixel
+        return [dial_to_pixel(dial, center, radius) for dial in dial_factors]
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# dirty_rect.py
+# 2026-10-18 v1.1
+
+# Changed-area bounds are (x0, y0, x1, y1) display pixel tuples where x1 and
+# y1 are exclusive. None represents an empty area.
+
+
+def points_bounds(points):
+    """Return the bounds enclosing a list of (x, y) pixel points."""
+    x0 = x1 = points[0][0]
+    y0 = y1 = points[0][1]
+    for x, y in points:
+        if x < x0:
+            x0 = x
+        elif x > x1:
+            x1 = x
+        if y < y0:
+            y0 = y
+        elif y > y1:
+            y1 = y
+    return (x0, y0, x1 + 1, y1 + 1)
+
+
+def rect_bounds(x, y, width, height):
+    """Return the bounds of a width x height rectangle at x, y."""
+    return (x, y, x + width, y + height)
+
+
+def circle_bounds(x, y, radius):
+    """Return the bounds of a circle of radius centered on x, y."""
+    return (x - radius, y - radius, x + radius + 1, y + radius + 1)
+
+
+def union(bounds, other):
+    """Return the bounds enclosing both bounds and other; either may be None."""
+    if bounds is None:
+        return other
+    if other is None:
+        return bounds
+    return (
+        min(bounds[0], other[0]),
+        min(bounds[1], other[1]),
+        max(bounds[2], other[2]),
+        max(bounds[3], other[3]),
+    )
+
+
+def to_rect(bounds, x_offset=0, y_offset=0):
+    """Convert bounds to an (x, y, width, height) tuple offset by x_offset
+    and y_offset pixels, or None if bounds is None."""
+    if bounds is None:
+        return None
+    return (
+        bounds[0] + x_offset,
+        bounds[1] + y_offset,
+        bounds[2] - bounds[0],
+        bounds[3] - bounds[1],
+    )
+
+
+class DirtyRectMixin:
+    """Changed-area tracking for a widget displayio.Group. The widget adds
+    the bounds of each change, relative to the group, with _mark_dirty()."""
+
+    _dirty = None  # Changed display area bounds since last cleared
+
+    @property
+    def dirty_rect(self):
+        """Display pixel (x, y, width, height) bounding box of all areas
+        changed since the last clear_dirty_rect() or None if unchanged."""
+        return to_rect(self._dirty, self.x, self.y)
+
+    def clear_dirty_rect(self):
+        """Return the changed area bounding box and reset it to None."""
+        rect = self.dirty_rect
+        self._dirty = None
+        return rect
+
+    def _mark_dirty(self, bounds):
+        """Add bounds to the changed area."""
+        self._dirty = union(self._dirty, bounds)
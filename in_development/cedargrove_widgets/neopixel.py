@@ -1,9 +1,10 @@
 # NeoPixel widget
-# 2021-12-09 v0.8
+# 2026-10-18 v0.84
 
+from array import array
 import displayio
 import vectorio
-from adafruit_display_shapes.circle import Circle
+from cedargrove_widgets import coordinates, dirty_rect, trig_table
 
 
 class Colors:
@@ -13,8 +14,65 @@ class Colors:
     GRAY_DK = 0x101010
 
 
-class NeoPixel(displayio.Group):
-    def __init__(self, units=0, center=(0, 0), size=1, display_size=(None, None)):
+# Byte orders of pixel buffers, matching the neopixel library
+RGB = "RGB"
+GRB = "GRB"
+
+
+def _color_value(color):
+    """Return a 0xRRGGBB integer from an integer or (r, g, b) tuple color."""
+    if isinstance(color, int):
+        return color
+    return (color[0] << 16) + (color[1] << 8) + color[2]
+
+
+class NeoPixel(dirty_rect.DirtyRectMixin, displayio.Group):
+    def __init__(
+        self,
+        units=0,
+        center=(0, 0),
+        size=1,
+        columns=None,
+        serpentine=False,
+        auto_write=True,
+        pixel_order=GRB,
+        display_size=(None, None),
+    ):
+        """A row or matrix of on-screen NeoPixels with the buffer interface of
+        the neopixel library. Pixels are read and written by index or slice with
+        0xRRGGBB integer or (r, g, b) tuple colors; a slice also accepts a
+        bytes, bytearray or memoryview pixel buffer in pixel_order, so the
+        buffer of a physical strip can be mirrored in one assignment.
+        Indexing addresses pixels rather than the widget's display layers.
+
+        Written colors are displayed immediately if auto_write is True,
+        otherwise when show() is called. Only pixels with a changed color are
+        redrawn.
+
+        A matrix is laid out in rows of columns pixels with pixel 0 in the
+        upper left corner. Progressive rows all run left to right; serpentine
+        rows alternate direction, as wired in most flexible panels. The strip
+        index of each matrix position is calculated once into a table.
+
+        :param integer units: The number of pixels.
+        :param integer center: The upper left corner x,y pixel tuple.
+        :param integer size: The widget scale. Defaults to 1.
+        :param integer columns: The number of pixels per matrix row. Defaults
+        to None (a single row of units pixels).
+        :param bool serpentine: Alternate the direction of matrix rows.
+        Defaults to False (progressive).
+        :param bool auto_write: Display each write immediately. Defaults to
+        True.
+        :param string pixel_order: The byte order of pixel buffers, 'GRB' or
+        'RGB'. Defaults to 'GRB'.
+        :param integer display_size: The host display's integer width and
+        height tuple expressed in pixels."""
+        if pixel_order not in (RGB, GRB):
+            raise ValueError("Pixel order must be 'RGB' or 'GRB'.")
+        if columns is None:
+            columns = max(1, units)
+        if columns < 1 or units % columns:
+            raise ValueError("Units must be a multiple of columns.")
         self._size = size
         self._neopixel_group = displayio.Group(scale=self._size)
         neo_pkg = displayio.Group()
@@ -22,41 +80,69 @@ class NeoPixel(displayio.Group):
 
         self._neopixel_units = units
         self._origin = center
+        self._display_size = display_size
+        self._auto_write = auto_write
+        self._pixel_order = pixel_order
+        self._offsets = (
+            pixel_order.index("R"),
+            pixel_order.index("G"),
+            pixel_order.index("B"),
+        )
+        self._colors = array("L", [Colors.BLACK] * units)  # Written colors
+        self._shown = array("L", [Colors.BLACK] * units)  # Displayed colors
+        self._changed = None  # Written index range not yet displayed
 
-        gray_palette = displayio.Palette(1)
-        gray_palette[0] = Colors.GRAY
-        gray_dk_palette = displayio.Palette(1)
-        gray_dk_palette[0] = Colors.GRAY_DK
+        # Matrix position (row * columns + column) of each strip index and
+        # the strip index of each matrix position
+        self._columns = columns
+        self._rows = units // columns
+        self._serpentine = serpentine
+        self._positions = array("H", range(units))
+        if serpentine:
+            for row in range(1, self._rows, 2):
+                for column in range(columns):
+                    self._positions[(row * columns) + column] = (
+                        (row * columns) + columns - 1 - column
+                    )
+        self._index_table = array("H", range(units))
+        for i, position in enumerate(self._positions):
+            self._index_table[position] = i
 
-        for chip in range(0, self._neopixel_units):
-            upper_left_corner = (self._origin[0] + (15 * chip), self._origin[1])
-
-            pkg = vectorio.Rectangle(
-                pixel_shader=gray_dk_palette,
-                x=upper_left_corner[0],
-                y=upper_left_corner[1],
-                width=15,
-                height=15,
+        # All packages share one prerendered 15x15 package tile
+        pkg_palette = displayio.Palette(2)
+        pkg_palette[0] = Colors.GRAY_DK
+        pkg_palette[1] = Colors.GRAY
+        pkg_tile = displayio.Bitmap(15, 15, 2)
+        pkg_tile[0, 14] = 1  # Index mark
+        if self._neopixel_units:
+            neo_pkg.append(
+                displayio.TileGrid(
+                    pkg_tile,
+                    pixel_shader=pkg_palette,
+                    width=self._columns,
+                    height=self._rows,
+                    tile_width=15,
+                    tile_height=15,
+                    x=self._origin[0],
+                    y=self._origin[1],
+                )
             )
-            neo_pkg.append(pkg)
-
-            pkg_index = vectorio.Rectangle(
-                pixel_shader=gray_palette,
-                x=upper_left_corner[0],
-                y=14 + upper_left_corner[1],
-                width=1,
-                height=1,
-            )
-            neo_pkg.append(pkg_index)
-
-            self._reflect_base = Circle(
-                upper_left_corner[0] + 7,
-                upper_left_corner[1] + 7,
-                6,
-                fill=Colors.BLACK,
-                outline=None,
+
+        # Each pixel is a bitmap-free vectorio circle with a 1-color palette
+        self._pixel_palettes = []
+        for chip in range(0, self._neopixel_units):
+            pixel_palette = displayio.Palette(1)
+            pixel_palette[0] = Colors.BLACK
+            self._pixel_palettes.append(pixel_palette)
+            row, column = divmod(self._positions[chip], self._columns)
+            self._reflector.append(
+                vectorio.Circle(
+                    pixel_shader=pixel_palette,
+                    radius=6,
+                    x=self._origin[0] + (15 * column) + 7,
+                    y=self._origin[1] + (15 * row) + 7,
+                )
             )
-            self._reflector.append(self._reflect_base)
 
         super().__init__()
         self.append(neo_pkg)
@@ -65,7 +151,7 @@ class NeoPixel(displayio.Group):
 
     @property
     def center(self):
-        """Bargraph object center."""
+        """NeoPixel object upper left corner."""
         return self._origin
 
     @property
@@ -73,11 +159,51 @@ class NeoPixel(displayio.Group):
         """Number of units."""
         return self._neopixel_units
 
+    @property
+    def n(self):
+        """Number of pixels."""
+        return self._neopixel_units
+
+    @property
+    def columns(self):
+        """Number of pixels per matrix row."""
+        return self._columns
+
+    @property
+    def rows(self):
+        """Number of matrix rows."""
+        return self._rows
+
+    @property
+    def serpentine(self):
+        """True if matrix rows alternate direction."""
+        return self._serpentine
+
+    def index(self, column, row):
+        """Return the strip index of the pixel at a matrix column and row."""
+        if not (0 <= column < self._columns and 0 <= row < self._rows):
+            raise ValueError("Matrix position is outside of the matrix.")
+        return self._index_table[(row * self._columns) + column]
+
     @property
     def size(self):
-        """Bargraph object size."""
+        """NeoPixel object size."""
         return self._size
 
+    @property
+    def auto_write(self):
+        """True if written colors are displayed immediately."""
+        return self._auto_write
+
+    @auto_write.setter
+    def auto_write(self, auto_write=True):
+        self._auto_write = auto_write
+
+    @property
+    def pixel_order(self):
+        """The byte order of pixel buffers."""
+        return self._pixel_order
+
     @property
     def display_size(self):
         """Display size in pixels."""
@@ -103,44 +229,148 @@ class NeoPixel(displayio.Group):
     #    SHOULD THIS BE A FUNCTION?
     #    return
 
+    def __len__(self):
+        return self._neopixel_units
+
+    def __getitem__(self, index):
+        """Return the (r, g, b) color of a pixel or a list for a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._neopixel_units))]
+        color = self._colors[index]
+        return ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+
+    def __setitem__(self, index, color):
+        """Write the color of a pixel, or the colors of a slice from a sequence
+        of colors or a pixel buffer in pixel_order."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._neopixel_units))
+            if isinstance(color, (bytes, bytearray, memoryview)):
+                self._write_buffer(indices, color)
+            else:
+                if len(color) != len(indices):
+                    raise ValueError("Color sequence length must match the slice.")
+                for i, pixel_color in zip(indices, color):
+                    self._colors[i] = _color_value(pixel_color)
+            if indices:
+                self._mark_changed(min(indices[0], indices[-1]))
+                self._mark_changed(max(indices[0], indices[-1]))
+        else:
+            if index < 0:
+                index += self._neopixel_units
+            self._colors[index] = _color_value(color)
+            self._mark_changed(index)
+        if self._auto_write:
+            self.show()
+
+    def _write_buffer(self, indices, buffer):
+        """Copy a pixel_order byte buffer to the pixels of indices."""
+        if len(buffer) != 3 * len(indices):
+            raise ValueError("Pixel buffer length must be 3 bytes per pixel.")
+        red, green, blue = self._offsets
+        offset = 0
+        for i in indices:
+            self._colors[i] = (
+                (buffer[offset + red] << 16)
+                + (buffer[offset + green] << 8)
+                + buffer[offset + blue]
+            )
+            offset += 3
+
+    def _mark_changed(self, index):
+        """Add index to the range of written pixels not yet displayed."""
+        if self._changed is None:
+            self._changed = (index, index)
+        else:
+            self._changed = (min(self._changed[0], index), max(self._changed[1], index))
+
     def show(self, n=None, color=Colors.BLACK):
-        """Set the color of the nth neopixel."""
-        if n != None:
-            self._reflector[n].fill = color
-        return
+        """Display the written pixel colors, redrawing only pixels with a
+        changed color. If n is specified, the nth pixel is first set to color
+        and displayed regardless of auto_write."""
+        if n is not None:
+            if n < 0:
+                n += self._neopixel_units
+            self._colors[n] = _color_value(color)
+            self._mark_changed(n)
+        if self._changed is None:
+            return
+        first, last = self._changed
+        self._changed = None
+        low = None
+        for i in range(first, last + 1):
+            if self._colors[i] != self._shown[i]:
+                self._shown[i] = self._colors[i]
+                self._pixel_palettes[i][0] = self._colors[i]
+                position = self._positions[i]
+                if low is None:
+                    low = high = position
+                elif position < low:
+                    low = position
+                elif position > high:
+                    high = position
+        if low is None:
+            return
+        # Changed pixels lie within the rows of the first and last positions
+        low_row, low_column = divmod(low, self._columns)
+        high_row, high_column = divmod(high, self._columns)
+        if low_row != high_row:
+            low_column = 0
+            high_column = self._columns - 1
+        self._mark_dirty(
+            dirty_rect.rect_bounds(
+                self._origin[0] + (15 * low_column),
+                self._origin[1] + (15 * low_row),
+                15 * (high_column - low_column + 1),
+                15 * (high_row - low_row + 1),
+            )
+        )
+
+    def blit(self, buffer):
+        """Write and display a whole frame of pixels in strip order from a
+        pixel buffer in pixel_order or a sequence of colors, regardless of
+        auto_write."""
+        auto_write = self._auto_write
+        self._auto_write = False
+        try:
+            self[:] = buffer
+        finally:
+            self._auto_write = auto_write
+        self.show()
 
     def fill(self, color=Colors.BLACK):
         """Fill all neopixels with color."""
+        color = _color_value(color)
         for i in range(0, self._neopixel_units):
-            self.show(i, color)
-        return
+            self._colors[i] = color
+        if self._neopixel_units:
+            self._mark_changed(0)
+            self._mark_changed(self._neopixel_units - 1)
+        if self._auto_write:
+            self.show()
 
     def display_to_pixel(self, width_factor=0, height_factor=0, size=1.0):
         """Convert normalized display position input (0.0 to 1.0) to display
         pixel position."""
-        return int(round(size * self.WIDTH * width_factor, 0)), int(
-            round(size * self.HEIGHT * height_factor, 0)
+        return coordinates.for_display(self._display_size).display_to_pixel(
+            width_factor, height_factor, size
         )
 
     def dial_to_pixel(self, dial_factor, center=(0, 0), radius=0):
         """Convert normalized dial_factor input (-1.0 to 1.0) to display pixel
         position on the circumference of the dial's circle with center
-        (x,y pixels) and radius (pixels)."""
-        rads = (-2 * pi) * (dial_factor)  # convert scale_factor to radians
-        rads = rads + (pi / 2)  # rotate axis counterclockwise
-        x = center[0] + int(cos(rads) * radius)
-        y = center[1] - int(sin(rads) * radius)
-        return x, y
+        (x,y pixels) and radius (pixels). Uses the shared trig_table angle
+        lookup."""
+        return trig_table.dial_to_pixel(dial_factor, center, radius)
 
     def cart_to_pixel(self, x, y, size=1.0):
         """Convert normalized cartesian position value (-0.5, to + 0.5) to display
         pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        x1 = int(round(min_axis * size * x, 0)) + self._center[0]
-        y1 = self._center[1] - int(round(min_axis * size * y, 0))
-        return x1, y1
+        return coordinates.for_display(self._display_size).cart_to_pixel(
+            x, y, self._origin, size
+        )
 
     def cart_dist_to_pixel(self, distance=0, size=1.0):
         """Convert normalized cartesian distance value to display pixels."""
-        min_axis = min(self.WIDTH, self.HEIGHT)
-        return int(round(min_axis * size * distance, 0))
+        return coordinates.for_display(self._display_size).cart_dist_to_pixel(
+            distance, size
+        )
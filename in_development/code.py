@@ -55,10 +55,10 @@ if not lone_eye:
     scale.alarm2 = 0.66
     test_display_group.append(scale)
 
-    bargraph_1 = Bargraph(units=2, center=(10, 10), mode="VU")
+    bargraph_1 = Bargraph(units=2, center=(10, 10), range="VU")
     test_display_group.append(bargraph_1)
 
-    bargraph_2 = Bargraph(units=2, center=(10, 75), mode="VU")
+    bargraph_2 = Bargraph(units=2, center=(10, 75), range="VU")
     test_display_group.append(bargraph_2)
 
     bubble_display_1 = BubbleDisplay(units=1, digits=4, size = 1, center=(0.25, 0.25))
@@ -80,9 +80,7 @@ if not lone_eye:
     neopixel_4 = NeoPixel(units=neo_units, center=(10, 205))
     test_display_group.append(neopixel_4)
 
-    neo = neopixel_1.neo_group
-
-    neo[0].fill = 0xf040f0
+    neopixel_1[0] = 0xf040f0
 
 display.show(test_display_group)
 tone(board.A0, 880, 0.1)
@@ -46,10 +46,10 @@ test_display_group.append(magic_eye_1.display_group)
 scale = Scale(max_scale=100, center=(0.85, 0.30), size=0.3)
 test_display_group.append(scale.display_group)
 
-bargraph_1 = Bargraph(units=2, center=(10, 10), mode="VU")
+bargraph_1 = Bargraph(units=2, center=(10, 10), range="VU")
 test_display_group.append(bargraph_1.display_group)
 
-bargraph_2 = Bargraph(units=2, center=(10, 75), mode="VU")
+bargraph_2 = Bargraph(units=2, center=(10, 75), range="VU")
 test_display_group.append(bargraph_2.display_group)
 
 bubble_display_1 = BubbleDisplay(units=1, center=(5, 40))
@@ -71,9 +71,7 @@ test_display_group.append(neopixel_3.display_group)
 neopixel_4 = NeoPixel(units=neo_units, center=(10, 205))
 test_display_group.append(neopixel_4.display_group)
 
-neo = neopixel_1.neo_group
-
-neo[0].fill = 0xf040f0
+neopixel_1[0] = 0xf040f0
 
 display.show(test_display_group)
 tone(board.A0, 880, 0.1)